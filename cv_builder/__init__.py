@@ -1,6 +1,29 @@
 """
 Modular CV Builder - A lightweight tool for managing CV content as reusable components.
+
+Public classes are imported lazily on first attribute access, so importing the
+package (or `cv_builder.cli`) does not pull in PyYAML, NumPy or the composer.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
+_LAZY_ATTRIBUTES = {
+    'Loader': 'cv_builder.loader',
+    'Validator': 'cv_builder.validator',
+    'Composer': 'cv_builder.composer',
+    'CVItem': 'cv_builder.models',
+    'Profile': 'cv_builder.models',
+    'ItemIndex': 'cv_builder.index',
+}
+
+__all__ = ['__version__', *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,270 @@
+"""
+Translation alignment audit of bilingual (en/kr) item fields.
+
+`Validator.validate_bilingual_field` only checks that both translations
+exist. The audit compares their content: every en/kr pair (names, labels and
+each highlight) is scanned once for numbers, dates, URLs and Latin tokens
+(tickers, acronyms, product names), and the scores of all pairs are computed
+as NumPy arrays:
+
+    numbers/dates/urls  must match between en and kr
+    latin               Latin tokens of kr should appear in en
+    length              log kr/en length ratio far from the median of all (mostly Hangul) pairs
+    order               highlight i of en shares more tokens with kr highlight j than with kr highlight i
+
+Extracted tokens are cached per item content hash in `.cv_cache/alignment.json`,
+so only edited items are scanned again.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+import numpy as np
+
+from cv_builder.models import CVItem
+from cv_builder.utils import get_cache_dir
+
+CACHE_VERSION = 1
+CACHE_FILE = "alignment.json"
+
+# One pass over a text; alternatives are tried in this order at each position
+_TOKEN = re.compile(
+    r"(?P<url>https?://[^\s)]+|www\.[^\s)]+|[\w-]+(?:\.[\w-]+)*\.(?:com|org|net|io|ai|dev|co\.kr|kr)\b(?:/[^\s)]*)?)"
+    r"|(?P<date>(?<!\d)(?:19|20)\d{2}\s*(?:[-./]|년)\s*(?:1[0-2]|0?[1-9])(?!\d)(?:\s*월)?"
+    r"|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(?:19|20)\d{2}\b)"
+    r"|(?P<number>(?<![\w.])\d[\d,]*(?:\.\d+)?(?:[kmb](?![a-z0-9])|\s*(?:천|만|억))?)"
+    r"|(?P<latin>[A-Za-z][A-Za-z0-9+#&'-]*)",
+    re.IGNORECASE,
+)
+_DATE_PARTS = re.compile(r"(\d{4})\D+(\d{1,2})")
+MONTHS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+# "10k" and "1만" are the same number
+NUMBER_UNITS = {'k': 10**3, 'm': 10**6, 'b': 10**9, '천': 10**3, '만': 10**4, '억': 10**8}
+KINDS = ('numbers', 'dates', 'urls', 'latin')
+
+
+def extract_tokens(text: str) -> Dict[str, List[str]]:
+    """Normalized numbers, dates (YYYY-MM), URLs and lower-cased Latin tokens of a text."""
+    tokens: Dict[str, set] = {kind: set() for kind in KINDS}
+    for match in _TOKEN.finditer(text or ''):
+        kind = match.lastgroup
+        value = match.group()
+        if kind == 'url':
+            tokens['urls'].add(re.sub(r"^https?://(www\.)?|[/.,;:]+$", "", value.lower()))
+        elif kind == 'date':
+            if value[0].isdigit():
+                year, month = _DATE_PARTS.match(value).groups()
+            else:
+                year, month = value[-4:], MONTHS.index(value[:3].lower()) + 1
+            tokens['dates'].add(f"{year}-{int(month):02d}")
+        elif kind == 'number':
+            unit = value[-1].lower()
+            number = value.rstrip(' ' + ''.join(NUMBER_UNITS) + 'KMB').rstrip(',').replace(',', '')
+            if unit in NUMBER_UNITS:
+                scaled = float(number) * NUMBER_UNITS[unit]
+                number = str(int(scaled)) if scaled.is_integer() else str(scaled)
+            tokens['numbers'].add(number)
+        else:
+            value = value.strip("'-").lower()
+            if len(value) >= 2:
+                tokens['latin'].add(value)
+    return {kind: sorted(values) for kind, values in tokens.items()}
+
+
+def bilingual_pairs(data: Any, path: str = '') -> List[Tuple[str, str, str]]:
+    """(field path, en, kr) of every field that has both translations."""
+    pairs = []
+    if isinstance(data, dict):
+        if isinstance(data.get('en'), str) and isinstance(data.get('kr'), str):
+            pairs.append((path, data['en'], data['kr']))
+        else:
+            for key, value in data.items():
+                pairs.extend(bilingual_pairs(value, f"{path}.{key}" if path else key))
+    elif isinstance(data, list):
+        for i, value in enumerate(data):
+            pairs.extend(bilingual_pairs(value, f"{path}[{i}]"))
+    return pairs
+
+
+def missing_latin(pair: Dict[str, Any]) -> Set[str]:
+    """Latin tokens of kr that are not in en (English plurals count as found: KPI / KPIs)."""
+    en = set(pair['en']['latin'])
+    return {token for token in pair['kr']['latin'] if token not in en and f"{token}s" not in en}
+
+
+def content_hash(item: CVItem) -> str:
+    return hashlib.sha1(json.dumps(item.data, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+
+def scan_item(item: CVItem) -> List[Dict[str, Any]]:
+    """Per-pair lengths and tokens of one item."""
+    return [
+        {
+            'path': path,
+            'en_len': len(en.strip()),
+            'kr_len': len(kr.strip()),
+            'same': en.strip() == kr.strip(),  # Untranslated names
+            'kr_hangul': sum(1 for ch in kr if '\uac00' <= ch <= '\ud7a3'),
+            'en': extract_tokens(en),
+            'kr': extract_tokens(kr),
+        }
+        for path, en, kr in bilingual_pairs(item.data)
+    ]
+
+
+@dataclass
+class AlignmentIssue:
+    """A suspected translation mismatch in one en/kr pair."""
+    item_id: str
+    path: str
+    kind: str  # numbers, dates, urls, latin, length, order
+    message: str
+
+
+class AlignmentAuditor:
+    """Audits all bilingual pairs of a set of items at once."""
+    
+    def __init__(self, base_dir: Path, length_z: float = 3.5, min_length: int = 40):
+        self.cache_path = get_cache_dir(base_dir) / CACHE_FILE
+        self.length_z = length_z        # Robust z-score beyond which a length ratio is flagged
+        self.min_length = min_length    # Shorter pairs (names, labels) are not length-checked
+        self.stats = {'scanned': 0, 'cached': 0}
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if cache.get('version') == CACHE_VERSION:
+                    return cache['items']
+            except (OSError, ValueError, KeyError):
+                pass
+        return {}
+    
+    def scan(self, items: Dict[str, CVItem]) -> Dict[str, List[Dict[str, Any]]]:
+        """Tokens of every pair, re-scanning only items whose content hash changed."""
+        self.stats = {'scanned': 0, 'cached': 0}
+        cache = self._load_cache()
+        scanned = {}
+        for item_id, item in items.items():
+            digest = content_hash(item)
+            entry = cache.get(item_id)
+            if entry and entry['hash'] == digest:
+                self.stats['cached'] += 1
+            else:
+                entry = {'hash': digest, 'pairs': scan_item(item)}
+                self.stats['scanned'] += 1
+            scanned[item_id] = entry
+        
+        if self.stats['scanned'] or set(scanned) != set(cache):
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'items': scanned}, f, ensure_ascii=False)
+            tmp_path.replace(self.cache_path)
+        return {item_id: entry['pairs'] for item_id, entry in scanned.items()}
+    
+    def scores(self, pairs: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, np.ndarray]:
+        """
+        Score arrays over all pairs: length ratio (and its robust z-score) and
+        the overlap of numbers/dates/URLs (Jaccard) and kr Latin tokens found in en.
+        """
+        en_len = np.array([pair['en_len'] for _, pair in pairs], dtype=float)
+        kr_len = np.array([pair['kr_len'] for _, pair in pairs], dtype=float)
+        log_ratio = np.log(np.maximum(kr_len, 1) / np.maximum(en_len, 1))
+        
+        same = np.array([pair['same'] for _, pair in pairs], dtype=bool)
+        hangul = np.array([pair['kr_hangul'] for _, pair in pairs], dtype=float)
+        # Lists of tool/language names stay mostly Latin in kr, so their ratio says nothing
+        checked = (en_len >= self.min_length) & (hangul >= 0.3 * kr_len) & ~same
+        median = np.median(log_ratio[checked]) if checked.any() else 0.0
+        mad = np.median(np.abs(log_ratio[checked] - median)) * 1.4826 if checked.any() else 0.0
+        z = np.where(checked, (log_ratio - median) / max(mad, 1e-6), 0.0)
+        
+        result = {'length_ratio': np.exp(log_ratio), 'length_z': z}
+        for kind in ('numbers', 'dates', 'urls'):
+            shared = np.array([len(set(p['en'][kind]) & set(p['kr'][kind])) for _, p in pairs], dtype=float)
+            union = np.array([len(set(p['en'][kind]) | set(p['kr'][kind])) for _, p in pairs], dtype=float)
+            result[kind] = np.where(union > 0, shared / np.maximum(union, 1), 1.0)
+        kr_latin = np.array([len(p['kr']['latin']) for _, p in pairs], dtype=float)
+        found = np.array([len(set(p['kr']['latin']) - missing_latin(p)) for _, p in pairs], dtype=float)
+        result['latin'] = np.where(kr_latin > 0, found / np.maximum(kr_latin, 1), 1.0)
+        return result
+    
+    @staticmethod
+    def order_issues(item_id: str, pairs: List[Dict[str, Any]], min_shared: int = 2) -> List[AlignmentIssue]:
+        """
+        Highlights whose distinctive tokens (numbers, dates, URLs, Latin) match
+        another kr highlight better than their own (by at least min_shared tokens).
+        """
+        highlights = [pair for pair in pairs if re.search(r"highlights\[\d+\]$", pair['path'])]
+        if len(highlights) < 2:
+            return []
+        
+        vocabulary: Dict[str, int] = {}
+        def incidence(side: str) -> np.ndarray:
+            rows = []
+            for pair in highlights:
+                tokens = {f"{kind}:{token}" for kind in KINDS for token in pair[side][kind]}
+                rows.append([vocabulary.setdefault(token, len(vocabulary)) for token in tokens])
+            matrix = np.zeros((len(highlights), len(vocabulary) + 1), dtype=np.int32)
+            for i, columns in enumerate(rows):
+                matrix[i, columns] = 1
+            return matrix
+        
+        en = incidence('en')
+        kr = incidence('kr')
+        size = max(en.shape[1], kr.shape[1])
+        en = np.pad(en, ((0, 0), (0, size - en.shape[1])))
+        kr = np.pad(kr, ((0, 0), (0, size - kr.shape[1])))
+        overlap = en @ kr.T
+        
+        issues = []
+        best = overlap.argmax(axis=1)
+        for i, j in enumerate(best):
+            if j != i and overlap[i, j] > overlap[i, i] and overlap[i, j] >= min_shared:
+                issues.append(AlignmentIssue(
+                    item_id, highlights[i]['path'], 'order',
+                    f"en matches kr {highlights[j]['path']} better ({overlap[i, j]} vs {overlap[i, i]} shared tokens)",
+                ))
+        return issues
+    
+    def audit(self, items: Dict[str, CVItem]) -> List[AlignmentIssue]:
+        """All suspected mismatches across the items (bilingual fields only)."""
+        scanned = self.scan(items)
+        pairs = [(item_id, pair) for item_id, item_pairs in scanned.items() for pair in item_pairs]
+        if not pairs:
+            return []
+        scores = self.scores(pairs)
+        
+        issues = []
+        for kind in ('numbers', 'dates', 'urls'):
+            for index in np.flatnonzero(scores[kind] < 1.0):
+                item_id, pair = pairs[index]
+                missing_kr = sorted(set(pair['en'][kind]) - set(pair['kr'][kind]))
+                missing_en = sorted(set(pair['kr'][kind]) - set(pair['en'][kind]))
+                parts = ([f"kr lacks {', '.join(missing_kr)}"] if missing_kr else []) \
+                    + ([f"en lacks {', '.join(missing_en)}"] if missing_en else [])
+                issues.append(AlignmentIssue(item_id, pair['path'], kind, "; ".join(parts)))
+        
+        for index in np.flatnonzero(scores['latin'] < 1.0):
+            item_id, pair = pairs[index]
+            missing = sorted(missing_latin(pair))
+            issues.append(AlignmentIssue(item_id, pair['path'], 'latin', f"kr tokens not in en: {', '.join(missing)}"))
+        
+        for index in np.flatnonzero(np.abs(scores['length_z']) > self.length_z):
+            item_id, pair = pairs[index]
+            issues.append(AlignmentIssue(
+                item_id, pair['path'], 'length',
+                f"kr/en length ratio {scores['length_ratio'][index]:.2f} "
+                f"({pair['kr_len']}/{pair['en_len']} chars, z={scores['length_z'][index]:+.1f})",
+            ))
+        
+        for item_id, item_pairs in scanned.items():
+            issues.extend(self.order_issues(item_id, item_pairs))
+        
+        order = {item_id: i for i, item_id in enumerate(items)}
+        return sorted(issues, key=lambda issue: (order.get(issue.item_id, 0), issue.path))
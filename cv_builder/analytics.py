@@ -0,0 +1,273 @@
+"""
+Application outcome analytics.
+
+Application JSONs (`data/previous_applications/*.json` by default) and the
+build snapshots that recorded which items were sent are flattened into a
+columnar table of NumPy arrays:
+    
+    applications    one row per application (company, date, outcomes, answers)
+    exposures       (application row, key) pairs for items, item tags and answer blocks
+
+Pass rates per company, year, item, tag, answer block or answer length are
+computed with `np.bincount` group-bys over these arrays. Parsed files are
+cached under `.cv_cache/analytics/` by size and mtime, so only new or edited
+applications and snapshot manifests are read again.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cv_builder.snapshots import SnapshotStore
+from cv_builder.utils import get_cache_dir
+
+CACHE_VERSION = 1
+CACHE_FILE = "outcomes.json"
+
+PASSED, FAILED, UNKNOWN = 1, 0, -1
+PASS_RESULTS = {'pass', 'passed', 'accepted', 'offer', '합격', '통과'}
+FAIL_RESULTS = {'fail', 'failed', 'rejected', 'reject', '불합격', '탈락'}
+
+STAGES = ('document', 'interview')
+GROUPINGS = ('company', 'year', 'item', 'tag', 'block', 'length')
+# Buckets of the mean answer length (chars) for the 'length' grouping
+LENGTH_BUCKETS = (500, 1000)
+
+
+def normalize_result(value: Any) -> int:
+    """Map a free-form result ("Passed", "Rejected", "TBA", "", ...) to PASSED/FAILED/UNKNOWN."""
+    text = str(value or '').strip().lower()
+    if text in PASS_RESULTS:
+        return PASSED
+    if text in FAIL_RESULTS:
+        return FAILED
+    return UNKNOWN
+
+
+def interview_outcome(document: int, interviews: List[Dict[str, Any]]) -> int:
+    """
+    Outcome of the interview stage: failed if any round failed, passed if the
+    last decided round passed, unknown otherwise (or if the documents did not pass).
+    """
+    if document != PASSED:
+        return UNKNOWN
+    results = [normalize_result(interview.get('result')) for interview in interviews]
+    decided = [result for result in results if result != UNKNOWN]
+    if FAILED in decided:
+        return FAILED
+    return decided[-1] if decided else UNKNOWN
+
+
+def parse_application(path: Path) -> Dict[str, Any]:
+    """The fields of one application JSON that the analytics use."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    initial = data.get('initial_application') or {}
+    questions = initial.get('questions_and_answers') or []
+    document = normalize_result(initial.get('result'))
+    answers = [question.get('answer') or '' for question in questions]
+    return {
+        'id': path.stem,
+        'company': data.get('company', ''),
+        'date': data.get('date', ''),
+        'document': document,
+        'interview': interview_outcome(document, data.get('interviews') or []),
+        # Recorded by scripts/assemble_answers.py --output
+        'blocks': sorted({block for question in questions for block in question.get('answer_blocks') or []}),
+        'answer_chars': int(np.mean([len(answer) for answer in answers])) if any(answers) else 0,
+    }
+
+
+@dataclass
+class OutcomeTable:
+    """Columnar application outcomes plus exposure pairs for items, tags and answer blocks."""
+    ids: np.ndarray             # str, one per application
+    companies: np.ndarray       # str
+    years: np.ndarray           # int (0 if the date is missing)
+    document: np.ndarray        # int8: PASSED / FAILED / UNKNOWN
+    interview: np.ndarray       # int8
+    answer_chars: np.ndarray    # int, mean answer length
+    has_snapshot: np.ndarray    # bool
+    # key -> (application rows, labels of the rows)
+    exposures: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def outcome(self, stage: str) -> np.ndarray:
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage '{stage}' (expected one of: {', '.join(STAGES)})")
+        return getattr(self, stage)
+    
+    def groups(self, by: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(application rows, labels) pairs of a grouping."""
+        if by == 'company':
+            return np.arange(len(self)), self.companies
+        if by == 'year':
+            return np.arange(len(self)), self.years.astype(str)
+        if by == 'length':
+            edges = np.array(LENGTH_BUCKETS)
+            names = np.array([f"<{edges[0]}"] + [f"{lo}-{hi - 1}" for lo, hi in zip(edges[:-1], edges[1:])]
+                             + [f"{edges[-1]}+"])
+            return np.arange(len(self)), names[np.digitize(self.answer_chars, edges)]
+        if by in self.exposures:
+            return self.exposures[by]
+        raise ValueError(f"Unknown grouping '{by}' (expected one of: {', '.join(GROUPINGS)})")
+    
+    def pass_rates(self, by: str, stage: str = 'document') -> List[Dict[str, Any]]:
+        """
+        Pass rate per group, computed with bincount over all rows at once.
+        
+        `applications` counts every application in the group, `decided` those
+        with a known outcome at this stage; `rate` is passed / decided.
+        """
+        rows, labels = self.groups(by)
+        if len(rows) == 0:
+            return []
+        names, codes = np.unique(labels, return_inverse=True)
+        outcome = self.outcome(stage)[rows]
+        decided = outcome != UNKNOWN
+        
+        applications = np.bincount(codes, minlength=len(names))
+        decided_count = np.bincount(codes, weights=decided, minlength=len(names)).astype(int)
+        passed = np.bincount(codes, weights=outcome == PASSED, minlength=len(names)).astype(int)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rates = np.where(decided_count > 0, passed / np.maximum(decided_count, 1), np.nan)
+        
+        order = np.lexsort((names, -applications))
+        return [
+            {
+                'key': str(names[i]),
+                'applications': int(applications[i]),
+                'decided': int(decided_count[i]),
+                'passed': int(passed[i]),
+                'rate': None if np.isnan(rates[i]) else float(rates[i]),
+            }
+            for i in order
+        ]
+
+
+class OutcomeAnalytics:
+    """Loads application outcomes and snapshots incrementally into an OutcomeTable."""
+    
+    def __init__(self, base_dir: Path, kinds: Sequence[str] = ('previous_applications',),
+                 snapshots: Optional[SnapshotStore] = None):
+        self.base_dir = Path(base_dir)
+        self.kinds = tuple(kinds)
+        self.snapshots = snapshots or SnapshotStore(self.base_dir)
+        self.cache_path = get_cache_dir(self.base_dir, "analytics") / CACHE_FILE
+        self.stats = {'parsed': 0, 'cached': 0}
+    
+    def _load_cache(self) -> Dict[str, Any]:
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                if cache.get('version') == CACHE_VERSION:
+                    return cache
+            except (OSError, ValueError):
+                pass
+        return {'version': CACHE_VERSION, 'files': {}, 'tags': {}}
+    
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        tmp_path.replace(self.cache_path)
+    
+    def _sources(self) -> List[Tuple[str, Path]]:
+        sources = []
+        for kind in self.kinds:
+            directory = self.base_dir / "data" / kind
+            if directory.exists():
+                sources += [
+                    ('application', path) for path in sorted(directory.glob("*.json"))
+                    if path.name != "template.json"
+                ]
+        if self.snapshots.manifests_dir.exists():
+            sources += [('snapshot', path) for path in sorted(self.snapshots.manifests_dir.glob("*.json"))]
+        return sources
+    
+    def _parse_snapshot(self, path: Path, tags: Dict[str, List[str]]) -> Dict[str, Any]:
+        import yaml
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        # Blobs are immutable, so tags are parsed once per item version
+        for item_hash in manifest['items'].values():
+            if item_hash not in tags:
+                tags[item_hash] = (yaml.safe_load(self.snapshots.get_blob(item_hash)) or {}).get('tags') or []
+        return {
+            'application': manifest.get('application'),
+            'created': manifest['created'],
+            'items': {item_id: tags[item_hash] for item_id, item_hash in manifest['items'].items()},
+        }
+    
+    def load(self) -> OutcomeTable:
+        """Build the table, re-reading only files whose size or mtime changed."""
+        self.stats = {'parsed': 0, 'cached': 0}
+        cache = self._load_cache()
+        files: Dict[str, Any] = {}
+        
+        for kind, path in self._sources():
+            key = path.relative_to(self.base_dir).as_posix()
+            stat = path.stat()
+            previous = cache['files'].get(key)
+            if previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+                files[key] = previous
+                self.stats['cached'] += 1
+                continue
+            record = parse_application(path) if kind == 'application' else self._parse_snapshot(path, cache['tags'])
+            files[key] = {'kind': kind, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'record': record}
+            self.stats['parsed'] += 1
+        
+        if self.stats['parsed'] or len(files) != len(cache['files']):
+            cache['files'] = files
+            self._save_cache(cache)
+        
+        applications = [entry['record'] for entry in files.values() if entry['kind'] == 'application']
+        latest: Dict[str, Dict[str, Any]] = {}
+        for entry in files.values():
+            record = entry['record']
+            if entry['kind'] == 'snapshot' and record['application']:
+                current = latest.get(record['application'])
+                if current is None or record['created'] > current['created']:
+                    latest[record['application']] = record
+        return self.build_table(applications, latest)
+    
+    @staticmethod
+    def build_table(applications: List[Dict[str, Any]], latest: Dict[str, Dict[str, Any]]) -> OutcomeTable:
+        """Columnar table from application records and the latest snapshot per application."""
+        exposures: Dict[str, Tuple[List[int], List[str]]] = {'item': ([], []), 'tag': ([], []), 'block': ([], [])}
+        for row, record in enumerate(applications):
+            snapshot = latest.get(record['id'])
+            if snapshot:
+                for item_id in snapshot['items']:
+                    exposures['item'][0].append(row)
+                    exposures['item'][1].append(item_id)
+                # A tag counts once per application, however many sent items carry it
+                for tag in sorted({tag for item_tags in snapshot['items'].values() for tag in item_tags}):
+                    exposures['tag'][0].append(row)
+                    exposures['tag'][1].append(tag)
+            for block in record['blocks']:
+                exposures['block'][0].append(row)
+                exposures['block'][1].append(block)
+        
+        return OutcomeTable(
+            ids=np.array([record['id'] for record in applications], dtype=str),
+            companies=np.array([record['company'] for record in applications], dtype=str),
+            years=np.array([int(record['date'][:4]) if record['date'][:4].isdigit() else 0
+                            for record in applications], dtype=int),
+            document=np.array([record['document'] for record in applications], dtype=np.int8),
+            interview=np.array([record['interview'] for record in applications], dtype=np.int8),
+            answer_chars=np.array([record['answer_chars'] for record in applications], dtype=int),
+            has_snapshot=np.array([record['id'] in latest for record in applications], dtype=bool),
+            exposures={
+                key: (np.array(rows, dtype=np.intp), np.array(labels, dtype=str))
+                for key, (rows, labels) in exposures.items()
+            },
+        )
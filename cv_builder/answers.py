@@ -0,0 +1,241 @@
+"""
+Self-introduction answer assembly from reusable paragraph blocks.
+
+Answer blocks are regular items (`cv_items/answer_blocks/*.yaml`, type
+`answer_block`) with a `.metadata` sidecar. For each question the best set of
+blocks is chosen under the question's length limit with a knapsack solver over
+precomputed block lengths; all questions of an application are filled in one
+pass without reusing a block twice.
+"""
+
+import ast
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from cv_builder.coverage import extract_terms
+from cv_builder.models import Application, CVItem
+from cv_builder.utils import COUNT_MODES, count_text
+
+# Blocks are joined like the hand-written answers: "[title] \n body"
+BLOCK_SEPARATOR = "\n"
+
+_LIMIT_RANGE = re.compile(r"([\d,]+)\s*자\s*이상\s*([\d,]+)\s*자")
+_LIMIT_MAX = re.compile(r"(?:최대\s*([\d,]+)\s*자)|(?:([\d,]+)\s*자\s*(?:이내|이하|내외|\)))")
+_LIMIT_MIN = re.compile(r"(?:최소\s*([\d,]+)\s*자)|(?:([\d,]+)\s*자\s*이상)")
+
+
+def _to_int(value: str) -> int:
+    return int(str(value).replace(',', ''))
+
+
+def parse_char_limit(question: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parse (min, max) length limits of a question.
+    
+    Reads the `char_limit` field ("1500", "{'max': 500}", {'min': 300, 'max': 1000})
+    and falls back to limits written in the question text ("(최대 500자)",
+    "[300자 이상 1000자 이내]", "(800자)").
+    """
+    limit = question.get('char_limit')
+    if isinstance(limit, str):
+        try:
+            limit = ast.literal_eval(limit.strip())
+        except (ValueError, SyntaxError):
+            limit = None
+    if isinstance(limit, (int, float)):
+        return None, int(limit)
+    if isinstance(limit, dict) and (limit.get('min') or limit.get('max')):
+        min_chars, max_chars = limit.get('min'), limit.get('max')
+        return (_to_int(min_chars) if min_chars else None), (_to_int(max_chars) if max_chars else None)
+    
+    text = question.get('question', '')
+    match = _LIMIT_RANGE.search(text)
+    if match:
+        return _to_int(match.group(1)), _to_int(match.group(2))
+    
+    max_match = _LIMIT_MAX.search(text)
+    min_match = _LIMIT_MIN.search(text)
+    min_chars = _to_int(next(g for g in min_match.groups() if g)) if min_match else None
+    max_chars = _to_int(next(g for g in max_match.groups() if g)) if max_match else None
+    return min_chars, max_chars
+
+
+@dataclass
+class AnswerBlock:
+    """An answer block in one locale with its precomputed lengths."""
+    item: CVItem
+    text: str
+    terms: Set[str]
+    topic_terms: Set[str]
+    counts: Dict[str, int]  # Length per count mode
+
+
+@dataclass
+class AnswerDraft:
+    """Assembled answer for one question."""
+    question: str
+    min_chars: Optional[int]
+    max_chars: Optional[int]
+    count_mode: str
+    blocks: List[str] = field(default_factory=list)
+    text: str = ""
+    length: int = 0
+    
+    @property
+    def status(self) -> str:
+        if not self.blocks:
+            return "no matching blocks"
+        if self.max_chars is not None and self.length > self.max_chars:
+            return "over limit"
+        if self.min_chars is not None and self.length < self.min_chars:
+            return "under minimum"
+        return "ok"
+
+
+def block_text(item: CVItem, locale: str) -> str:
+    """Render a block as text: optional "[title] " line followed by the body."""
+    body = (item.data.get('text') or {}).get(locale) or ''
+    title = (item.data.get('title') or {}).get(locale)
+    return f"[{title}] {BLOCK_SEPARATOR}{body}" if title and body else body
+
+
+def block_counts(item: CVItem, locale: str) -> Dict[str, int]:
+    """
+    Lengths of a rendered block under every count mode.
+    
+    Added up from the title/text metrics in the item's metadata sidecar; the
+    rendered text is only measured when the sidecar has no metrics.
+    """
+    has_title = bool((item.data.get('title') or {}).get(locale))
+    counts = {}
+    for mode in COUNT_MODES:
+        body = item.metadata.field_lengths(locale, 'text', mode)
+        title = item.metadata.field_lengths(locale, 'title', mode) if has_title else 0
+        if body is None or title is None:
+            text = block_text(item, locale)
+            return {mode: count_text(text, mode) for mode in COUNT_MODES}
+        # "[title] " + separator around the title
+        decoration = count_text(f"[] {BLOCK_SEPARATOR}", mode) if has_title and body else 0
+        counts[mode] = body + title + decoration if body else 0
+    return counts
+
+
+def solve_knapsack(costs: np.ndarray, values: np.ndarray, capacity: int) -> List[int]:
+    """
+    0/1 knapsack: indices maximizing total value with total cost <= capacity.
+    
+    The DP table over capacities is updated one block at a time with NumPy.
+    """
+    if capacity <= 0 or len(costs) == 0:
+        return []
+    
+    best = np.zeros(capacity + 1)
+    take = np.zeros((len(costs), capacity + 1), dtype=bool)
+    for i, (cost, value) in enumerate(zip(costs, values)):
+        if cost > capacity or value <= 0:
+            continue
+        candidate = np.full(capacity + 1, -np.inf)
+        candidate[cost:] = best[:capacity + 1 - cost] + value
+        take[i] = candidate > best
+        best = np.where(take[i], candidate, best)
+    
+    chosen = []
+    remaining = capacity
+    for i in range(len(costs) - 1, -1, -1):
+        if take[i, remaining]:
+            chosen.append(i)
+            remaining -= costs[i]
+    return chosen[::-1]
+
+
+class AnswerAssembler:
+    """Fills application questions from answer blocks."""
+    
+    def __init__(self, blocks: Dict[str, CVItem], locale: str = 'kr', count_mode: str = 'chars'):
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Unknown count mode: {count_mode} (expected one of {', '.join(COUNT_MODES)})")
+        self.locale = locale
+        self.count_mode = count_mode
+        self.separator_cost = count_text(BLOCK_SEPARATOR, count_mode)
+        self.blocks = self.prepare_blocks(blocks, locale)
+    
+    @staticmethod
+    def prepare_blocks(blocks: Dict[str, CVItem], locale: str) -> List[AnswerBlock]:
+        """Render blocks once and look up their lengths under every count mode."""
+        prepared = []
+        for item in sorted(blocks.values(), key=lambda x: (x.priority, x.id)):
+            text = block_text(item, locale)
+            if not text:
+                continue
+            title = (item.data.get('title') or {}).get(locale) or ''
+            topics = ' '.join(item.data.get('topics', []) + item.tags + [title])
+            prepared.append(AnswerBlock(
+                item=item,
+                text=text,
+                terms=set(extract_terms(text)),
+                topic_terms=set(extract_terms(topics.replace('-', ' '))),
+                counts=block_counts(item, locale),
+            ))
+        return prepared
+    
+    @staticmethod
+    def relevance(block: AnswerBlock, question_terms: Set[str]) -> float:
+        """Relevance of a block to a question: topic matches weigh most, priority breaks ties."""
+        topic_hits = len(block.topic_terms & question_terms)
+        text_hits = len(block.terms & question_terms)
+        if topic_hits == 0 and text_hits == 0:
+            return 0.0
+        return 3.0 * topic_hits + text_hits + 1.0 / (1 + block.item.priority)
+    
+    def assemble(self, application: Application) -> List[AnswerDraft]:
+        """
+        Draft answers for every question of an application.
+        
+        Questions with the fewest candidate blocks are solved first; a block used
+        for one question is not reused for another. Within a question, the value
+        of a block is its relevance times its length, so the solver fills the
+        limit with the most relevant material.
+        """
+        questions = application.questions
+        drafts = []
+        candidates = []
+        for question in questions:
+            min_chars, max_chars = parse_char_limit(question)
+            drafts.append(AnswerDraft(
+                question=question.get('question', ''),
+                min_chars=min_chars,
+                max_chars=max_chars,
+                count_mode=self.count_mode,
+            ))
+            terms = set(extract_terms(question.get('question', '')))
+            candidates.append({i: self.relevance(block, terms) for i, block in enumerate(self.blocks)})
+        
+        used: Set[int] = set()
+        order = sorted(range(len(questions)), key=lambda q: sum(1 for r in candidates[q].values() if r > 0))
+        for q in order:
+            draft = drafts[q]
+            indices = [i for i, r in candidates[q].items() if r > 0 and i not in used]
+            if not indices:
+                continue
+            
+            costs = np.array([self.blocks[i].counts[self.count_mode] + self.separator_cost for i in indices])
+            values = np.array([candidates[q][i] for i in indices]) * costs
+            if draft.max_chars is None:
+                # Unlimited: take every relevant block
+                chosen = list(range(len(indices)))
+            else:
+                chosen = solve_knapsack(costs, values, draft.max_chars + self.separator_cost)
+            
+            selected = [self.blocks[indices[c]] for c in chosen]
+            used.update(indices[c] for c in chosen)
+            draft.blocks = [block.item.id for block in selected]
+            draft.text = BLOCK_SEPARATOR.join(block.text for block in selected)
+            draft.length = (
+                sum(block.counts[self.count_mode] for block in selected)
+                + self.separator_cost * max(len(selected) - 1, 0)
+            )
+        
+        return drafts
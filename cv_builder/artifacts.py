@@ -0,0 +1,301 @@
+"""
+Content-addressed store of rendered CV artifacts.
+
+A composed CV is hashed canonically and combined with a hash of everything
+else the render depends on (theme template folder, photo, RenderCV version).
+Rendered artifacts (YAML, Typst, PDF, PNG) are stored once per key under
+`.cv_cache/artifacts/` and hard-linked (or copied) into place when another
+profile or build composes the same CV, instead of re-rendering.
+
+The store keeps hit/miss/eviction statistics and is capped in size; least
+recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from cv_builder.assets import AssetCache
+from cv_builder.document import thaw, write_yaml
+from cv_builder.utils import get_cache_dir
+
+ARTIFACT_SUFFIXES = ('.yaml', '.typ', '.pdf', '.png')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+INDEX_FILE = "index.json"
+
+
+def canonical_hash(cv: Mapping[str, Any]) -> str:
+    """
+    SHA-256 of a composed CV (plain dict or overlay).
+    
+    Serialized as compact JSON; key order is kept because it is part of the
+    rendered result (section order).
+    """
+    payload = json.dumps(thaw(cv), ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def template_hash(base_dir: Path, cv: Mapping[str, Any]) -> str:
+    """
+    Hash of the render inputs outside the CV content: the theme's template
+    folder (if overridden in the project), the photo file and the RenderCV version.
+    """
+    digest = hashlib.sha256()
+    base_dir = Path(base_dir)
+    
+    theme = (cv.get('design') or {}).get('theme', '')
+    digest.update(f"theme:{theme}\0".encode('utf-8'))
+    theme_dir = base_dir / theme if theme else None
+    if theme_dir and theme_dir.is_dir():
+        for path in sorted(theme_dir.rglob("*")):
+            if path.is_file():
+                digest.update(str(path.relative_to(theme_dir)).encode('utf-8') + b"\0")
+                digest.update(path.read_bytes())
+    
+    photo = (cv.get('cv') or {}).get('photo')
+    if photo and (base_dir / photo).is_file():
+        digest.update(b"photo\0" + (base_dir / photo).read_bytes())
+    
+    try:
+        digest.update(f"rendercv:{metadata.version('rendercv')}".encode('utf-8'))
+    except metadata.PackageNotFoundError:
+        digest.update(b"rendercv:unknown")
+    return digest.hexdigest()
+
+
+def rendercv_renderer(yaml_path: Path, output_dir: Path, cwd: Path) -> None:
+    """Render with the RenderCV CLI (Typst, PDF and PNG; no Markdown/HTML)."""
+    command = ['rendercv'] if shutil.which('rendercv') else [sys.executable, '-m', 'rendercv']
+    command += ['render', str(yaml_path), '--output-folder-name', str(output_dir), '-nomd', '-nohtml']
+    result = subprocess.run(command, cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"rendercv failed for {yaml_path}:\n{result.stdout}{result.stderr}")
+
+
+def link_or_copy(source: Path, target: Path) -> str:
+    """Hard-link source to target (replacing it); fall back to a copy across devices."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() or target.is_symlink():
+        if target.samefile(source):
+            return 'linked'
+        target.unlink()
+    try:
+        os.link(source, target)
+        return 'linked'
+    except OSError:
+        shutil.copy2(source, target)
+        return 'copied'
+
+
+class ArtifactStore:
+    """Content-addressed artifact directories with LRU eviction."""
+    
+    def __init__(self, base_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.base_dir = Path(base_dir)
+        self.root = get_cache_dir(self.base_dir, "artifacts")
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._index = self._load_index()
+    
+    def _load_index(self) -> Dict[str, Any]:
+        index_path = self.root / INDEX_FILE
+        if index_path.exists():
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {'entries': {}, 'hits': 0, 'misses': 0, 'evictions': 0}
+    
+    def _save_index(self) -> None:
+        index_path = self.root / INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False)
+        tmp_path.replace(index_path)
+    
+    def entry_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+    
+    def key_lock(self, key: str) -> threading.Lock:
+        """Lock serializing renders of the same key across threads."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+    
+    def get(self, key: str) -> Optional[Dict[str, Path]]:
+        """
+        Artifact name -> path of a stored entry, or None.
+        
+        Entries whose files were modified or removed (e.g. through a hard link)
+        are dropped.
+        """
+        with self._lock:
+            entry = self._index['entries'].get(key)
+            if entry is not None:
+                files = {name: self.entry_dir(key) / name for name in entry['files']}
+                intact = all(
+                    path.exists() and [path.stat().st_size, path.stat().st_mtime_ns] == entry['files'][name]
+                    for name, path in files.items()
+                )
+                if intact:
+                    entry['last_used'] = time.time()
+                    entry['hits'] += 1
+                    self._index['hits'] += 1
+                    self._save_index()
+                    return files
+                self._remove(key)
+            
+            self._index['misses'] += 1
+            self._save_index()
+            return None
+    
+    def put(self, key: str, files: List[Path]) -> Dict[str, Path]:
+        """Store files under a key (copied in) and evict old entries beyond the size cap."""
+        with self._lock:
+            entry_dir = self.entry_dir(key)
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir)
+            entry_dir.mkdir(parents=True)
+            
+            stored = {}
+            for source in files:
+                target = entry_dir / source.name
+                shutil.copy2(source, target)
+                stat = target.stat()
+                stored[source.name] = [stat.st_size, stat.st_mtime_ns]
+            
+            now = time.time()
+            self._index['entries'][key] = {
+                'files': stored,
+                'bytes': sum(size for size, _ in stored.values()),
+                'created': now,
+                'last_used': now,
+                'hits': 0,
+            }
+            self.evict(keep=key)
+            self._save_index()
+            return {name: entry_dir / name for name in stored}
+    
+    def _remove(self, key: str) -> None:
+        self._index['entries'].pop(key, None)
+        shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+    
+    def evict(self, max_bytes: Optional[int] = None, keep: Optional[str] = None) -> int:
+        """
+        Evict least recently used entries until the store fits; returns the number evicted.
+        
+        Entries whose key lock is held (being rendered or linked into place)
+        are skipped.
+        """
+        with self._lock:
+            limit = self.max_bytes if max_bytes is None else max_bytes
+            entries = self._index['entries']
+            total = sum(entry['bytes'] for entry in entries.values())
+            evicted = 0
+            for key in sorted(entries, key=lambda k: entries[k]['last_used']):
+                if total <= limit:
+                    break
+                lock = self._key_locks.get(key)
+                if key == keep or (lock is not None and lock.locked()):
+                    continue
+                total -= entries[key]['bytes']
+                self._remove(key)
+                evicted += 1
+            self._index['evictions'] += evicted
+            if evicted:
+                self._save_index()
+            return evicted
+    
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._index['entries']):
+                self._remove(key)
+            self._index = {'entries': {}, 'hits': 0, 'misses': 0, 'evictions': 0}
+            self._save_index()
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._index['entries']
+            lookups = self._index['hits'] + self._index['misses']
+            return {
+                'entries': len(entries),
+                'bytes': sum(entry['bytes'] for entry in entries.values()),
+                'max_bytes': self.max_bytes,
+                'hits': self._index['hits'],
+                'misses': self._index['misses'],
+                'hit_rate': self._index['hits'] / lookups if lookups else 0.0,
+                'evictions': self._index['evictions'],
+            }
+
+
+class ArtifactCache:
+    """Renders composed CVs through the artifact store."""
+    
+    def __init__(self, base_dir: Path, store: Optional[ArtifactStore] = None,
+                 renderer: Callable[[Path, Path, Path], None] = rendercv_renderer,
+                 assets: Optional[AssetCache] = None):
+        self.base_dir = Path(base_dir)
+        self.store = store or ArtifactStore(self.base_dir)
+        self.renderer = renderer
+        self.assets = assets or AssetCache(self.base_dir)  # Pre-rasterized photo shared by all renders
+    
+    def key(self, cv: Mapping[str, Any]) -> str:
+        """Content key: canonical CV hash combined with the template hash."""
+        combined = f"{canonical_hash(cv)}:{template_hash(self.base_dir, cv)}"
+        return hashlib.sha256(combined.encode('utf-8')).hexdigest()
+    
+    def render(self, cv: Mapping[str, Any], yaml_path: Path, output_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Write the YAML and the rendered artifacts of a composed CV.
+        
+        The YAML is written as composed (project-relative photo path); the
+        renderer reads a temporary copy whose assets point at their
+        pre-rasterized PNGs in the asset cache. The key covers the photo by
+        content (see template_hash), so it is the same in every checkout.
+        On a cache hit the stored YAML is linked to yaml_path and the rendered
+        files into output_dir (default: rendercv_output/) without rendering.
+        Returns the key, whether it was a hit and the placed files.
+        """
+        yaml_path = Path(yaml_path)
+        output_dir = Path(output_dir) if output_dir else self.base_dir / "rendercv_output"
+        key = self.key(cv)
+        
+        with self.store.key_lock(key):
+            files = self.store.get(key)
+            hit = files is not None
+            if not hit:
+                yaml_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(yaml_path, 'w', encoding='utf-8') as f:
+                    write_yaml(cv, f)
+                with tempfile.TemporaryDirectory(dir=self.store.root) as render_dir:
+                    # Render input in a subdirectory so it is not collected as an artifact
+                    render_input = Path(render_dir) / "input" / yaml_path.name
+                    render_input.parent.mkdir()
+                    with open(render_input, 'w', encoding='utf-8') as f:
+                        write_yaml(self.assets.prepare_cv(cv), f)
+                    self.renderer(render_input, Path(render_dir), self.base_dir)
+                    rendered = sorted(
+                        path for path in Path(render_dir).iterdir()
+                        if path.is_file() and path.suffix in ARTIFACT_SUFFIXES
+                    )
+                    # The YAML is stored under a fixed name so entries are independent of output names
+                    yaml_copy = Path(render_dir) / "cv.yaml"
+                    shutil.copy2(yaml_path, yaml_copy)
+                    files = self.store.put(key, [yaml_copy] + rendered)
+            
+            # Still under the key lock, so another thread's put() cannot evict the entry meanwhile
+            placed = {}
+            for name, path in files.items():
+                target = yaml_path if name == "cv.yaml" else output_dir / name
+                placed[str(target)] = link_or_copy(path, target)
+        return {'key': key, 'hit': hit, 'files': placed}
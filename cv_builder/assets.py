@@ -0,0 +1,147 @@
+"""
+Pre-rasterized render assets.
+
+Images referenced by a composed CV (the header photo, `cv.photo`) are
+rasterized to PNG once per content hash and target size and kept in
+`.cv_cache/assets/`:
+
+    .cv_cache/assets/<aa>/<sha256>_<width>px/<name>.png
+
+The renderer is given a copy of the composed CV overlaid with the cached
+paths, so every profile, locale and application in a batch embeds the same
+prepared file instead of converting the SVG again. The written YAML keeps the
+project-relative path. The target width follows `design.header.photo_width`
+at `dpi`.
+
+Rasterizing uses PyMuPDF (imported on the first conversion).
+"""
+
+import hashlib
+import math
+import os
+import re
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+from cv_builder.document import overlay_path
+from cv_builder.utils import get_cache_dir
+
+DEFAULT_DPI = 300
+DEFAULT_WIDTH_PX = 600  # When the CV gives no usable width
+
+# (path of the asset in the composed CV, path of its rendered width in the CV)
+ASSET_PATHS: Sequence[Tuple[Tuple[str, ...], Tuple[str, ...]]] = (
+    (('cv', 'photo'), ('design', 'header', 'photo_width')),
+)
+
+UNITS_PER_INCH = {'in': 1.0, 'cm': 2.54, 'mm': 25.4, 'pt': 72.0}
+_LENGTH = re.compile(r"^\s*([\d.]+)\s*(in|cm|mm|pt)\s*$")
+
+
+def lookup(data: Mapping[str, Any], path: Sequence[str]) -> Any:
+    """Value at a nested key path, or None."""
+    for key in path:
+        if not isinstance(data, Mapping):
+            return None
+        data = data.get(key)
+    return data
+
+
+def width_px(length: Any, dpi: int = DEFAULT_DPI) -> int:
+    """Pixels for a Typst length such as "2cm" at dpi (DEFAULT_WIDTH_PX if unknown)."""
+    match = _LENGTH.match(str(length or ''))
+    if not match:
+        return DEFAULT_WIDTH_PX
+    return max(1, math.ceil(float(match.group(1)) / UNITS_PER_INCH[match.group(2)] * dpi))
+
+
+def rasterize(source: Path, target: Path, width: int) -> None:
+    """Render the first page of an SVG (or any image PyMuPDF opens) to a PNG of the given width."""
+    import fitz  # PyMuPDF
+    
+    with fitz.open(str(source)) as doc:
+        page = doc[0]
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=True)
+    pixmap.save(str(target))
+
+
+class AssetCache:
+    """Rasterizes CV assets once per content hash and width, shared by all renders."""
+    
+    def __init__(self, base_dir: Path, dpi: int = DEFAULT_DPI):
+        self.base_dir = Path(base_dir)
+        self.root = get_cache_dir(self.base_dir, "assets").resolve()  # Absolute: YAMLs are written to many directories
+        self.dpi = dpi
+        # (source, size, mtime_ns, width) -> prepared file; skips re-hashing within a batch
+        self._prepared: Dict[Tuple[str, int, int, int], Path] = {}
+        self._lock = threading.Lock()
+        self.stats = {'converted': 0, 'reused': 0}
+    
+    def prepare(self, source: Path, width: int) -> Path:
+        """Path of the cached PNG of source at width pixels, converting it on first use."""
+        source = Path(source)
+        if not source.is_absolute():
+            source = self.base_dir / source
+        stat = source.stat()
+        memo_key = (str(source), stat.st_size, stat.st_mtime_ns, width)
+        
+        with self._lock:
+            prepared = self._prepared.get(memo_key)
+            if prepared is None:
+                digest = hashlib.sha256(source.read_bytes()).hexdigest()
+                prepared = self.root / digest[:2] / f"{digest}_{width}px" / f"{source.stem}.png"
+                if prepared.exists():
+                    self.stats['reused'] += 1
+                else:
+                    prepared.parent.mkdir(parents=True, exist_ok=True)
+                    # Convert into a temp file first so a render never sees a partial PNG
+                    fd, tmp_name = tempfile.mkstemp(dir=prepared.parent, prefix=".tmp-", suffix=".png")
+                    os.close(fd)
+                    try:
+                        rasterize(source, Path(tmp_name), width)
+                        os.replace(tmp_name, prepared)
+                    finally:
+                        if os.path.exists(tmp_name):
+                            os.remove(tmp_name)
+                    self.stats['converted'] += 1
+                self._prepared[memo_key] = prepared
+            else:
+                self.stats['reused'] += 1
+        return prepared
+    
+    def prepare_cv(self, cv: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        The composed CV as handed to the renderer: assets point at the cached
+        PNGs (absolute paths, valid only on this machine).
+        
+        Assets that are already PNGs are made absolute and missing ones are
+        left as they are; the CV itself is not modified (the paths are overlaid).
+        """
+        for asset_path, width_path in ASSET_PATHS:
+            value = lookup(cv, asset_path)
+            if not value:
+                continue
+            source = Path(value) if Path(value).is_absolute() else self.base_dir / value
+            if not source.is_file():
+                continue
+            if source.suffix.lower() == '.png':
+                prepared = source.resolve()
+            else:
+                prepared = self.prepare(source, width_px(lookup(cv, width_path), self.dpi))
+            cv = overlay_path(cv, asset_path, str(prepared))
+        return cv
+    
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.root.iterdir():
+                shutil.rmtree(path)
+            self._prepared.clear()
+    
+    def disk_stats(self) -> Dict[str, int]:
+        """Number and total size of the cached PNGs."""
+        files = [path for path in self.root.glob("*/*/*.png") if not path.name.startswith(".tmp-")]
+        return {'files': len(files), 'bytes': sum(path.stat().st_size for path in files)}
@@ -0,0 +1,222 @@
+"""
+Batch generation of one tailored CV per application.
+
+All applications share one loaded and validated item pool and one loaded copy
+of each base file; outputs are composed and written in parallel with failures
+isolated per application.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from cv_builder.artifacts import ArtifactCache
+from cv_builder.composer import Composer
+from cv_builder.coverage import CoverageScorer
+from cv_builder.document import write_yaml
+from cv_builder.loader import Loader
+from cv_builder.models import Application, CVItem, Profile
+from cv_builder.snapshots import SnapshotStore
+from cv_builder.utils import detect_locale
+from cv_builder.validator import Validator
+
+
+@dataclass
+class BatchJob:
+    """A planned build: one application with its resolved profile."""
+    application: Application
+    locale: str
+    profile: Optional[Profile] = None
+    source: str = ""  # How the profile was chosen: meta, company, tailored
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of building one application's CV."""
+    application_id: str
+    profile_name: str
+    locale: str
+    source: str
+    output_path: Optional[Path] = None
+    total_chars: int = 0
+    elapsed: float = 0.0
+    cache_hit: Optional[bool] = None  # Set when rendering through the artifact cache
+    snapshot_id: Optional[str] = None
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchBuilder:
+    """Builds a tailored CV for every application in a directory."""
+    
+    def __init__(self, loader: Loader, output_dir: Path, workers: int = 4,
+                 artifacts: Optional[ArtifactCache] = None, snapshots: Optional[SnapshotStore] = None):
+        self.loader = loader
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+        self.artifacts = artifacts  # Render each CV (deduplicated by content) when set
+        self.snapshots = snapshots  # Record the inputs/output of each build when set
+        self.validator = Validator()
+        self.composer = Composer()
+        self._bases: Dict[str, Mapping] = {}
+    
+    @staticmethod
+    def application_locale(application: Application) -> str:
+        """Locale of an application: meta.locale, else detected from the posting language."""
+        return application.meta.get('locale') or detect_locale(application.content)
+    
+    def load_items(self) -> Tuple[Dict[str, CVItem], List[str]]:
+        """Load and validate the shared item pool once."""
+        items = self.loader.load_items()
+        return items, self.validator.validate_items(items)
+    
+    def plan(self, applications: List[Application], items: Dict[str, CVItem]) -> List[BatchJob]:
+        """
+        Resolve a profile for each application.
+        
+        Lookup order: `meta.profile` in the application JSON, then a profile named
+        `<company>-<locale>`, otherwise the profile of the same locale with the best
+        requirement coverage for the posting (scored for all applications at once),
+        tailored to the posting's requirement terms.
+        
+        Errors (a broken profile, a failing scorer) only fail the affected jobs.
+        """
+        available = set(self.loader.list_profiles())
+        jobs = [BatchJob(application=app, locale="") for app in applications]
+        to_derive = []
+        
+        for job in jobs:
+            app = job.application
+            try:
+                job.locale = self.application_locale(app)
+                explicit = app.meta.get('profile')
+                by_company = f"{app.company}-{job.locale}"
+                if explicit:
+                    job.profile, job.source = self.loader.load_profile(explicit), "meta"
+                elif by_company in available:
+                    job.profile, job.source = self.loader.load_profile(by_company), "company"
+                else:
+                    to_derive.append(job)
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+        
+        if to_derive:
+            self.derive(to_derive, sorted(available), items)
+        
+        # Every application gets its own output file
+        for job in jobs:
+            if job.profile is not None:
+                job.profile = replace(
+                    job.profile,
+                    output_file=str(self.output_dir / f"{job.application.id}.yaml"),
+                )
+        
+        return jobs
+    
+    def derive(self, jobs: List[BatchJob], names: List[str], items: Dict[str, CVItem]) -> None:
+        """Tailor the best-covering profile of each job's locale to its posting."""
+        candidates, broken = [], []
+        for name in names:
+            try:
+                candidates.append(self.loader.load_profile(name))
+            except Exception as e:
+                broken.append(f"{name} ({type(e).__name__}: {e})")
+        
+        scorer = CoverageScorer(self.loader, self.composer)
+        try:
+            rows = list(scorer.score([job.application for job in jobs], candidates, items)[0])
+        except Exception:
+            # Score one application at a time so only the failing ones are lost
+            rows = []
+            for job in jobs:
+                try:
+                    rows.append(scorer.score([job.application], candidates, items)[0][0])
+                except Exception as e:
+                    job.error = f"Coverage scoring failed: {type(e).__name__}: {e}"
+                    rows.append(None)
+        
+        for job, row in zip(jobs, rows):
+            if row is None:
+                continue
+            matching = [i for i, profile in enumerate(candidates) if profile.locale == job.locale]
+            if not matching:
+                skipped = f" (unloadable: {', '.join(broken)})" if broken else ""
+                job.error = f"No profile with locale '{job.locale}' to derive from{skipped}"
+                continue
+            best = max(matching, key=lambda i: row[i])
+            try:
+                job.profile = scorer.tailor(job.application, candidates[best], items)
+                job.source = "tailored"
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+    
+    def load_base(self, base_file: str) -> Mapping:
+        """Load each base file once for the whole batch (shared, read-only)."""
+        if base_file not in self._bases:
+            self._bases[base_file] = self.loader.load_base(base_file)
+        return self._bases[base_file]
+    
+    def build_one(self, job: BatchJob, items: Dict[str, CVItem]) -> BatchResult:
+        """Compose and write (or render) one CV; errors are captured in the result."""
+        start = time.perf_counter()
+        result = BatchResult(
+            application_id=job.application.id,
+            profile_name=job.profile.name if job.profile else "-",
+            locale=job.locale,
+            source=job.source,
+        )
+        
+        try:
+            if job.error:
+                raise RuntimeError(job.error)
+            
+            profile_errors = self.validator.validate_profile(job.profile, items)
+            if profile_errors:
+                raise ValueError("; ".join(profile_errors))
+            
+            selected = self.composer.select_items(items, job.profile)
+            stats = self.composer.calculate_section_stats(selected, job.profile.locale)
+            sections = self.composer.build_sections(selected, job.profile.locale)
+            base = self.load_base(job.profile.base_file)
+            cv = self.composer.compose_cv(base, sections)
+            
+            output_path = Path(job.profile.output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.artifacts is not None:
+                # Rendered files go to <output_dir>/<application id>/
+                rendered = self.artifacts.render(cv, output_path, output_path.with_suffix(''))
+                result.cache_hit = rendered['hit']
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    write_yaml(cv, f)
+            
+            if self.snapshots is not None:
+                manifest = self.snapshots.record(job.profile, selected, base, cv, output_path, job.application.id)
+                result.snapshot_id = manifest['id']
+            
+            result.output_path = output_path
+            result.total_chars = sum(section['total_chars'] for section in stats.values())
+        except Exception as e:
+            result.error = job.error or f"{type(e).__name__}: {e}"
+        
+        result.elapsed = time.perf_counter() - start
+        return result
+    
+    def build(self, jobs: List[BatchJob], items: Dict[str, CVItem]) -> List[BatchResult]:
+        """Build all planned jobs in parallel."""
+        # Load bases up front so worker threads only read them
+        for job in jobs:
+            if job.profile is not None and not job.error:
+                try:
+                    self.load_base(job.profile.base_file)
+                except Exception as e:
+                    job.error = f"{type(e).__name__}: {e}"
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(lambda job: self.build_one(job, items), jobs))
@@ -1,14 +1,77 @@
 """
 CLI entry point for the CV builder.
+
+Only the standard library is imported at module level; `--validate-only` and
+`--stats` are answered from the cached index without importing PyYAML when
+the index is fresh.
 """
 
 import argparse
 import sys
-import yaml
 from pathlib import Path
-from cv_builder.loader import Loader
-from cv_builder.validator import Validator
-from cv_builder.composer import Composer
+
+
+def print_section_stats(stats) -> None:
+    """Print character count statistics per section."""
+    print("\nCharacter count statistics:")
+    for section_name, section_stats in stats.items():
+        print(f"  {section_name}: {section_stats['total_chars']} chars, width {section_stats['display_width']} "
+              f"({section_stats['item_count']} items)")
+
+
+def run_from_index(args, base_dir: Path):
+    """
+    Answer --validate-only/--stats from the cached index.
+    
+    Returns the exit code, or None if the index is missing/stale or does not
+    know the profile (the full YAML path then runs and refreshes it).
+    """
+    from cv_builder.index import ItemIndex
+    
+    index = ItemIndex.open(base_dir)
+    profile = index.profile(args.profile) if index else None
+    if profile is None:
+        return None
+    
+    from cv_builder.validator import Validator
+    
+    items = index.items()
+    print(f"Loaded {len(items)} items from cached index")
+    
+    if index.item_errors:
+        print("\n❌ Item validation errors:")
+        for error in index.item_errors:
+            print(f"  - {error}")
+        return 1
+    print("✓ All items valid")
+    
+    profile_errors = Validator().validate_profile(profile, items)
+    if profile_errors:
+        print("\n❌ Profile validation errors:")
+        for error in profile_errors:
+            print(f"  - {error}")
+        return 1
+    print(f"✓ Profile '{profile.name}' valid")
+    
+    if args.stats:
+        from cv_builder.composer import Composer
+        
+        composer = Composer()
+        print_section_stats(composer.calculate_section_stats(composer.select_items(items, profile), profile.locale))
+    else:
+        print("\n✓ Validation complete. No output generated (--validate-only flag)")
+    return 0
+
+
+def write_index(loader, items, item_errors) -> None:
+    """Refresh the cached index after a full load (best effort)."""
+    from cv_builder.index import ItemIndex
+    
+    try:
+        profiles = loader.load_profiles()
+        ItemIndex.write(loader.base_dir, items, item_errors, profiles)
+    except Exception as e:
+        print(f"  (cached index not updated: {type(e).__name__}: {e})")
 
 
 def main():
@@ -30,6 +93,35 @@ def main():
         action='store_true',
         help='Only validate items and profile without generating output'
     )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Only validate and print character statistics of the profile (no output)'
+    )
+    parser.add_argument(
+        '--pack',
+        nargs='?',
+        const='',
+        metavar='PATH',
+        help='Read items from a packed item store (default: .cv_cache/items.pack, see scripts/pack_items.py)'
+    )
+    parser.add_argument(
+        '--render',
+        action='store_true',
+        help='Also render the CV with RenderCV, reusing cached artifacts of an identical CV (see scripts/artifact_cache.py)'
+    )
+    parser.add_argument(
+        '--snapshot',
+        nargs='?',
+        const='',
+        metavar='APPLICATION_ID',
+        help='Record a build snapshot in data/snapshots/, optionally for an application (see scripts/snapshots.py)'
+    )
+    parser.add_argument(
+        '--no-index',
+        action='store_true',
+        help='Always load and validate the YAML files instead of using the cached index'
+    )
     parser.add_argument(
         '--base-dir',
         help='Base directory for the project (default: current directory parent)'
@@ -37,22 +129,46 @@ def main():
     
     args = parser.parse_args()
     
-    # Initialize components
     base_dir = Path(args.base_dir) if args.base_dir else Path(__file__).parent.parent
-    loader = Loader(base_dir=base_dir)
+    
+    # Fast path: no YAML parsing (or PyYAML import) while the cached index is fresh
+    if (args.validate_only or args.stats) and not args.no_index and args.pack is None:
+        exit_code = run_from_index(args, base_dir)
+        if exit_code is not None:
+            sys.exit(exit_code)
+    
+    from cv_builder.composer import Composer
+    from cv_builder.document import write_yaml
+    from cv_builder.loader import Loader
+    from cv_builder.validator import Validator
+    
+    pack_path = None
+    if args.pack is not None:
+        from cv_builder.pack import DEFAULT_PACK_FILE
+        pack_path = Path(args.pack) if args.pack else base_dir / ".cv_cache" / DEFAULT_PACK_FILE
+    
+    # Initialize components
+    # --validate-only reads the profile memo but never writes it
+    loader = Loader(base_dir=base_dir, pack_path=pack_path, persist_profiles=not args.validate_only)
     validator = Validator()
     composer = Composer()
     
-    print(f"Loading items from {base_dir / 'modular_cv' / 'cv_items'}...")
+    print(f"Loading items from {pack_path or base_dir / 'modular_cv' / 'cv_items'}...")
     
     try:
         # Load all items
         items = loader.load_items()
+        if loader.pack_stale:
+            shown = ', '.join(loader.pack_stale[:5]) + (', ...' if len(loader.pack_stale) > 5 else '')
+            print(f"⚠ Item pack is stale ({shown}); loaded the YAML items instead "
+                  f"(run scripts/pack_items.py pack)")
         print(f"Loaded {len(items)} items")
         
         # Validate items
         print("Validating items...")
         item_errors = validator.validate_items(items)
+        if pack_path is None:
+            write_index(loader, items, item_errors)
         
         if item_errors:
             print("\n❌ Item validation errors:")
@@ -62,6 +178,17 @@ def main():
         
         print("✓ All items valid")
         
+        stale = sorted(item.id for item in items.values() if item.metadata.stale)
+        if stale:
+            print(f"⚠ Stale length metadata, measured live: {', '.join(stale)} (run scripts/update_char_counts.py)")
+        
+        # Translation alignment warnings (cached per item content, not fatal)
+        from cv_builder.alignment import AlignmentAuditor
+        
+        alignment_issues = AlignmentAuditor(base_dir).audit(items)
+        if alignment_issues:
+            print(f"⚠ {len(alignment_issues)} en/kr alignment warnings (see scripts/audit_alignment.py)")
+        
         # Load profile
         print(f"\nLoading profile '{args.profile}'...")
         profile = loader.load_profile(args.profile)
@@ -78,14 +205,10 @@ def main():
         
         print("✓ Profile valid")
         
-        if args.validate_only:
+        if args.validate_only and not args.stats:
             print("\n✓ Validation complete. No output generated (--validate-only flag)")
             sys.exit(0)
         
-        # Load base
-        print(f"\nLoading base file '{profile.base_file}'...")
-        base = loader.load_base(profile.base_file)
-        
         # Select items based on profile
         print("\nSelecting items for sections...")
         selected_items = composer.select_items(items, profile)
@@ -94,10 +217,14 @@ def main():
             print(f"  {section_name}: {len(section_items)} items")
         
         # Calculate statistics
-        stats = composer.calculate_section_stats(selected_items, profile.locale)
-        print("\nCharacter count statistics:")
-        for section_name, section_stats in stats.items():
-            print(f"  {section_name}: {section_stats['total_chars']} chars ({section_stats['item_count']} items)")
+        print_section_stats(composer.calculate_section_stats(selected_items, profile.locale))
+        
+        if args.stats:
+            sys.exit(0)
+        
+        # Load base
+        print(f"\nLoading base file '{profile.base_file}'...")
+        base = loader.load_base(profile.base_file)
         
         # Build sections
         print("\nBuilding sections...")
@@ -110,13 +237,35 @@ def main():
         # Determine output path
         output_path = Path(args.output) if args.output else base_dir / profile.output_file
         
-        # Write output
-        print(f"\nWriting output to {output_path}...")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            yaml.dump(cv, f, allow_unicode=True, sort_keys=False, width=120)
+        if args.render:
+            from cv_builder.artifacts import ArtifactCache
+            
+            # Writes the YAML too; an identical CV rendered before is linked instead of re-rendered
+            print(f"\nRendering {output_path}...")
+            artifacts = ArtifactCache(base_dir)
+            rendered = artifacts.render(cv, output_path)
+            print(f"{'✓ Reused cached render' if rendered['hit'] else '✓ Rendered'} ({rendered['key'][:12]}):")
+            for path, how in rendered['files'].items():
+                print(f"  {path} ({how})")
+            stats = artifacts.store.stats()
+            print(f"  Artifact cache: {stats['entries']} entries, {stats['bytes'] / 1e6:.1f} MB, "
+                  f"hit rate {stats['hit_rate']:.0%}")
+        else:
+            # Write output
+            print(f"\nWriting output to {output_path}...")
+            with open(output_path, 'w', encoding='utf-8') as f:
+                write_yaml(cv, f)
         
         print(f"✓ CV successfully generated: {output_path}")
         
+        if args.snapshot is not None:
+            from cv_builder.snapshots import SnapshotStore
+            
+            manifest = SnapshotStore(base_dir).record(
+                profile, selected_items, base, cv, output_path, args.snapshot or None
+            )
+            print(f"✓ Snapshot recorded: {manifest['id']}")
+    
     except FileNotFoundError as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
@@ -2,14 +2,17 @@
 Composition logic for building RenderCV-compatible YAMLs.
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping
 from cv_builder.models import CVItem, Profile
-import yaml
+from cv_builder.utils import count_text
 
 
 class Composer:
     """Composes CV from items and profile specifications."""
     
+    # Item types that produce RenderCV entries
+    ENTRY_TYPES = ('work_experience', 'project', 'education', 'additional_info')
+    
     @staticmethod
     def calculate_char_count(text: str) -> int:
         """Calculate character count for text."""
@@ -84,19 +87,28 @@ class Composer:
             'details': data['details'].get(locale)
         }
     
-    def calculate_item_char_count(self, item: CVItem, locale: str) -> int:
-        """Calculate total character count for an item in a specific locale."""
+    def calculate_item_char_count(self, item: CVItem, locale: str, mode: str = 'chars') -> int:
+        """
+        Calculate total length of an item in a specific locale.
+        
+        Uses the metrics precomputed in the item's metadata sidecar and only
+        measures the text when the sidecar has none.
+        """
+        precomputed = item.metadata.total(locale, mode)
+        if precomputed is not None:
+            return precomputed
+        
         data = item.data
         total_chars = 0
         
         # Count all text fields
         for key, value in data.items():
             if isinstance(value, dict) and locale in value:
-                total_chars += len(value[locale])
+                total_chars += count_text(value[locale], mode)
             elif isinstance(value, list):
                 for list_item in value:
                     if isinstance(list_item, dict) and locale in list_item:
-                        total_chars += len(list_item[locale])
+                        total_chars += count_text(list_item[locale], mode)
         
         return total_chars
     
@@ -148,27 +160,29 @@ class Composer:
         
         return sections
     
-    def compose_cv(self, base: Dict[str, Any], sections: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
-        """Merge base CV structure with composed sections."""
-        cv = base.copy()
-        
-        # Add sections to cv
-        if 'cv' not in cv:
-            cv['cv'] = {}
+    def compose_cv(self, base: Mapping[str, Any], sections: Dict[str, List[Dict[str, Any]]]) -> Mapping[str, Any]:
+        """
+        Merge base CV structure with composed sections.
         
-        cv['cv']['sections'] = sections
+        Returns a copy-on-write overlay: `cv.sections` is layered over the base,
+        which is shared, not copied, and never modified.
+        """
+        # document imports PyYAML; keep the Composer (stats) importable without it
+        from cv_builder.document import overlay_path
         
-        return cv
+        return overlay_path(base, ('cv', 'sections'), sections)
     
     def calculate_section_stats(self, selected_items: Dict[str, List[CVItem]], locale: str) -> Dict[str, Dict[str, int]]:
-        """Calculate character count statistics for each section."""
+        """Calculate character count and display width statistics for each section."""
         stats = {}
         
         for section_name, items in selected_items.items():
             total_chars = sum(self.calculate_item_char_count(item, locale) for item in items)
+            display_width = sum(self.calculate_item_char_count(item, locale, 'display_width') for item in items)
             stats[section_name] = {
                 'item_count': len(items),
-                'total_chars': total_chars
+                'total_chars': total_chars,
+                'display_width': display_width
             }
         
         return stats
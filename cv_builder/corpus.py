@@ -0,0 +1,323 @@
+"""
+Chunked corpus of company documents (data/companies/<company>/*.md|*.txt).
+
+Documents are normalized, split into paragraph chunks and stored in a single
+memory-mappable file with an offset index, so that later matching and search
+can read only the chunks they need.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from cv_builder.utils import get_cache_dir
+
+CORPUS_VERSION = 1
+SOURCE_SUFFIXES = (".md", ".txt")
+
+_ZERO_WIDTH = dict.fromkeys(map(ord, "​‌‍﻿"))
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+|(?<=다\.)\s*")
+
+
+@dataclass
+class CorpusChunk:
+    """A single paragraph chunk of a company document."""
+    id: int
+    company: str
+    source: str
+    text: str
+
+
+def decode_document(raw: bytes) -> str:
+    """Decode document bytes, falling back to CP949 for legacy Korean files."""
+    try:
+        return raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return raw.decode("cp949", errors="replace")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize document text for chunking.
+    
+    Applies NFC normalization, unifies line endings, turns PDF page breaks into
+    paragraph breaks and strips whitespace-only lines (as produced by
+    scripts/pdf_to_txt.py).
+    """
+    text = unicodedata.normalize("NFC", text).translate(_ZERO_WIDTH)
+    text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\x0c", "\n\n")
+    text = text.replace(" ", " ").replace("\t", " ")
+    lines = [line.rstrip() for line in text.split("\n")]
+    return "\n".join(lines).strip()
+
+
+def _split_long(paragraph: str, max_chars: int) -> List[str]:
+    """Split an oversized paragraph on line, then sentence boundaries."""
+    pieces = []
+    current = ""
+    for unit in paragraph.split("\n"):
+        if len(unit) > max_chars:
+            unit_parts = [part for part in _SENTENCE_END.split(unit) if part]
+        else:
+            unit_parts = [unit]
+        for part in unit_parts:
+            candidate = f"{current}\n{part}" if current else part
+            if len(candidate) <= max_chars or not current:
+                current = candidate
+            else:
+                pieces.append(current)
+                current = part
+    if current:
+        pieces.append(current)
+    # Hard split anything still too long (e.g. a single huge table row)
+    result = []
+    for piece in pieces:
+        result.extend(piece[i:i + max_chars] for i in range(0, len(piece), max_chars))
+    return result
+
+
+def chunk_text(text: str, min_chars: int = 80, max_chars: int = 1500) -> List[str]:
+    """
+    Split normalized text into paragraph chunks.
+    
+    Short paragraphs (headings, PDF fragments) are merged forward until a chunk
+    reaches min_chars; paragraphs longer than max_chars are split.
+    """
+    chunks = []
+    pending = ""
+    for paragraph in _PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip("\n")
+        if not paragraph.strip():
+            continue
+        pending = f"{pending}\n\n{paragraph}" if pending else paragraph
+        if len(pending) >= min_chars:
+            chunks.extend(_split_long(pending, max_chars))
+            pending = ""
+    if pending:
+        if chunks and len(chunks[-1]) + len(pending) + 2 <= max_chars:
+            chunks[-1] = f"{chunks[-1]}\n\n{pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+class CorpusReader:
+    """Read-only, memory-mapped access to an ingested corpus."""
+    
+    def __init__(self, corpus_path: Path, index: Dict):
+        self.index = index
+        self._offsets = index["offsets"]
+        self._sources = list(index["sources"].items())
+        # Chunk id -> source position, expanded once from the per-source ranges
+        self._chunk_sources = []
+        for position, (_, source) in enumerate(self._sources):
+            self._chunk_sources.extend([position] * source["chunk_count"])
+        
+        self._file = open(corpus_path, "rb")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._data = b""
+    
+    def __enter__(self) -> "CorpusReader":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+    
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+    
+    @property
+    def companies(self) -> Dict[str, Dict]:
+        """Per-company metadata (documents, chunks, chars, sources)."""
+        return self.index["companies"]
+    
+    def read_text(self, chunk_id: int) -> str:
+        """Read and decode the text of a single chunk."""
+        start, end = self._offsets[chunk_id], self._offsets[chunk_id + 1]
+        return bytes(self._data[start:end]).decode("utf-8")
+    
+    def chunk(self, chunk_id: int) -> CorpusChunk:
+        """Read a single chunk with its company and source."""
+        source_path, source = self._sources[self._chunk_sources[chunk_id]]
+        return CorpusChunk(
+            id=chunk_id,
+            company=source["company"],
+            source=source_path,
+            text=self.read_text(chunk_id),
+        )
+    
+    def chunk_ids(self, company: Optional[str] = None, source: Optional[str] = None) -> List[int]:
+        """List chunk ids, optionally restricted to a company or source file."""
+        ids = []
+        for source_path, entry in self._sources:
+            if company is not None and entry["company"] != company:
+                continue
+            if source is not None and source_path != source:
+                continue
+            first = entry["first_chunk"]
+            ids.extend(range(first, first + entry["chunk_count"]))
+        return ids
+    
+    def iter_chunks(self, company: Optional[str] = None) -> Iterator[CorpusChunk]:
+        """Iterate over chunks, optionally for a single company."""
+        for chunk_id in self.chunk_ids(company=company):
+            yield self.chunk(chunk_id)
+
+
+class CompanyCorpus:
+    """Builds and opens the company document corpus."""
+    
+    def __init__(self, base_dir: Path = None, min_chars: int = 80, max_chars: int = 1500):
+        """Initialize corpus with project base directory."""
+        if base_dir is None:
+            base_dir = Path(__file__).parent.parent
+        self.base_dir = base_dir
+        self.companies_dir = base_dir / "data" / "companies"
+        self.corpus_dir = get_cache_dir(base_dir, "corpus")
+        self.corpus_path = self.corpus_dir / "corpus.bin"
+        self.index_path = self.corpus_dir / "index.json"
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+    
+    def load_index(self) -> Dict:
+        """Load the corpus index, or an empty one if nothing was ingested yet."""
+        if self.index_path.exists() and self.corpus_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == CORPUS_VERSION and index.get("chunking") == [self.min_chars, self.max_chars]:
+                return index
+        return {"version": CORPUS_VERSION, "sources": {}, "companies": {}, "offsets": [0]}
+    
+    def find_sources(self) -> List[Path]:
+        """Find all company documents, skipping hidden files and directories."""
+        sources = []
+        if not self.companies_dir.exists():
+            return sources
+        for company_dir in sorted(self.companies_dir.iterdir()):
+            if not company_dir.is_dir() or company_dir.name.startswith("."):
+                continue
+            for path in sorted(company_dir.iterdir()):
+                if path.suffix.lower() in SOURCE_SUFFIXES and not path.name.startswith("."):
+                    sources.append(path)
+        return sources
+    
+    def ingest(self) -> Dict[str, int]:
+        """
+        Incrementally (re)build the corpus.
+        
+        Files whose size and mtime are unchanged are not read at all; files whose
+        content hash is unchanged keep their chunks. Only new or edited files are
+        decoded, normalized and chunked again.
+        
+        Returns a dict with counts of added/updated/unchanged/removed files.
+        """
+        old_index = self.load_index()
+        old_sources = old_index["sources"]
+        old_offsets = old_index["offsets"]
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "chunks": 0}
+        
+        new_sources = {}
+        new_offsets = [0]
+        companies = {}
+        tmp_path = self.corpus_path.with_suffix(".bin.tmp")
+        
+        old_file = open(self.corpus_path, "rb") if self.corpus_path.exists() else None
+        old_data = b""
+        if old_file is not None and os.fstat(old_file.fileno()).st_size > 0:
+            old_data = mmap.mmap(old_file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            with open(tmp_path, "wb") as out:
+                for path in self.find_sources():
+                    rel_path = path.relative_to(self.companies_dir).as_posix()
+                    company = path.parent.name
+                    stat = path.stat()
+                    previous = old_sources.get(rel_path)
+                    
+                    chunk_bytes = None
+                    entry = None
+                    if previous and previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns:
+                        entry = dict(previous)
+                    else:
+                        raw = path.read_bytes()
+                        digest = hashlib.sha256(raw).hexdigest()
+                        if previous and previous["sha256"] == digest:
+                            entry = dict(previous, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                        else:
+                            text = normalize_text(decode_document(raw))
+                            chunks = chunk_text(text, self.min_chars, self.max_chars)
+                            chunk_bytes = [chunk.encode("utf-8") for chunk in chunks]
+                            entry = {
+                                "company": company,
+                                "sha256": digest,
+                                "size": stat.st_size,
+                                "mtime_ns": stat.st_mtime_ns,
+                                "chars": sum(len(chunk) for chunk in chunks),
+                            }
+                            stats["updated" if previous else "added"] += 1
+                    
+                    if chunk_bytes is None:
+                        # Reuse the previously stored chunks byte-for-byte
+                        stats["unchanged"] += 1
+                        first = previous["first_chunk"]
+                        chunk_bytes = [
+                            bytes(old_data[old_offsets[i]:old_offsets[i + 1]])
+                            for i in range(first, first + previous["chunk_count"])
+                        ]
+                    
+                    entry["first_chunk"] = len(new_offsets) - 1
+                    entry["chunk_count"] = len(chunk_bytes)
+                    for data in chunk_bytes:
+                        out.write(data)
+                        new_offsets.append(new_offsets[-1] + len(data))
+                    new_sources[rel_path] = entry
+                    
+                    company_meta = companies.setdefault(
+                        company, {"documents": 0, "chunks": 0, "chars": 0, "sources": []}
+                    )
+                    company_meta["documents"] += 1
+                    company_meta["chunks"] += entry["chunk_count"]
+                    company_meta["chars"] += entry["chars"]
+                    company_meta["sources"].append(rel_path)
+        finally:
+            if isinstance(old_data, mmap.mmap):
+                old_data.close()
+            if old_file is not None:
+                old_file.close()
+        
+        stats["removed"] = len(set(old_sources) - set(new_sources))
+        stats["chunks"] = len(new_offsets) - 1
+        
+        os.replace(tmp_path, self.corpus_path)
+        index = {
+            "version": CORPUS_VERSION,
+            "chunking": [self.min_chars, self.max_chars],
+            "sources": new_sources,
+            "companies": companies,
+            "offsets": new_offsets,
+        }
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        
+        return stats
+    
+    def open(self) -> CorpusReader:
+        """Open the ingested corpus for reading."""
+        if not self.index_path.exists() or not self.corpus_path.exists():
+            raise FileNotFoundError(f"Corpus not found: {self.corpus_path} (run scripts/ingest_companies.py)")
+        return CorpusReader(self.corpus_path, self.load_index())
@@ -0,0 +1,309 @@
+"""
+Keyword coverage of job posting requirements by composed CVs.
+
+Requirement terms are extracted from `job_post.content` of each application and
+matched against the entries of each profile's composed CV. All profiles are
+scored against all postings at once with a term-document matrix, and a
+profile can be tailored to one posting by selecting the items of each section
+that cover the most of its requirement terms.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from cv_builder.composer import Composer
+from cv_builder.loader import Loader
+from cv_builder.models import Application, CVItem, Profile, SectionSpec
+
+_LATIN_TERM = re.compile(r"[a-z][a-z0-9]*(?:[+#]+|(?:[-./&][a-z0-9]+)*)")
+_HANGUL_WORD = re.compile(r"[가-힣]+")
+_BULLET = re.compile(r"^\s*(?:[-*·•○■▶▪◦]|\d+[.)])\s*")
+# Item types whose sections are trimmed to the posting when tailoring; education,
+# work history and additional info stay complete (a dropped degree or job reads as a gap)
+TAILORED_TYPES = ('project',)
+# A trimmed section keeps at least this share of the base profile's items
+TAILOR_MIN_SHARE = 0.5
+
+_HEADER = re.compile(r"^\s*(?:=+\s*(.+?)\s*=+|\[(.+?)\]|([^:]{1,20}):)\s*$")
+
+# Particles and verb endings stripped from Korean words (longest first)
+KR_SUFFIXES = sorted([
+    '으로서', '으로써', '에서의', '으로', '에서', '에게', '까지', '부터', '처럼', '보다',
+    '하고', '하는', '하여', '하며', '하기', '해서', '적인', '적으로', '적',
+    '과', '와', '을', '를', '이', '가', '은', '는', '의', '에', '로', '도', '한', '할', '된',
+], key=len, reverse=True)
+
+STOPWORDS = {
+    # en
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it',
+    'of', 'on', 'or', 'the', 'to', 'with', 'our', 'we', 'you', 'your', 'will', 'etc',
+    'experience', 'preferred', 'required', 'ability', 'strong', 'plus',
+    # kr
+    '경험', '경험자', '관련', '우대', '가능', '가능자', '이상', '제반', '대상', '기반', '통해', '위한',
+    '있는', '수행', '보유자', '소지자', '졸업', '예정', '분야', '업무', '주요', '또는', '통한',
+    '싶은', '새로운', '갖추고', '다룰', '의미', '과정', '형태',
+}
+
+# Section headers whose lines are not requirements (working conditions, process, ...)
+SKIPPED_SECTIONS = ('근무', '급여', '장소', '형태', '채용인원', '복리', '전형', '접수', '제출', '문의', '혜택',
+                    'benefit', 'salary', 'location', 'process', 'how to apply')
+
+# Cross-lingual spellings mapped onto a single term
+TERM_ALIASES = {
+    '파이썬': 'python',
+    '엑셀': 'excel',
+    '머신러닝': 'machine-learning',
+    'ml': 'machine-learning',
+    '딥러닝': 'deep-learning',
+    '자연어': 'nlp',
+    '데이터베이스': 'database',
+    'db': 'database',
+    '크롤링': 'crawling',
+    '스크래핑': 'scraping',
+}
+
+
+def extract_terms(text: str) -> List[str]:
+    """
+    Extract normalized terms from English and/or Korean text.
+    
+    Latin tokens are lower-cased (keeping compounds like text-to-sql, c++);
+    Korean words have trailing particles/endings stripped.
+    """
+    text = text.lower()
+    terms = []
+    
+    for token in _LATIN_TERM.findall(text):
+        token = token.strip('.-/&')
+        if len(token) >= 2 and token not in STOPWORDS:
+            terms.append(TERM_ALIASES.get(token, token))
+    
+    for word in _HANGUL_WORD.findall(text):
+        if word in KR_SUFFIXES:
+            continue
+        for suffix in KR_SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                word = word[:-len(suffix)]
+                break
+        if len(word) >= 2 and word not in STOPWORDS:
+            terms.append(TERM_ALIASES.get(word, word))
+    
+    return terms
+
+
+def extract_requirement_terms(content: str) -> List[str]:
+    """
+    Extract requirement terms from a job posting.
+    
+    Uses bulleted/numbered lines when the posting has any (skipping sections such
+    as working conditions), otherwise every line. Returns unique terms in order
+    of first appearance.
+    """
+    lines = content.splitlines()
+    has_bullets = any(_BULLET.match(line) for line in lines)
+    
+    selected = []
+    skip_section = False
+    for line in lines:
+        is_bullet = bool(_BULLET.match(line))
+        body = _BULLET.sub('', line) if is_bullet else line
+        header = _HEADER.match(body)
+        
+        if header and not is_bullet:
+            title = next(group for group in header.groups() if group)
+            skip_section = any(key in title.lower() for key in SKIPPED_SECTIONS)
+            continue
+        
+        if skip_section or (has_bullets and not is_bullet):
+            continue
+        
+        # "- 근무지: 서울" style key/value lines
+        key = body.split(':', 1)[0] if ':' in body else ''
+        if key and any(skip in key.lower() for skip in SKIPPED_SECTIONS):
+            continue
+        
+        selected.append(body)
+    
+    return list(dict.fromkeys(extract_terms('\n'.join(selected))))
+
+
+def _entry_text(entry: Dict[str, Any]) -> str:
+    """Flatten all text values of a composed RenderCV entry."""
+    parts = []
+    for value in entry.values():
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, list):
+            parts.extend(v for v in value if isinstance(v, str))
+    return '\n'.join(parts)
+
+
+@dataclass
+class ComposedEntry:
+    """An entry of a composed CV, with the section it appears in."""
+    section: str
+    item_id: str
+    row: int  # Row in the document-term matrix
+
+
+@dataclass
+class CoverageReport:
+    """Coverage of one posting by one profile."""
+    application: Application
+    profile: Profile
+    terms: List[str]
+    covered: List[str]
+    missing: List[str]
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+    items: Dict[Tuple[str, str], List[str]] = field(default_factory=dict)
+    
+    @property
+    def score(self) -> float:
+        return len(self.covered) / len(self.terms) if self.terms else 0.0
+
+
+class CoverageScorer:
+    """Scores composed profiles against application postings."""
+    
+    def __init__(self, loader: Loader, composer: Composer = None):
+        self.loader = loader
+        self.composer = composer or Composer()
+    
+    def compose_entries(self, items: Dict[str, CVItem], profiles: List[Profile]) -> Tuple[Dict[str, List[ComposedEntry]], List[str]]:
+        """
+        Compose every profile through Composer and collect its entries.
+        
+        Entries of the same item in the same locale share one document row.
+        Returns per-profile entries and the document texts.
+        """
+        bases = {}
+        doc_rows: Dict[Tuple[str, str], int] = {}
+        documents = []
+        entries = {}
+        
+        for profile in profiles:
+            if profile.base_file not in bases:
+                bases[profile.base_file] = self.loader.load_base(profile.base_file)
+            selected = self.composer.select_items(items, profile)
+            sections = self.composer.build_sections(selected, profile.locale)
+            cv = self.composer.compose_cv(bases[profile.base_file], sections)
+            
+            profile_entries = []
+            for section_name, section_entries in cv['cv']['sections'].items():
+                section_items = [item for item in selected[section_name] if item.type in Composer.ENTRY_TYPES]
+                for item, entry in zip(section_items, section_entries):
+                    key = (item.id, profile.locale)
+                    if key not in doc_rows:
+                        doc_rows[key] = len(documents)
+                        documents.append(_entry_text(entry))
+                    profile_entries.append(ComposedEntry(section_name, item.id, doc_rows[key]))
+            entries[profile.name] = profile_entries
+        
+        return entries, documents
+    
+    def score(self, applications: List[Application], profiles: List[Profile], items: Dict[str, CVItem],
+              detail: bool = False) -> Tuple[np.ndarray, List[CoverageReport]]:
+        """
+        Score all profiles against all applications.
+        
+        Returns the (applications x profiles) coverage ratio matrix and, if detail
+        is set, a CoverageReport per pair with per-section and per-item terms.
+        """
+        entries, documents = self.compose_entries(items, profiles)
+        
+        # Vocabulary: union of requirement terms over all postings
+        requirement_terms = [extract_requirement_terms(app.content) for app in applications]
+        vocab = {}
+        for terms in requirement_terms:
+            for term in terms:
+                vocab.setdefault(term, len(vocab))
+        
+        # Posting-term matrix R (applications x terms)
+        R = np.zeros((len(applications), len(vocab)), dtype=np.uint8)
+        for i, terms in enumerate(requirement_terms):
+            R[i, [vocab[t] for t in terms]] = 1
+        
+        # Document-term matrix X (entry documents x terms)
+        X = np.zeros((len(documents), len(vocab)), dtype=np.uint8)
+        for d, text in enumerate(documents):
+            columns = [vocab[t] for t in set(extract_terms(text)) if t in vocab]
+            X[d, columns] = 1
+        
+        # Profile-document incidence A (profiles x documents) -> profile-term C
+        A = np.zeros((len(profiles), len(documents)), dtype=np.int32)
+        for p, profile in enumerate(profiles):
+            A[p, [entry.row for entry in entries[profile.name]]] = 1
+        C = (A @ X) > 0
+        
+        covered_counts = R.astype(np.int32) @ C.T.astype(np.int32)
+        totals = R.sum(axis=1, keepdims=True).astype(np.float64)
+        scores = np.divide(covered_counts, totals, out=np.zeros(covered_counts.shape), where=totals > 0)
+        
+        reports = []
+        if detail:
+            terms = np.array(list(vocab), dtype=object)
+            for i, application in enumerate(applications):
+                required = R[i].astype(bool)
+                for p, profile in enumerate(profiles):
+                    report = CoverageReport(
+                        application=application,
+                        profile=profile,
+                        terms=list(terms[required]),
+                        covered=list(terms[required & C[p]]),
+                        missing=list(terms[required & ~C[p]]),
+                    )
+                    profile_entries = entries[profile.name]
+                    if profile_entries:
+                        hits = X[[entry.row for entry in profile_entries]].astype(bool) & required
+                        for entry, row_hits in zip(profile_entries, hits):
+                            item_terms = list(terms[row_hits])
+                            report.items[(entry.section, entry.item_id)] = item_terms
+                            section_terms = report.sections.setdefault(entry.section, [])
+                            section_terms.extend(t for t in item_terms if t not in section_terms)
+                    reports.append(report)
+        
+        return scores, reports
+    
+    def tailor(self, application: Application, profile: Profile, items: Dict[str, CVItem]) -> Profile:
+        """
+        Profile tailored to one posting, starting from `profile`.
+        
+        Each section's candidates are its own items plus unused pool items of
+        the same types that cover at least one requirement term, ranked by
+        covered terms (then priority) and capped at max_items. Sections of
+        TAILORED_TYPES keep only the items covering some term, topped up with the
+        best-ranked others to TAILOR_MIN_SHARE of the section; other sections
+        keep all their items. Output order stays by priority.
+        """
+        terms = set(extract_requirement_terms(application.content))
+        hits: Dict[str, int] = {}
+        
+        def covered(item: CVItem) -> int:
+            if item.id not in hits:
+                entries = self.composer.build_sections({'item': [item]}, profile.locale)['item']
+                hits[item.id] = len(terms & set(extract_terms(_entry_text(entries[0])))) if entries else 0
+            return hits[item.id]
+        
+        used = {item_id for spec in profile.sections.values() for item_id in spec.include_ids}
+        sections = {}
+        for name, spec in profile.sections.items():
+            own = [items[item_id] for item_id in spec.include_ids if item_id in items]
+            types = {item.type for item in own}
+            pool = [
+                item for item in items.values()
+                if item.type in types and item.id not in used and covered(item) > 0
+            ]
+            ranked = sorted(own + pool, key=lambda item: (-covered(item), item.priority))
+            limit = min(spec.max_items or len(ranked), len(ranked))
+            keep = len(ranked)
+            if types and types <= set(TAILORED_TYPES):
+                keep = max(sum(1 for item in ranked if covered(item) > 0), math.ceil(len(own) * TAILOR_MIN_SHARE))
+            sections[name] = SectionSpec(
+                include_ids=[item.id for item in ranked[:min(keep, limit)]],
+                max_items=spec.max_items,
+            )
+        return replace(profile, name=f"{profile.name}-tailored", sections=sections)
@@ -0,0 +1,140 @@
+"""
+Immutable CV documents: frozen base files, copy-on-write overlays and
+streaming YAML output.
+
+A base file is parsed once into read-only mappings/tuples and shared by every
+profile. Composing a CV layers the generated sections (and any other
+per-build values) over the base without copying it, and the result is written
+event by event straight to the output stream.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Iterator, Sequence, TextIO
+
+from yaml.events import (
+    DocumentEndEvent, DocumentStartEvent, MappingEndEvent, MappingStartEvent,
+    ScalarEvent, SequenceEndEvent, SequenceStartEvent,
+)
+from yaml.nodes import ScalarNode
+
+try:
+    # libyaml's emitter produces the same block-style output several times faster
+    from yaml import CSafeDumper as BaseDumper
+except ImportError:
+    from yaml import SafeDumper as BaseDumper
+
+MAP_TAG = 'tag:yaml.org,2002:map'
+SEQ_TAG = 'tag:yaml.org,2002:seq'
+
+
+def freeze(data: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(data, Mapping):
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+def thaw(data: Any) -> Any:
+    """Materialize a frozen mapping or overlay as plain dicts and lists."""
+    if isinstance(data, Mapping):
+        return {key: thaw(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [thaw(value) for value in data]
+    return data
+
+
+class Overlay(Mapping):
+    """
+    Read-only view of a base mapping with some keys replaced or added.
+    
+    Keys keep the base order; keys only present in the overrides follow in
+    their own order. The base is never modified or copied.
+    """
+    
+    __slots__ = ('_base', '_overrides')
+    
+    def __init__(self, base: Mapping, overrides: Mapping):
+        self._base = base
+        self._overrides = overrides
+    
+    def __getitem__(self, key: Any) -> Any:
+        if key in self._overrides:
+            return self._overrides[key]
+        return self._base[key]
+    
+    def __iter__(self) -> Iterator:
+        yield from self._base
+        for key in self._overrides:
+            if key not in self._base:
+                yield key
+    
+    def __len__(self) -> int:
+        return len(self._base) + sum(1 for key in self._overrides if key not in self._base)
+    
+    def __repr__(self) -> str:
+        return f"Overlay({dict(self._overrides)!r} over {len(self._base)} keys)"
+
+
+def overlay_path(base: Mapping, path: Sequence[str], value: Any) -> Overlay:
+    """
+    Overlay a value at a nested key path.
+    
+    Example:
+        overlay_path(base, ('cv', 'sections'), sections)
+        -> base with base['cv']['sections'] replaced; base['cv'] itself untouched
+    """
+    key, rest = path[0], path[1:]
+    if rest:
+        child = base.get(key)
+        value = overlay_path(child if isinstance(child, Mapping) else {}, rest, value)
+    return Overlay(base, {key: value})
+
+
+class CVDumper(BaseDumper):
+    """SafeDumper that never emits anchors/aliases (shared base values are written in full)."""
+    
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def _emit_node(dumper: CVDumper, data: Any) -> None:
+    if isinstance(data, Mapping):
+        dumper.emit(MappingStartEvent(None, MAP_TAG, True, flow_style=False))
+        for key, value in data.items():
+            _emit_node(dumper, key)
+            _emit_node(dumper, value)
+        dumper.emit(MappingEndEvent())
+    elif isinstance(data, (list, tuple)):
+        dumper.emit(SequenceStartEvent(None, SEQ_TAG, True, flow_style=False))
+        for value in data:
+            _emit_node(dumper, value)
+        dumper.emit(SequenceEndEvent())
+    else:
+        node = dumper.represent_data(data)
+        # Same implicit-tag resolution as yaml's Serializer
+        detected_tag = dumper.resolve(ScalarNode, node.value, (True, False))
+        default_tag = dumper.resolve(ScalarNode, node.value, (False, True))
+        implicit = (node.tag == detected_tag, node.tag == default_tag)
+        dumper.emit(ScalarEvent(None, node.tag, implicit, node.value, style=node.style))
+
+
+def write_yaml(data: Any, stream: TextIO, width: int = 120) -> None:
+    """
+    Stream a (possibly overlaid) document to YAML.
+    
+    Walks mappings, overlays and sequences and emits YAML events directly, so no
+    merged dict or node tree is built. Output matches
+    `yaml.dump(data, allow_unicode=True, sort_keys=False, width=width)`.
+    """
+    dumper = CVDumper(stream, allow_unicode=True, sort_keys=False, width=width, default_flow_style=False)
+    try:
+        dumper.open()
+        dumper.emit(DocumentStartEvent(explicit=False))
+        _emit_node(dumper, data)
+        dumper.emit(DocumentEndEvent(explicit=False))
+        dumper.close()
+    finally:
+        dumper.dispose()
@@ -0,0 +1,125 @@
+"""
+Cached JSON index of items and profiles.
+
+Holds what trivial commands need (item IDs, types, priorities, metadata,
+item validation errors and parsed profiles) in `.cv_cache/index.json`, keyed
+by the mtime/size of every source file. While it is fresh, ID checks and
+statistics are answered without importing PyYAML or parsing any YAML.
+"""
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cv_builder.models import CVItem, ItemMetadata, Profile
+
+INDEX_VERSION = 2
+INDEX_FILE = "index.json"
+
+# Same item types as Loader.load_items
+ITEM_TYPES = ("work_experience", "projects", "education", "additional_info")
+
+
+def source_signature(base_dir: Path) -> Dict[str, List[List[Any]]]:
+    """[relative path, mtime_ns, size] of every item, metadata and profile file."""
+    modular_cv_dir = Path(base_dir) / "modular_cv"
+    directories = {
+        'items': [modular_cv_dir / "cv_items" / t for t in ITEM_TYPES]
+                 + [modular_cv_dir / "cv_items" / t / ".metadata" for t in ITEM_TYPES],
+        'profiles': [modular_cv_dir / "profiles"],
+    }
+    
+    signature = {}
+    for group, paths in directories.items():
+        entries = []
+        for directory in paths:
+            if not directory.is_dir():
+                continue
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith(".yaml") and entry.is_file():
+                        stat = entry.stat()
+                        entries.append([os.path.relpath(entry.path, base_dir), stat.st_mtime_ns, stat.st_size])
+        signature[group] = sorted(entries)
+    return signature
+
+
+class ItemIndex:
+    """Items, item errors and profiles of a project as of a source signature."""
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+    
+    @staticmethod
+    def path(base_dir: Path) -> Path:
+        # Not via utils.get_cache_dir: reading the index must not create directories
+        return Path(base_dir) / ".cv_cache" / INDEX_FILE
+    
+    @classmethod
+    def open(cls, base_dir: Path) -> Optional['ItemIndex']:
+        """Return the cached index if it matches the files on disk, else None."""
+        index_path = cls.path(base_dir)
+        if not index_path.exists():
+            return None
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if data.get('version') != INDEX_VERSION or data.get('signature') != source_signature(base_dir):
+            return None
+        return cls(data)
+    
+    @classmethod
+    def write(cls, base_dir: Path, items: Dict[str, CVItem], item_errors: List[str],
+              profiles: Dict[str, Profile]) -> 'ItemIndex':
+        """Store freshly loaded items/profiles with the current source signature."""
+        data = {
+            'version': INDEX_VERSION,
+            'signature': source_signature(base_dir),
+            'items': {
+                item.id: {
+                    'type': item.type,
+                    'tags': item.tags,
+                    'priority': item.priority,
+                    'metadata': asdict(item.metadata),
+                }
+                for item in items.values()
+            },
+            'item_errors': item_errors,
+            'profiles': {name: asdict(profile) for name, profile in profiles.items()},
+        }
+        
+        index_path = cls.path(base_dir)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        tmp_path.replace(index_path)
+        return cls(data)
+    
+    @property
+    def item_errors(self) -> List[str]:
+        return self.data['item_errors']
+    
+    def items(self) -> Dict[str, CVItem]:
+        """Lightweight items: ID, type, tags, priority and metadata, without `data`."""
+        return {
+            item_id: CVItem(
+                id=item_id,
+                type=entry['type'],
+                tags=entry['tags'],
+                priority=entry['priority'],
+                data={},
+                metadata=ItemMetadata(**entry['metadata']),
+            )
+            for item_id, entry in self.data['items'].items()
+        }
+    
+    def profile(self, name: str) -> Optional[Profile]:
+        """Parsed profile, or None if it is not in the index."""
+        data = self.data['profiles'].get(name)
+        return Profile.from_dict(data) if data else None
@@ -1,31 +1,56 @@
 """
 YAML loading utilities for CV items, profiles, and base files.
+Also loads job application records (JSON) from data/.
 """
 
+import json
 import yaml
 from pathlib import Path
-from typing import Dict, List
-from cv_builder.models import CVItem, Profile
-from cv_builder.utils import load_item_metadata
+from typing import Dict, List, Mapping
+from cv_builder.document import freeze
+from cv_builder.models import Application, CVItem, Profile
+from cv_builder.profiles import ProfileResolver
+from cv_builder.utils import CACHE_DIR_NAME, load_item_metadata
 
 
 class Loader:
     """Handles loading of CV data from YAML files."""
     
-    def __init__(self, base_dir: Path = None):
-        """Initialize loader with base directory."""
+    def __init__(self, base_dir: Path = None, pack_path: Path = None, persist_profiles: bool = False):
+        """
+        Initialize loader with base directory.
+        
+        With pack_path, items are read from a packed item store (see
+        cv_builder.pack) instead of the cv_items YAML files. With
+        persist_profiles, resolved profiles are memoized to
+        .cv_cache/profiles.json (build paths); otherwise the memo is only read.
+        """
         if base_dir is None:
             base_dir = Path(__file__).parent.parent
         self.base_dir = base_dir
         self.modular_cv_dir = base_dir / "modular_cv"
+        self.pack_path = Path(pack_path) if pack_path else None
+        self.persist_profiles = persist_profiles
+        self.pack_stale: List[str] = []  # Item files that differed from the pack (items were read from YAML)
+        self._profile_resolver = None
     
-    def load_items(self) -> Dict[str, CVItem]:
-        """Load all CV items from cv_items directory."""
+    def load_items(self, item_types: List[str] = None) -> Dict[str, CVItem]:
+        """Load all CV items from cv_items directory (or the item pack)."""
         items = {}
         items_dir = self.modular_cv_dir / "cv_items"
         
         # Item types to load
-        item_types = ["work_experience", "projects", "education", "additional_info"]
+        if item_types is None:
+            item_types = ["work_experience", "projects", "education", "additional_info"]
+        
+        if self.pack_path:
+            from cv_builder.pack import ItemPack
+            
+            with ItemPack(self.pack_path) as pack:
+                # An item edited after packing must not be built from the old record
+                self.pack_stale = pack.stale(items_dir)
+                if not self.pack_stale:
+                    return pack.load_items(item_types)
         
         for item_type in item_types:
             item_type_dir = items_dir / item_type
@@ -45,25 +70,65 @@ class Loader:
         
         return items
     
+    def load_answer_blocks(self) -> Dict[str, CVItem]:
+        """Load reusable self-introduction answer blocks (cv_items/answer_blocks)."""
+        return self.load_items(["answer_blocks"])
+    
+    @property
+    def profile_resolver(self) -> ProfileResolver:
+        """Resolver for profile inheritance, memoized in .cv_cache/profiles.json."""
+        if self._profile_resolver is None:
+            self._profile_resolver = ProfileResolver(
+                self.modular_cv_dir / "profiles",
+                cache_dir=self.base_dir / CACHE_DIR_NAME,
+                persist=self.persist_profiles,
+            )
+        return self._profile_resolver
+    
     def load_profile(self, profile_name: str) -> Profile:
-        """Load a profile specification."""
-        profile_path = self.modular_cv_dir / "profiles" / f"{profile_name}.yaml"
-        
-        if not profile_path.exists():
-            raise FileNotFoundError(f"Profile not found: {profile_path}")
-        
-        with open(profile_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        
-        return Profile.from_dict(data)
+        """Load a profile specification (resolving `extends` and locale overlays)."""
+        return Profile.from_dict(self.profile_resolver.resolve(profile_name))
+    
+    def load_profiles(self) -> Dict[str, Profile]:
+        """Load all profiles, resolved parents-first in one pass."""
+        return {name: Profile.from_dict(data) for name, data in self.profile_resolver.resolve_all().items()}
+    
+    def list_profiles(self) -> List[str]:
+        """List available profile names."""
+        profiles_dir = self.modular_cv_dir / "profiles"
+        return sorted(path.stem for path in profiles_dir.glob("*.yaml"))
     
-    def load_base(self, base_file: str) -> Dict:
-        """Load base CV structure (header, design, locale)."""
+    def load_base(self, base_file: str) -> Mapping:
+        """Load base CV structure (header, design, locale) as an immutable mapping."""
         base_path = self.modular_cv_dir / "base" / base_file
         
         if not base_path.exists():
             raise FileNotFoundError(f"Base file not found: {base_path}")
         
         with open(base_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-
+            return freeze(yaml.safe_load(f))
+    
+    def load_application(self, application_path: Path) -> Application:
+        """Load a single application JSON file."""
+        application_path = Path(application_path)
+        
+        if not application_path.exists():
+            raise FileNotFoundError(f"Application not found: {application_path}")
+        
+        with open(application_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        return Application.from_dict(application_path.stem, data)
+    
+    def load_applications(self, kind: str = "current_application") -> List[Application]:
+        """Load all application JSONs from data/<kind> (skipping template.json)."""
+        applications_dir = self.base_dir / "data" / kind
+        
+        if not applications_dir.exists():
+            return []
+        
+        return [
+            self.load_application(path)
+            for path in sorted(applications_dir.glob("*.json"))
+            if path.name != "template.json"
+        ]
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import date
 
+from cv_builder.utils import compute_item_metadata, item_data_hash
+
 
 @dataclass
 class BilingualText:
@@ -18,6 +20,23 @@ class BilingualText:
 class ItemMetadata:
     """Metadata for CV items."""
     char_count: Dict[str, int] = field(default_factory=dict)
+    # Per-locale length metrics: {locale: {'total': {mode: n}, 'fields': {field: {mode: n} | [{mode: n}, ...]}}}
+    metrics: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    data_hash: Optional[str] = None  # Hash of the `data` the metrics were measured from
+    stale: bool = False              # Sidecar did not match `data`; metrics were measured at load time
+    
+    def total(self, locale: str, mode: str = 'chars') -> Optional[int]:
+        """Precomputed length of the whole item, or None if metrics are missing."""
+        return self.metrics.get(locale, {}).get('total', {}).get(mode)
+    
+    def field_lengths(self, locale: str, name: str, mode: str = 'chars') -> Optional[Any]:
+        """Precomputed length of a field (a list for highlights), or None if missing."""
+        value = self.metrics.get(locale, {}).get('fields', {}).get(name)
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return [entry.get(mode, 0) for entry in value]
+        return value.get(mode)
 
 
 @dataclass
@@ -47,13 +66,24 @@ class CVItem:
     priority: int
     data: Dict[str, Any]
     metadata: ItemMetadata = field(default_factory=ItemMetadata)
-
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'CVItem':
-        """Create CVItem from dictionary."""
-        metadata = ItemMetadata(
-            char_count=data.get('metadata', {}).get('char_count', {})
-        )
+        """
+        Create CVItem from dictionary.
+        
+        Sidecar metrics are only trusted when their `data_hash` matches the
+        item's data; otherwise the text is measured again here.
+        """
+        sidecar = data.get('metadata') or {}
+        if sidecar.get('data_hash') and sidecar['data_hash'] == item_data_hash(data['data']):
+            metadata = ItemMetadata(
+                char_count=sidecar.get('char_count', {}),
+                metrics=sidecar.get('metrics', {}),
+                data_hash=sidecar['data_hash'],
+            )
+        else:
+            metadata = ItemMetadata(**compute_item_metadata(data['data']), stale=bool(sidecar))
         return cls(
             id=data['id'],
             type=data['type'],
@@ -79,14 +109,14 @@ class Profile:
     base_file: str
     sections: Dict[str, SectionSpec]
     output_file: str
-
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Profile':
         """Create Profile from dictionary."""
         sections = {}
         for section_name, section_data in data['sections'].items():
             sections[section_name] = SectionSpec(
-                include_ids=section_data['include_ids'],
+                include_ids=list(section_data['include_ids']),  # Own copy: resolved profiles are memoized
                 max_items=section_data.get('max_items')
             )
         
@@ -98,3 +128,44 @@ class Profile:
             output_file=data['output_file']
         )
 
+
+
+@dataclass
+class Application:
+    """A job application record (data/current_application, data/previous_applications)."""
+    id: str
+    title: str
+    company: str
+    department: str
+    job_title: str
+    date: str
+    job_post: Dict[str, str]
+    initial_application: Dict[str, Any] = field(default_factory=dict)
+    interviews: List[Dict[str, Any]] = field(default_factory=list)
+    meta: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def content(self) -> str:
+        """Job posting text."""
+        return self.job_post.get('content', '') or ''
+    
+    @property
+    def questions(self) -> List[Dict[str, Any]]:
+        """Self-introduction questions (question, answer, optional char_limit)."""
+        return self.initial_application.get('questions_and_answers') or []
+    
+    @classmethod
+    def from_dict(cls, app_id: str, data: Dict[str, Any]) -> 'Application':
+        """Create Application from dictionary."""
+        return cls(
+            id=app_id,
+            title=data.get('title', ''),
+            company=data.get('company', ''),
+            department=data.get('department', ''),
+            job_title=data.get('job_title', ''),
+            date=data.get('date', ''),
+            job_post=data.get('job_post') or {},
+            initial_application=data.get('initial_application') or {},
+            interviews=data.get('interviews') or [],
+            meta=data.get('meta') or {}
+        )
@@ -0,0 +1,296 @@
+"""
+Packed single-file item store.
+
+All items of `modular_cv/cv_items/<type>/*.yaml` and their `.metadata`
+sidecars are stored in one file, so builds open and map a single file
+instead of opening and parsing two YAML files per item. Authoring stays in
+YAML: `pack_items` and `unpack_items` round-trip the directory layout byte
+for byte.
+
+Layout:
+    MAGIC (8 bytes) | header length (uint32 LE) | header (JSON) | records
+    record = length (uint32 LE) | JSON (UTF-8)
+
+The header maps each item ID to its record offset/length and type directory,
+so single items can be read without touching the others, and records the
+size/mtime of every packed source file so a stale pack is noticed with one
+stat per file. Files that were touched but not changed are compared by
+content once, after which their new size/mtime is recorded in the header. Records hold the parsed item and metadata (read with `json`,
+no PyYAML; YAML dates are stored as ISO strings) plus the original YAML
+sources for unpacking.
+"""
+
+import datetime
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cv_builder.models import CVItem
+
+PACK_MAGIC = b"CVPACK1\n"
+PACK_VERSION = 1
+DEFAULT_PACK_FILE = "items.pack"  # Under .cv_cache/ unless a path is given
+_LENGTH = struct.Struct("<I")
+
+
+def _read(path: Path) -> str:
+    # newline="" keeps line endings exactly as authored
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot pack value of type {type(value).__name__}: {value!r}")
+
+
+def _source_hash(*texts: str) -> str:
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _stamp(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _source_stamps(items_dir: Path) -> Dict[str, List[int]]:
+    """[size, mtime_ns] of every item file and sidecar, keyed by path relative to items_dir."""
+    stamps = {}
+    for type_dir in sorted(path for path in Path(items_dir).iterdir() if path.is_dir()):
+        for item_path in sorted(type_dir.glob("*.yaml")):
+            stamps[f"{type_dir.name}/{item_path.name}"] = _stamp(item_path)
+            metadata_path = type_dir / ".metadata" / item_path.name
+            if metadata_path.exists():
+                stamps[f"{type_dir.name}/.metadata/{item_path.name}"] = _stamp(metadata_path)
+    return stamps
+
+
+def pack_items(items_dir: Path, pack_path: Path) -> Dict[str, int]:
+    """
+    Pack every item (and its metadata sidecar) under items_dir into one file.
+    
+    Returns counts of packed items and the pack size in bytes.
+    """
+    import yaml
+    
+    items_dir = Path(items_dir)
+    entries: Dict[str, Tuple[str, bytes]] = {}
+    # Stamped before reading, so an edit made while packing shows up as stale
+    sources = _source_stamps(items_dir)
+    
+    for type_dir in sorted(path for path in items_dir.iterdir() if path.is_dir()):
+        for item_path in sorted(type_dir.glob("*.yaml")):
+            source = _read(item_path)
+            metadata_path = type_dir / ".metadata" / item_path.name
+            metadata_source = _read(metadata_path) if metadata_path.exists() else None
+            
+            item = yaml.safe_load(source)
+            if not isinstance(item, dict) or "id" not in item:
+                raise ValueError(f"Not an item file: {item_path}")
+            if item["id"] in entries:
+                raise ValueError(f"Duplicate item ID '{item['id']}': {item_path}")
+            
+            record = {
+                "type_dir": type_dir.name,
+                "file": item_path.name,
+                "item": item,
+                "metadata": (yaml.safe_load(metadata_source) or {}) if metadata_source else {},
+                "source": source,
+                "metadata_source": metadata_source,
+                "hash": _source_hash(source, metadata_source or ""),
+            }
+            # Unquoted YAML dates/timestamps are stored as ISO strings
+            payload = json.dumps(record, ensure_ascii=False, default=_json_default).encode("utf-8")
+            entries[item["id"]] = (type_dir.name, payload)
+    
+    pack_path = Path(pack_path)
+    _write_pack(pack_path, entries, sources)
+    return {"items": len(entries), "bytes": pack_path.stat().st_size}
+
+
+def _write_pack(pack_path: Path, entries: Dict[str, Tuple[str, bytes]], sources: Dict[str, List[int]]) -> None:
+    """Write records (item ID -> type directory, payload) and the header atomically."""
+    # Offsets are absolute, so they depend on the header size; grow until stable
+    header_len = 0
+    while True:
+        offset = len(PACK_MAGIC) + _LENGTH.size + header_len
+        index = {}
+        for item_id, (type_dir_name, payload) in entries.items():
+            index[item_id] = [offset, len(payload), type_dir_name]
+            offset += _LENGTH.size + len(payload)
+        header = json.dumps(
+            {"version": PACK_VERSION, "items": index, "sources": sources}, ensure_ascii=False
+        ).encode("utf-8")
+        if len(header) == header_len:
+            break
+        header_len = len(header)
+    
+    # Records follow the header in index order
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = pack_path.with_suffix(pack_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(PACK_MAGIC)
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        for _, payload in entries.values():
+            f.write(_LENGTH.pack(len(payload)))
+            f.write(payload)
+    tmp_path.replace(pack_path)
+
+
+class ItemPack:
+    """Read-only, memory-mapped access to a packed item store."""
+    
+    def __init__(self, pack_path: Path):
+        self.path = Path(pack_path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Item pack not found: {self.path}")
+        
+        self._file = open(self.path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data[:len(PACK_MAGIC)] != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"Not an item pack: {self.path}")
+        
+        start = len(PACK_MAGIC)
+        (header_len,) = _LENGTH.unpack_from(self._data, start)
+        header = json.loads(self._data[start + _LENGTH.size:start + _LENGTH.size + header_len])
+        if header.get("version") != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported item pack version {header.get('version')}: {self.path}")
+        self._index: Dict[str, List[Any]] = header["items"]
+        self._sources: Dict[str, List[int]] = header.get("sources", {})
+    
+    def __enter__(self) -> "ItemPack":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._index
+    
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if isinstance(getattr(self, "_data", None), mmap.mmap):
+            self._data.close()
+        self._file.close()
+    
+    def ids(self, type_dirs: Optional[Iterable[str]] = None) -> List[str]:
+        """Item IDs in pack order, optionally limited to some type directories."""
+        wanted = set(type_dirs) if type_dirs is not None else None
+        return [item_id for item_id, (_, _, type_dir) in self._index.items() if wanted is None or type_dir in wanted]
+    
+    def record(self, item_id: str) -> Dict[str, Any]:
+        """Read and decode one record."""
+        offset, length, _ = self._index[item_id]
+        (stored_length,) = _LENGTH.unpack_from(self._data, offset)
+        if stored_length != length:
+            raise ValueError(f"Corrupt item pack record '{item_id}': {self.path}")
+        start = offset + _LENGTH.size
+        return json.loads(self._data[start:start + length])
+    
+    def iter_records(self, type_dirs: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        for item_id in self.ids(type_dirs):
+            yield self.record(item_id)
+    
+    def stale(self, items_dir: Path) -> List[str]:
+        """
+        Source files that differ from the pack (see stale_items).
+        
+        Only stats the files when their size/mtime match the recorded ones;
+        contents are compared only when a stamp differs (e.g. after a checkout).
+        If the contents still match, the new stamps are recorded in the pack
+        (best effort), so touched files are not read again on the next load.
+        """
+        stamps = _source_stamps(items_dir)
+        if self._sources and stamps == self._sources:
+            return []
+        stale = self._stale_by_content(items_dir)
+        if not stale:
+            self._restamp(stamps)
+        return stale
+    
+    def _restamp(self, stamps: Dict[str, List[int]]) -> None:
+        """Rewrite the pack with the same records and new source stamps."""
+        entries = {}
+        for item_id, (offset, length, type_dir) in self._index.items():
+            start = offset + _LENGTH.size
+            entries[item_id] = (type_dir, self._data[start:start + length])
+        try:
+            _write_pack(self.path, entries, stamps)
+        except OSError:
+            return
+        self._sources = stamps
+    
+    def _stale_by_content(self, items_dir: Path) -> List[str]:
+        items_dir = Path(items_dir)
+        packed = {}
+        for item_id in self.ids():
+            record = self.record(item_id)
+            packed[f"{record['type_dir']}/{record['file']}"] = record["hash"]
+        
+        stale = []
+        for type_dir in sorted(path for path in items_dir.iterdir() if path.is_dir()):
+            for item_path in sorted(type_dir.glob("*.yaml")):
+                metadata_path = type_dir / ".metadata" / item_path.name
+                key = f"{type_dir.name}/{item_path.name}"
+                current = _source_hash(_read(item_path), _read(metadata_path) if metadata_path.exists() else "")
+                if packed.pop(key, None) != current:
+                    stale.append(key)
+        return stale + sorted(packed)
+    
+    def load_item(self, item_id: str) -> CVItem:
+        """Load a single item with its metadata."""
+        record = self.record(item_id)
+        return CVItem.from_dict({**record["item"], "metadata": record["metadata"]})
+    
+    def load_items(self, type_dirs: Optional[Iterable[str]] = None) -> Dict[str, CVItem]:
+        """Load items (optionally of some type directories only) like Loader.load_items."""
+        return {item_id: self.load_item(item_id) for item_id in self.ids(type_dirs)}
+
+
+def unpack_items(pack_path: Path, items_dir: Path) -> Dict[str, int]:
+    """
+    Write the packed items back to the YAML layout.
+    
+    Files whose content is already identical are left untouched.
+    Returns counts of written and unchanged files.
+    """
+    stats = {"written": 0, "unchanged": 0}
+    items_dir = Path(items_dir)
+    
+    with ItemPack(pack_path) as pack:
+        for record in pack.iter_records():
+            type_dir = items_dir / record["type_dir"]
+            targets = [(type_dir / record["file"], record["source"])]
+            if record["metadata_source"] is not None:
+                targets.append((type_dir / ".metadata" / record["file"], record["metadata_source"]))
+            
+            for path, text in targets:
+                if path.exists() and _read(path) == text:
+                    stats["unchanged"] += 1
+                    continue
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "w", encoding="utf-8", newline="") as f:
+                    f.write(text)
+                stats["written"] += 1
+    
+    return stats
+
+
+def stale_items(pack_path: Path, items_dir: Path) -> List[str]:
+    """Item files whose YAML (or sidecar) differs from the pack, plus items missing from it."""
+    with ItemPack(pack_path) as pack:
+        return pack._stale_by_content(items_dir)
@@ -0,0 +1,265 @@
+"""
+Profile inheritance and resolution.
+
+A profile may extend another one and only spell out what differs:
+
+    name: meritz-kr
+    extends: full-kr
+    sections:
+      Work Experience:
+        remove_ids: [woori-branch]
+        max_items: 4
+      Projects:
+        add_ids: [qtrsch]
+      Additional Information: null        # drop the section
+    locale_overlays:
+      en: {base_file: base_en.yaml}       # applied when the resolved locale is en
+
+Profiles are resolved parents-first (topological order over `extends`). Each
+result is memoized under a fingerprint of its own file (mtime/size) and its
+parent's fingerprint, so a change re-resolves only the chains below the
+changed file and unchanged files are not even parsed. With `persist=True` the
+memo is also written to `.cv_cache/profiles.json` (best effort) for later
+runs; read-only callers only read it.
+"""
+
+import copy
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CACHE_FILE = "profiles.json"
+CACHE_VERSION = 1
+
+# Per-profile keys that are never inherited from a parent
+OWN_KEYS = ('name', 'output_file')
+SECTION_KEYS = {'include_ids', 'add_ids', 'remove_ids', 'max_items'}
+
+
+def merge_sections(parent: Dict[str, Dict[str, Any]], patch: Dict[str, Any], profile_name: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Apply a sections patch: replace (include_ids), add_ids/remove_ids, max_items,
+    or drop a section with null. New sections are appended in patch order.
+    """
+    sections = {name: dict(spec, include_ids=list(spec['include_ids'])) for name, spec in parent.items()}
+    
+    for name, spec in (patch or {}).items():
+        if spec is None:
+            sections.pop(name, None)
+            continue
+        unknown = set(spec) - SECTION_KEYS
+        if unknown:
+            raise ValueError(f"Profile '{profile_name}' section '{name}' has unknown keys: {', '.join(sorted(unknown))}")
+        
+        section = sections.get(name, {'include_ids': [], 'max_items': None})
+        if 'include_ids' in spec:
+            section['include_ids'] = list(spec['include_ids'] or [])
+        for item_id in spec.get('add_ids') or []:
+            if item_id not in section['include_ids']:
+                section['include_ids'].append(item_id)
+        removed = set(spec.get('remove_ids') or [])
+        section['include_ids'] = [item_id for item_id in section['include_ids'] if item_id not in removed]
+        if 'max_items' in spec:
+            section['max_items'] = spec['max_items']
+        sections[name] = section
+    
+    return sections
+
+
+def apply_patch(profile: Dict[str, Any], patch: Dict[str, Any], profile_name: str) -> Dict[str, Any]:
+    """Apply top-level keys and a sections patch to an unresolved profile dict."""
+    result = dict(profile)
+    for key, value in patch.items():
+        if key in ('extends', 'locale_overlays'):
+            continue
+        if key == 'sections':
+            result['sections'] = merge_sections(result.get('sections', {}), value, profile_name)
+        else:
+            result[key] = value
+    return result
+
+
+def merge_profile(parent: Optional[Dict[str, Any]], raw: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """
+    Merge a profile file over its parent's merged (pre-overlay) state.
+    
+    Locale overlays accumulate parent-first and are only applied in `finalize`.
+    """
+    if parent:
+        inherited = {key: value for key, value in parent.items() if key not in OWN_KEYS}
+        inherited['locale_overlays'] = {
+            locale: [{k: v for k, v in patch.items() if k not in OWN_KEYS} for patch in patches]
+            for locale, patches in parent.get('locale_overlays', {}).items()
+        }
+    else:
+        inherited = {'sections': {}, 'locale_overlays': {}}
+    
+    merged = apply_patch(copy.deepcopy(inherited), raw, name)
+    merged['name'] = raw.get('name', name)
+    for locale, patch in (raw.get('locale_overlays') or {}).items():
+        merged['locale_overlays'].setdefault(locale, []).append(patch)
+    return merged
+
+
+def finalize(merged: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply the overlays of the resolved locale and return a flat profile dict for Profile.from_dict."""
+    flat = {key: value for key, value in merged.items() if key != 'locale_overlays'}
+    for patch in merged.get('locale_overlays', {}).get(flat.get('locale'), []):
+        flat = apply_patch(flat, patch, flat['name'])
+    flat.setdefault('output_file', f"{flat['name']}.yaml")
+    return flat
+
+
+class ProfileResolver:
+    """Resolves profiles with inheritance, memoized per file and parent chain."""
+    
+    def __init__(self, profiles_dir: Path, cache_dir: Optional[Path] = None, persist: bool = False):
+        self.profiles_dir = Path(profiles_dir)
+        self.cache_path = Path(cache_dir) / CACHE_FILE if cache_dir else None
+        self.persist = persist  # Write the memo back after resolving
+        self.stats = {'resolved': 0, 'cached': 0}
+        self._entries: Dict[str, Dict[str, Any]] = self._load_cache()
+        self._dirty = False
+        # Per-pass memos: each file is stat'ed/parsed and each chain resolved once per pass
+        self._pass: Dict[str, Dict[str, Any]] = {}
+        self._sources: Dict[str, Tuple[List[int], Optional[Dict[str, Any]], Optional[str]]] = {}
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('profiles', {}) if data.get('version') == CACHE_VERSION else {}
+    
+    def save(self) -> None:
+        """Persist memoized resolutions (if anything changed); a failed write only loses the memo."""
+        if not self.cache_path or not self._dirty:
+            return
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'profiles': self._entries}, f, ensure_ascii=False)
+            tmp_path.replace(self.cache_path)
+        except OSError:
+            return
+        self._dirty = False
+    
+    def _finish_pass(self) -> None:
+        if self.persist:
+            self.save()
+    
+    def names(self) -> List[str]:
+        return sorted(path.stem for path in self.profiles_dir.glob("*.yaml"))
+    
+    def _signature(self, name: str) -> List[int]:
+        path = self.profiles_dir / f"{name}.yaml"
+        if not path.exists():
+            raise FileNotFoundError(f"Profile not found: {path}")
+        stat = path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+    
+    def _read(self, name: str) -> Dict[str, Any]:
+        import yaml
+        
+        with open(self.profiles_dir / f"{name}.yaml", 'r', encoding='utf-8') as f:
+            raw = yaml.safe_load(f) or {}
+        if not isinstance(raw, dict):
+            raise ValueError(f"Profile '{name}' is not a mapping")
+        return raw
+    
+    def _source(self, name: str) -> Tuple[List[int], Optional[Dict[str, Any]], Optional[str]]:
+        """(signature, raw profile or None if the cached entry is current, parent name)."""
+        if name not in self._sources:
+            signature = self._signature(name)
+            entry = self._entries.get(name)
+            if entry and entry['signature'] == signature:
+                self._sources[name] = (signature, None, entry['extends'])
+            else:
+                raw = self._read(name)
+                self._sources[name] = (signature, raw, raw.get('extends'))
+        return self._sources[name]
+    
+    def _resolve(self, name: str, chain: List[str]) -> Dict[str, Any]:
+        if name in chain:
+            raise ValueError(f"Profile inheritance cycle: {' -> '.join(chain + [name])}")
+        if name in self._pass:
+            return self._pass[name]
+        
+        signature, raw, parent_name = self._source(name)
+        parent = self._resolve(parent_name, chain + [name]) if parent_name else None
+        fingerprint = hashlib.sha1(
+            json.dumps([signature, parent['fingerprint'] if parent else None]).encode('utf-8')
+        ).hexdigest()
+        
+        entry = self._entries.get(name)
+        if entry and entry['fingerprint'] == fingerprint:
+            self.stats['cached'] += 1
+        else:
+            if raw is None:
+                raw = self._read(name)
+            merged = merge_profile(parent['merged'] if parent else None, raw, name)
+            entry = {
+                'signature': signature,
+                'extends': parent_name,
+                'fingerprint': fingerprint,
+                'merged': merged,
+                'resolved': finalize(merged),
+            }
+            self._entries[name] = entry
+            self._dirty = True
+            self.stats['resolved'] += 1
+        
+        self._pass[name] = entry
+        return entry
+    
+    def resolve(self, name: str) -> Dict[str, Any]:
+        """Flat profile dict of one profile (resolving only its parent chain)."""
+        self._pass, self._sources = {}, {}
+        resolved = self._resolve(name, [])['resolved']
+        self._finish_pass()
+        return resolved
+    
+    def resolve_spec(self, raw: Dict[str, Any], name: str = 'adhoc') -> Dict[str, Any]:
+        """Flat profile dict of an unsaved profile spec (which may use `extends`)."""
+        self._pass, self._sources = {}, {}
+        parent = self._resolve(raw['extends'], [name]) if raw.get('extends') else None
+        self._finish_pass()
+        return finalize(merge_profile(parent['merged'] if parent else None, raw, name))
+    
+    def resolve_all(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve every profile in topological order (parents first).
+        
+        Each profile is checked once per pass; `stats` counts re-resolved vs
+        cached profiles.
+        """
+        self._pass, self._sources = {}, {}
+        resolved = {name: self._resolve(name, [])['resolved'] for name in self.topological_order()}
+        self._finish_pass()
+        return resolved
+    
+    def topological_order(self) -> List[str]:
+        """Profile names with every parent before its children (cycles raise ValueError)."""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+        
+        def visit(name: str, chain: List[str]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Profile inheritance cycle: {' -> '.join(chain + [name])}")
+            state[name] = 1
+            _, _, parent = self._source(name)
+            if parent:
+                visit(parent, chain + [name])
+            state[name] = 2
+            order.append(name)
+        
+        for name in self.names():
+            visit(name, [])
+        return order
@@ -0,0 +1,329 @@
+"""
+Resident compose server.
+
+Keeps the item pool, base files and profiles in memory and serves compose,
+validate and stats requests over a minimal HTTP/1.1 interface on localhost or
+a unix socket. Source files are polled for changes and reloaded in place, so
+every request sees the files as they are on disk without paying interpreter
+startup or a full reload.
+
+Endpoints (GET with query parameters or POST with a JSON body):
+    /compose   profile=<name> or {"profile": {...spec...}}, optional "output" path
+               (JSON body only, relative to the project; paths outside it are rejected)
+    /validate  optional profile; item errors are always reported
+    /stats     optional profile; server counters are always reported
+"""
+
+import asyncio
+import io
+import json
+import os
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from cv_builder.composer import Composer
+from cv_builder.document import write_yaml
+from cv_builder.loader import Loader
+from cv_builder.models import CVItem, Profile
+from cv_builder.validator import Validator
+
+HTTP_REASONS = {
+    200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 413: "Payload Too Large",
+    415: "Unsupported Media Type", 422: "Unprocessable Entity", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+MAX_BODY_BYTES = 1024 * 1024
+LOCAL_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+
+class RequestError(Exception):
+    """Error answered with an HTTP status and a JSON body."""
+    
+    def __init__(self, status: int, message: str, errors: Optional[List[str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.errors = errors or []
+
+
+def _signature(directory: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """(path, mtime_ns, size) of every YAML file under a directory, including .metadata."""
+    entries = []
+    for path in sorted(directory.rglob("*.yaml")):
+        stat = path.stat()
+        entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+@dataclass
+class Workspace:
+    """Warm, reloadable state: items, base files and profiles of one project."""
+    loader: Loader
+    validator: Validator = field(default_factory=Validator)
+    items: Dict[str, CVItem] = field(default_factory=dict)
+    item_errors: List[str] = field(default_factory=list)
+    bases: Dict[str, Mapping] = field(default_factory=dict)
+    profiles: Dict[str, Profile] = field(default_factory=dict)
+    reloads: int = 0
+    _signatures: Dict[str, tuple] = field(default_factory=dict)
+    
+    @property
+    def watched(self) -> Dict[str, Path]:
+        root = self.loader.modular_cv_dir
+        return {'items': root / "cv_items", 'base': root / "base", 'profiles': root / "profiles"}
+    
+    def refresh(self) -> List[str]:
+        """Reload whatever changed on disk since the last call; returns the reloaded parts."""
+        reloaded = []
+        for name, directory in self.watched.items():
+            signature = _signature(directory) if directory.exists() else ()
+            if self._signatures.get(name) == signature:
+                continue
+            self._signatures[name] = signature
+            if name == 'items':
+                items = self.loader.load_items()
+                self.items, self.item_errors = items, self.validator.validate_items(items)
+            elif name == 'base':
+                self.bases = {}
+            else:
+                self.profiles = {}
+            reloaded.append(name)
+        
+        if reloaded:
+            self.reloads += 1
+        return reloaded
+    
+    def base(self, base_file: str) -> Mapping:
+        """Shared read-only base, loaded on first use."""
+        if base_file not in self.bases:
+            self.bases[base_file] = self.loader.load_base(base_file)
+        return self.bases[base_file]
+    
+    def profile(self, spec: Any) -> Profile:
+        """Resolve a profile name or an ad-hoc profile spec (same keys as a profile YAML, `extends` allowed)."""
+        if isinstance(spec, str):
+            if spec not in self.profiles:
+                self.profiles[spec] = self.loader.load_profile(spec)
+            return self.profiles[spec]
+        if isinstance(spec, dict):
+            try:
+                data = self.loader.profile_resolver.resolve_spec({'output_file': '', **spec}, spec.get('name', 'adhoc'))
+                return Profile.from_dict(data)
+            except (KeyError, TypeError, AttributeError, ValueError) as e:
+                raise RequestError(400, f"Invalid profile spec: {type(e).__name__}: {e}")
+        raise RequestError(400, "Missing 'profile' (a profile name or a profile spec object)")
+
+
+class ComposeServer:
+    """asyncio HTTP server answering compose/validate/stats from a warm Workspace."""
+    
+    def __init__(self, workspace: Workspace, poll_interval: float = 1.0):
+        self.workspace = workspace
+        self.composer = Composer()
+        self.poll_interval = poll_interval
+        self.started = time.time()
+        self.requests = 0
+        self.latencies = deque(maxlen=1000)  # Recent compose durations (seconds)
+        self.routes = {'/compose': self.compose, '/validate': self.validate, '/stats': self.stats}
+    
+    def compose(self, params: Dict[str, Any]) -> Tuple[int, str, bytes]:
+        start = time.perf_counter()
+        workspace = self.workspace
+        profile = workspace.profile(params.get('profile'))
+        errors = workspace.item_errors + workspace.validator.validate_profile(profile, workspace.items)
+        if errors:
+            raise RequestError(422, "Validation failed", errors)
+        
+        selected = self.composer.select_items(workspace.items, profile)
+        sections = self.composer.build_sections(selected, profile.locale)
+        cv = self.composer.compose_cv(workspace.base(profile.base_file), sections)
+        
+        buffer = io.StringIO()
+        write_yaml(cv, buffer)
+        output = params.get('output')
+        if output:
+            output_path = self.output_path(output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(buffer.getvalue(), encoding='utf-8')
+        
+        self.latencies.append(time.perf_counter() - start)
+        if output:
+            stats = self.composer.calculate_section_stats(selected, profile.locale)
+            return self._json(200, {'output': str(output_path), 'sections': stats})
+        return 200, 'application/yaml; charset=utf-8', buffer.getvalue().encode('utf-8')
+    
+    def output_path(self, output: Any) -> Path:
+        """Resolve a requested output path; it must stay inside the project directory."""
+        base_dir = Path(self.workspace.loader.base_dir).resolve()
+        output_path = (base_dir / str(output)).resolve()
+        if output_path == base_dir or base_dir not in output_path.parents:
+            raise RequestError(403, f"Output path must be inside {base_dir}: {output}")
+        return output_path
+    
+    def validate(self, params: Dict[str, Any]) -> Tuple[int, str, bytes]:
+        workspace = self.workspace
+        profile_errors = []
+        if params.get('profile'):
+            profile = workspace.profile(params['profile'])
+            profile_errors = workspace.validator.validate_profile(profile, workspace.items)
+        return self._json(200, {
+            'valid': not workspace.item_errors and not profile_errors,
+            'items': len(workspace.items),
+            'item_errors': workspace.item_errors,
+            'profile_errors': profile_errors,
+        })
+    
+    def stats(self, params: Dict[str, Any]) -> Tuple[int, str, bytes]:
+        latencies = sorted(self.latencies)
+        result = {
+            'server': {
+                'uptime': round(time.time() - self.started, 1),
+                'requests': self.requests,
+                'reloads': self.workspace.reloads,
+                'items': len(self.workspace.items),
+                'compose_p50_ms': round(statistics.median(latencies) * 1000, 2) if latencies else None,
+                'compose_p95_ms': round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 2) if latencies else None,
+            }
+        }
+        if params.get('profile'):
+            profile = self.workspace.profile(params['profile'])
+            selected = self.composer.select_items(self.workspace.items, profile)
+            result['sections'] = self.composer.calculate_section_stats(selected, profile.locale)
+        return self._json(200, result)
+    
+    @staticmethod
+    def _json(status: int, payload: Dict[str, Any]) -> Tuple[int, str, bytes]:
+        return status, 'application/json; charset=utf-8', json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    
+    def dispatch(self, method: str, target: str, body: bytes,
+                 headers: Optional[Mapping[str, str]] = None) -> Tuple[int, str, bytes]:
+        """Route one request; every error becomes a JSON response."""
+        self.requests += 1
+        url = urlsplit(target)
+        headers = headers or {}
+        try:
+            # Browsers attach Origin to cross-site requests; only local pages and tools may compose
+            origin = headers.get('origin')
+            if origin and urlsplit(origin).hostname not in LOCAL_HOSTS:
+                raise RequestError(403, f"Cross-origin request rejected: {origin}")
+            # A JSON content type cannot be sent by a plain form/fetch without a CORS preflight (never answered)
+            if body and headers.get('content-type', '').split(';')[0].strip().lower() != 'application/json':
+                raise RequestError(415, "POST bodies must be sent as Content-Type: application/json")
+            handler = self.routes.get(url.path)
+            if handler is None or method not in ('GET', 'POST'):
+                raise RequestError(404, f"No route for {method} {url.path}")
+            params: Dict[str, Any] = dict(parse_qsl(url.query))
+            if 'output' in params:
+                # Writing files needs a JSON body, which cross-site pages cannot send without a preflight
+                raise RequestError(400, "'output' must be given in a JSON POST body")
+            if body:
+                try:
+                    params.update(json.loads(body))
+                except (ValueError, TypeError) as e:
+                    raise RequestError(400, f"Invalid JSON body: {e}")
+            return handler(params)
+        except RequestError as e:
+            return self._json(e.status, {'error': str(e), 'errors': e.errors})
+        except FileNotFoundError as e:
+            return self._json(404, {'error': str(e), 'errors': []})
+        except Exception as e:
+            return self._json(500, {'error': f"{type(e).__name__}: {e}", 'errors': []})
+    
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection (keep-alive)."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    writer.write(self._response(*self._json(400, {'error': "Malformed request line"}), False))
+                    break
+                
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    status = 400 if length < 0 else 413
+                    error = "Invalid Content-Length" if length < 0 else f"Body larger than {MAX_BODY_BYTES} bytes"
+                    writer.write(self._response(*self._json(status, {'error': error, 'errors': []}), False))
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b''
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                
+                writer.write(self._response(*self.dispatch(method.upper(), target, body, headers), keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ValueError:
+            # readline() past the stream limit (request line or header line too long)
+            error = {'error': "Request line or header too long", 'errors': []}
+            try:
+                writer.write(self._response(*self._json(431, error), False))
+                await writer.drain()
+            except ConnectionError:
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+    
+    @staticmethod
+    def _response(status: int, content_type: str, payload: bytes, keep_alive: bool) -> bytes:
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode('latin-1') + payload
+    
+    async def watch(self) -> None:
+        """Poll the source files and reload changed parts."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                reloaded = self.workspace.refresh()
+            except Exception as e:
+                print(f"✗ Reload failed: {type(e).__name__}: {e}")
+                continue
+            if reloaded:
+                print(f"↻ Reloaded: {', '.join(reloaded)}")
+    
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, socket_path: Optional[str] = None) -> None:
+        """Load the workspace and serve until cancelled."""
+        self.workspace.refresh()
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            server = await asyncio.start_unix_server(self.handle_connection, path=socket_path)
+            print(f"Serving on unix socket {socket_path}")
+        else:
+            server = await asyncio.start_server(self.handle_connection, host=host, port=port)
+            print(f"Serving on http://{host}:{port}")
+        print(f"  {len(self.workspace.items)} items loaded, {len(self.workspace.item_errors)} item errors")
+        
+        watcher = asyncio.create_task(self.watch())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+            if socket_path and os.path.exists(socket_path):
+                os.unlink(socket_path)
@@ -0,0 +1,269 @@
+"""
+Build snapshots: the exact inputs and output of every generated CV.
+
+Each build records a manifest naming the item versions, resolved profile,
+base file and output it used. Contents are stored once as zlib-compressed,
+content-addressed blobs, so hundreds of snapshots that share most items stay
+small:
+
+    data/snapshots/
+        objects/<aa>/<sha256>         zlib(text)
+        manifests/<snapshot id>.json  <time>_<application or profile>_<output hash>
+
+Snapshots of an application can be listed by its ID (the JSON file stem,
+which stays the same when it moves to previous_applications), re-materialized
+and diffed. The application is part of the snapshot ID, so references are
+resolved from the file names and only the matching manifests are read. A diff compares the item hashes of two manifests and only
+decompresses the blobs that changed.
+"""
+
+import difflib
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from cv_builder.document import write_yaml
+from cv_builder.models import CVItem, Profile
+
+SNAPSHOT_DIR = Path("data") / "snapshots"
+MANIFEST_VERSION = 1
+
+
+def dump_yaml(data: Any) -> str:
+    """Deterministic YAML text (same emitter as the CV outputs)."""
+    stream = io.StringIO()
+    write_yaml(data, stream)
+    return stream.getvalue()
+
+
+def item_source(item: CVItem) -> str:
+    """An item as it is authored (metadata sidecars are derived and not kept)."""
+    return dump_yaml({
+        'id': item.id,
+        'type': item.type,
+        'tags': item.tags,
+        'priority': item.priority,
+        'data': item.data,
+    })
+
+
+def profile_source(profile: Profile) -> str:
+    """The resolved (flat) profile."""
+    return dump_yaml({
+        'name': profile.name,
+        'locale': profile.locale,
+        'base_file': profile.base_file,
+        'sections': {
+            name: {'include_ids': spec.include_ids, 'max_items': spec.max_items}
+            for name, spec in profile.sections.items()
+        },
+    })  # output_file differs per application and is kept in the manifest
+
+
+class SnapshotStore:
+    """Content-addressed blobs plus one manifest per build."""
+    
+    def __init__(self, base_dir: Path, root: Optional[Path] = None):
+        self.base_dir = Path(base_dir)
+        self.root = Path(root) if root else self.base_dir / SNAPSHOT_DIR
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+    
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+    
+    def put_blob(self, text: str) -> str:
+        """Store text once; returns its SHA-256."""
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a unique temp file first so concurrent builds never see partial blobs
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(data, 9))
+            os.replace(tmp_name, path)
+        return digest
+    
+    def get_blob(self, digest: str) -> str:
+        path = self._object_path(digest)
+        if not path.exists():
+            raise FileNotFoundError(f"Snapshot object missing: {digest}")
+        return zlib.decompress(path.read_bytes()).decode('utf-8')
+    
+    def record(self, profile: Profile, selected_items: Dict[str, List[CVItem]], base: Mapping[str, Any],
+               cv: Mapping[str, Any], output_path: Path, application_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Record one build: selected items (per section, in output order), the
+        resolved profile, the base file and the composed output.
+        
+        Returns the manifest (its `id` names the snapshot).
+        """
+        output = dump_yaml(cv)
+        output_hash = self.put_blob(output)
+        created = time.time()
+        label = application_id or profile.name
+        snapshot_id = f"{time.strftime('%Y%m%dT%H%M%S', time.localtime(created))}_{label}_{output_hash[:8]}"
+        
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'id': snapshot_id,
+            'created': created,
+            'application': application_id,
+            'profile_name': profile.name,
+            'locale': profile.locale,
+            'output_file': str(output_path),
+            'output': output_hash,
+            'profile': self.put_blob(profile_source(profile)),
+            'base': {'file': profile.base_file, 'hash': self.put_blob(dump_yaml(base))},
+            'sections': {
+                section: [item.id for item in items] for section, items in selected_items.items()
+            },
+            'items': {
+                item.id: self.put_blob(item_source(item))
+                for items in selected_items.values() for item in items
+            },
+        }
+        
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        path = self.manifests_dir / f"{snapshot_id}.json"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(path)
+        return manifest
+    
+    @staticmethod
+    def _label(path: Path) -> str:
+        """Application ID (or profile name) of a manifest file: `<time>_<label>_<hash8>.json`."""
+        return path.stem[16:-9]
+    
+    def _manifest_paths(self) -> List[Path]:
+        if not self.manifests_dir.exists():
+            return []
+        return sorted(self.manifests_dir.glob("*.json"))
+    
+    def _load(self, paths: List[Path], application_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        manifests = []
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if application_id is None or manifest.get('application') == application_id:
+                manifests.append(manifest)
+        return sorted(manifests, key=lambda manifest: manifest['created'])
+    
+    def list_snapshots(self, application_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Manifests, oldest first, optionally only those of one application."""
+        paths = self._manifest_paths()
+        if application_id is not None:
+            paths = [path for path in paths if self._label(path) == application_id]
+        return self._load(paths, application_id)
+    
+    def get(self, snapshot_id: str) -> Dict[str, Any]:
+        """
+        Manifest by ID, application ID (its latest snapshot), or ID prefix.
+        
+        Only the manifests whose file names match are read.
+        """
+        path = self.manifests_dir / f"{snapshot_id}.json"
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
+        matches = self.list_snapshots(snapshot_id)
+        if not matches:
+            paths = [path for path in self._manifest_paths() if path.stem.startswith(snapshot_id)]
+            if len({self._label(path) for path in paths}) > 1:
+                raise ValueError(f"Ambiguous snapshot '{snapshot_id}': {', '.join(path.stem for path in paths)}")
+            matches = self._load(paths)
+        if not matches:
+            raise FileNotFoundError(f"Snapshot not found: {snapshot_id}")
+        return matches[-1]
+    
+    def materialize(self, snapshot_id: str, output_path: Path, sources_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Write the CV output of a snapshot to output_path.
+        
+        With sources_dir, also write its inputs: profile.yaml, the base file
+        and items/<section>/<id>.yaml.
+        """
+        manifest = self.get(snapshot_id)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(self.get_blob(manifest['output']))
+        
+        if sources_dir is not None:
+            sources_dir = Path(sources_dir)
+            files = {
+                sources_dir / "profile.yaml": manifest['profile'],
+                sources_dir / manifest['base']['file']: manifest['base']['hash'],
+            }
+            for section, item_ids in manifest['sections'].items():
+                for item_id in item_ids:
+                    files[sources_dir / "items" / section / f"{item_id}.yaml"] = manifest['items'][item_id]
+            for path, digest in files.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(self.get_blob(digest))
+        return manifest
+    
+    def diff(self, old_id: str, new_id: str) -> Dict[str, Any]:
+        """
+        Compare two snapshots.
+        
+        Returns added/removed/changed item IDs, section order changes, whether
+        the profile/base/output differ, and unified diffs of the changed blobs
+        only.
+        """
+        old, new = self.get(old_id), self.get(new_id)
+        old_items, new_items = old['items'], new['items']
+        
+        changed = [item_id for item_id in new_items if item_id in old_items and old_items[item_id] != new_items[item_id]]
+        result = {
+            'old': old['id'],
+            'new': new['id'],
+            'added': [item_id for item_id in new_items if item_id not in old_items],
+            'removed': [item_id for item_id in old_items if item_id not in new_items],
+            'changed': changed,
+            'sections': {
+                section: {'old': old['sections'].get(section, []), 'new': new['sections'].get(section, [])}
+                for section in list(old['sections']) + [s for s in new['sections'] if s not in old['sections']]
+                if old['sections'].get(section) != new['sections'].get(section)
+            },
+            'profile_changed': old['profile'] != new['profile'],
+            'base_changed': old['base']['hash'] != new['base']['hash'],
+            'output_changed': old['output'] != new['output'],
+            'diffs': {},
+        }
+        
+        pairs = [(f"items/{item_id}.yaml", old_items[item_id], new_items[item_id]) for item_id in changed]
+        if result['profile_changed']:
+            pairs.append(("profile.yaml", old['profile'], new['profile']))
+        if result['base_changed']:
+            pairs.append((new['base']['file'], old['base']['hash'], new['base']['hash']))
+        for name, old_hash, new_hash in pairs:
+            result['diffs'][name] = ''.join(difflib.unified_diff(
+                self.get_blob(old_hash).splitlines(keepends=True),
+                self.get_blob(new_hash).splitlines(keepends=True),
+                fromfile=f"{old['id']}/{name}",
+                tofile=f"{new['id']}/{name}",
+            ))
+        return result
+    
+    def stats(self) -> Dict[str, int]:
+        """Number of snapshots and objects, and the on-disk size of the objects."""
+        objects = [path for path in self.objects_dir.glob("*/*") if not path.name.startswith(".tmp-")] \
+            if self.objects_dir.exists() else []
+        return {
+            'snapshots': len(list(self.manifests_dir.glob("*.json"))) if self.manifests_dir.exists() else 0,
+            'objects': len(objects),
+            'bytes': sum(path.stat().st_size for path in objects),
+        }
@@ -1,10 +1,147 @@
 """
 Utility functions for CV builder.
+
+PyYAML is imported inside the functions that read or write YAML, so the
+counting helpers stay cheap to import.
 """
 
-import yaml
+import hashlib
+import json
+import unicodedata
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Union
+
+CACHE_DIR_NAME = ".cv_cache"
+
+LOCALES = ('en', 'kr')
+
+# Length conventions used by application forms, plus the rendered display width
+COUNT_MODES = ('chars', 'chars_no_spaces', 'utf8_bytes', 'euckr_bytes', 'display_width')
+
+
+def get_cache_dir(base_dir: Path, *parts: str) -> Path:
+    """
+    Get (and create) a cache directory for generated artifacts.
+    
+    Example:
+        get_cache_dir(base_dir, "corpus") -> base_dir/.cv_cache/corpus
+    """
+    cache_dir = Path(base_dir) / CACHE_DIR_NAME
+    for part in parts:
+        cache_dir = cache_dir / part
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def detect_locale(text: str, threshold: float = 0.3) -> str:
+    """
+    Detect the locale ('kr' or 'en') of a text from its share of Hangul letters.
+    """
+    hangul = sum(1 for ch in text if '\uac00' <= ch <= '\ud7a3')
+    latin = sum(1 for ch in text if ch.isascii() and ch.isalpha())
+    
+    if hangul + latin == 0:
+        return 'en'
+    
+    return 'kr' if hangul / (hangul + latin) >= threshold else 'en'
+
+
+def calculate_text_metrics(text: str) -> Dict[str, int]:
+    """
+    Measure text under every count mode in a single pass.
+    
+    Modes:
+        chars           - characters including spaces/newlines (len)
+        chars_no_spaces - characters excluding whitespace
+        utf8_bytes      - UTF-8 bytes (Hangul = 3 bytes)
+        euckr_bytes     - EUC-KR style bytes (ASCII = 1, Hangul and other = 2)
+        display_width   - terminal/typeset columns (CJK wide = 2, combining and control = 0)
+    """
+    no_spaces = utf8_bytes = euckr_bytes = width = 0
+    
+    for ch in text:
+        code = ord(ch)
+        if not ch.isspace():
+            no_spaces += 1
+        
+        if code < 0x80:
+            utf8_bytes += 1
+            euckr_bytes += 1
+            width += 1 if code >= 0x20 and code != 0x7f else 0
+            continue
+        
+        utf8_bytes += 2 if code < 0x800 else 3 if code < 0x10000 else 4
+        euckr_bytes += 2
+        if code < 0xa0 or unicodedata.combining(ch):
+            continue  # C1 control or combining mark
+        width += 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+    
+    return {
+        'chars': len(text),
+        'chars_no_spaces': no_spaces,
+        'utf8_bytes': utf8_bytes,
+        'euckr_bytes': euckr_bytes,
+        'display_width': width,
+    }
+
+
+def count_text(text: str, mode: str = 'chars') -> int:
+    """
+    Count the length of text under a form's counting convention.
+    
+    See `calculate_text_metrics` for the available modes.
+    """
+    if mode not in COUNT_MODES:
+        raise ValueError(f"Unknown count mode: {mode} (expected one of {', '.join(COUNT_MODES)})")
+    if mode == 'chars':
+        return len(text)
+    return calculate_text_metrics(text)[mode]
+
+
+def sum_metrics(metrics: List[Dict[str, int]]) -> Dict[str, int]:
+    """Add up metric dicts mode by mode."""
+    return {mode: sum(m.get(mode, 0) for m in metrics) for mode in COUNT_MODES}
+
+
+def calculate_item_metrics(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Precompute length metrics of an item's `data` for every locale it has text in.
+    
+    Top-level bilingual fields get one metrics dict each and lists of bilingual
+    fields (highlights) get one per entry, so a selection can be measured by
+    adding up stored numbers.
+    
+    Example:
+        {'kr': {'total': {...}, 'fields': {'company': {...}, 'highlights': [{...}, {...}]}}}
+    """
+    result = {}
+    
+    for locale in LOCALES:
+        fields: Dict[str, Union[Dict[str, int], List[Dict[str, int]]]] = {}
+        parts = []
+        
+        for key, value in data.items():
+            if _is_bilingual(value):
+                if value.get(locale):
+                    fields[key] = calculate_text_metrics(value[locale])
+                    parts.append(fields[key])
+            elif isinstance(value, list) and any(_is_bilingual(v) for v in value):
+                entries = [
+                    calculate_text_metrics(v.get(locale) or '') if _is_bilingual(v) else sum_metrics([])
+                    for v in value
+                ]
+                if any(entry['chars'] for entry in entries):
+                    fields[key] = entries
+                    parts.extend(entries)
+        
+        if fields:
+            result[locale] = {'total': sum_metrics(parts), 'fields': fields}
+    
+    return result
+
+
+def _is_bilingual(value: Any) -> bool:
+    return isinstance(value, dict) and bool(value) and set(value) <= set(LOCALES)
 
 
 def calculate_char_count(data: Dict[str, Any], locale: str) -> int:
@@ -16,8 +153,8 @@ def calculate_char_count(data: Dict[str, Any], locale: str) -> int:
     total_chars = 0
     
     if isinstance(data, dict):
-        # Check if this is a bilingual field
-        if 'en' in data and 'kr' in data:
+        # Check if this is a bilingual (or single-locale) text field
+        if _is_bilingual(data):
             text = data.get(locale, '')
             total_chars += len(text) if text else 0
         else:
@@ -50,6 +187,8 @@ def load_item_metadata(item_path: Path) -> Dict[str, Any]:
     if not metadata_path.exists():
         return {}
     
+    import yaml
+    
     with open(metadata_path, 'r', encoding='utf-8') as f:
         return yaml.safe_load(f) or {}
 
@@ -57,23 +196,52 @@ def load_item_metadata(item_path: Path) -> Dict[str, Any]:
 def save_item_metadata(item_path: Path, metadata: Dict[str, Any]) -> None:
     """
     Save metadata for an item.
+    
+    Mappings of plain values (char counts, metrics) are written in flow style.
     """
     metadata_path = get_metadata_path(item_path)
     
+    import yaml
+    
     # Create .metadata directory if it doesn't exist
     metadata_path.parent.mkdir(exist_ok=True)
     
     with open(metadata_path, 'w', encoding='utf-8') as f:
-        yaml.dump(metadata, f, allow_unicode=True, sort_keys=False, width=120)
+        yaml.dump(metadata, f, allow_unicode=True, sort_keys=False, width=120, default_flow_style=None)
+
 
+def item_data_hash(item_data: Dict[str, Any]) -> str:
+    """Short content hash of an item's `data`, recorded in its metadata to detect stale metrics."""
+    payload = json.dumps(item_data, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
 
-def update_item_char_counts(item_path: Path) -> bool:
+
+def compute_item_metadata(item_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Update character counts for an item file.
+    Compute the auto-generated metadata of an item from its `data`.
     
-    Reads the item, calculates char counts, and saves to separate metadata file.
-    Returns True if changes were made, False otherwise.
+    `data_hash` identifies the content the metrics were measured from;
+    `char_count` keeps the per-locale character totals; `metrics` holds every
+    count mode per field and per highlight.
+    """
+    metrics = calculate_item_metrics(item_data)
+    return {
+        'data_hash': item_data_hash(item_data),
+        'char_count': {locale: metrics.get(locale, {}).get('total', {}).get('chars', 0) for locale in LOCALES},
+        'metrics': metrics,
+    }
+
+
+def update_item_char_counts(item_path: Path, check: bool = False) -> bool:
     """
+    Update character counts and length metrics for an item file.
+    
+    Reads the item, calculates its metadata, and saves to separate metadata file.
+    With check=True nothing is written.
+    Returns True if the metadata was (or would be) changed, False otherwise.
+    """
+    import yaml
+    
     # Load item
     with open(item_path, 'r', encoding='utf-8') as f:
         item_data = yaml.safe_load(f)
@@ -81,45 +249,35 @@ def update_item_char_counts(item_path: Path) -> bool:
     if 'data' not in item_data:
         return False
     
-    # Calculate character counts
-    en_count = calculate_char_count(item_data['data'], 'en')
-    kr_count = calculate_char_count(item_data['data'], 'kr')
+    computed = compute_item_metadata(item_data['data'])
     
     # Load existing metadata
     metadata = load_item_metadata(item_path)
     
     # Check if update is needed
-    current_en = metadata.get('char_count', {}).get('en', 0)
-    current_kr = metadata.get('char_count', {}).get('kr', 0)
-    
-    if current_en == en_count and current_kr == kr_count:
+    if all(metadata.get(key) == value for key, value in computed.items()):
         return False  # No change needed
     
-    # Update metadata
-    if 'char_count' not in metadata:
-        metadata['char_count'] = {}
-    
-    metadata['char_count']['en'] = en_count
-    metadata['char_count']['kr'] = kr_count
-    
-    # Save metadata
-    save_item_metadata(item_path, metadata)
+    if not check:
+        metadata.update(computed)
+        save_item_metadata(item_path, metadata)
     
     return True
 
 
-def update_all_char_counts(base_dir: Path = None) -> Dict[str, int]:
+def update_all_char_counts(base_dir: Path = None, check: bool = False) -> Dict[str, int]:
     """
-    Update character counts for all items.
+    Update character counts and length metrics for all items.
     
-    Returns a dict with counts of updated/unchanged files.
+    With check=True only reports stale or orphaned metadata without writing.
+    Returns a dict with counts of updated/unchanged/orphaned files.
     """
     if base_dir is None:
         base_dir = Path(__file__).parent.parent
     
     items_dir = base_dir / "modular_cv" / "cv_items"
     
-    stats = {'updated': 0, 'unchanged': 0, 'errors': 0}
+    stats = {'updated': 0, 'unchanged': 0, 'orphaned': 0, 'errors': 0}
     
     for item_type_dir in items_dir.iterdir():
         if not item_type_dir.is_dir():
@@ -127,8 +285,8 @@ def update_all_char_counts(base_dir: Path = None) -> Dict[str, int]:
         
         for yaml_file in item_type_dir.glob("*.yaml"):
             try:
-                if update_item_char_counts(yaml_file):
-                    print(f"✓ Updated: {yaml_file.relative_to(base_dir)}")
+                if update_item_char_counts(yaml_file, check=check):
+                    print(f"{'✗ Stale' if check else '✓ Updated'}: {yaml_file.relative_to(base_dir)}")
                     stats['updated'] += 1
                 else:
                     print(f"  No change: {yaml_file.relative_to(base_dir)}")
@@ -136,5 +294,11 @@ def update_all_char_counts(base_dir: Path = None) -> Dict[str, int]:
             except Exception as e:
                 print(f"✗ Error: {yaml_file.relative_to(base_dir)} - {e}")
                 stats['errors'] += 1
+        
+        # Metadata files whose item no longer exists
+        for metadata_file in (item_type_dir / ".metadata").glob("*.yaml"):
+            if not (item_type_dir / metadata_file.name).exists():
+                print(f"✗ Orphaned metadata: {metadata_file.relative_to(base_dir)}")
+                stats['orphaned'] += 1
     
     return stats
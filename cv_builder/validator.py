@@ -177,6 +177,25 @@ class Validator:
         
         return errors
     
+    def validate_answer_block(self, item: CVItem) -> List[str]:
+        """Validate answer block item (Korean-only blocks are allowed)."""
+        errors = []
+        data = item.data
+        
+        # Required fields
+        if 'text' not in data:
+            errors.append(f"Answer block '{item.id}' missing required field: text")
+        elif not isinstance(data['text'], dict) or not any(data['text'].get(locale) for locale in ('en', 'kr')):
+            errors.append(f"Answer block '{item.id}' text must have an 'en' or 'kr' value")
+        
+        if 'title' in data and not isinstance(data['title'], dict):
+            errors.append(f"{item.id}.title must be a dictionary with 'en' and/or 'kr' keys")
+        
+        if 'topics' in data and not isinstance(data['topics'], list):
+            errors.append(f"Answer block '{item.id}' topics must be a list")
+        
+        return errors
+    
     def validate_items(self, items: Dict[str, CVItem]) -> List[str]:
         """Validate all CV items."""
         errors = []
@@ -198,6 +217,8 @@ class Validator:
                 errors.extend(self.validate_education(item))
             elif item.type == 'additional_info':
                 errors.extend(self.validate_additional_info(item))
+            elif item.type == 'answer_block':
+                errors.extend(self.validate_answer_block(item))
             else:
                 errors.append(f"Unknown item type: {item.type} for item {item.id}")
         
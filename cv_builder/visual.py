@@ -0,0 +1,259 @@
+"""
+Visual regression check of rendered CV pages.
+
+Each page PNG (`rendercv_output/*_1.png`, `build/applications/*/..._2.png`, ...)
+is reduced to a fingerprint: a 64-bit difference hash (dHash) and a
+grayscale thumbnail of fixed size. Fingerprints are cached by file size and
+mtime in `.cv_cache/visual/fingerprints.npz`. The accepted state of every page
+is kept in `modular_cv/visual_baseline.npz`, a tracked file committed with the
+theme and items it was approved for.
+
+Comparing a batch against the baseline is a handful of array operations over
+all pages at once: Hamming distances of the hashes, and the mean and
+changed-pixel fraction of the thumbnail differences. Only pages beyond the
+thresholds are reported.
+
+PNGs are decoded with PyMuPDF (imported when pages are fingerprinted).
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cv_builder.utils import get_cache_dir
+
+THUMB_SHAPE = (362, 256)  # (height, width), A4 aspect
+HASH_SHAPE = (8, 9)       # dHash: 8 rows of 9 columns -> 64 bits
+FINGERPRINTS_FILE = "fingerprints.npz"
+DEFAULT_BASELINE = Path("modular_cv") / "visual_baseline.npz"  # Relative to base_dir
+
+_PAGE = re.compile(r"_\d+\.png$")
+
+
+def load_gray(path: Path) -> np.ndarray:
+    """Decode a PNG into a 2-D uint8 grayscale array."""
+    import fitz  # PyMuPDF
+    
+    pixmap = fitz.Pixmap(str(path))
+    if pixmap.alpha:
+        pixmap = fitz.Pixmap(pixmap, 0)
+    if pixmap.n != 1:
+        pixmap = fitz.Pixmap(fitz.csGRAY, pixmap)
+    rows = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(pixmap.height, pixmap.stride)
+    return rows[:, :pixmap.width].copy()
+
+
+def resize_area(image: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+    """Area-average resize of a 2-D array (nearest rows/columns when upscaling)."""
+    image = image.astype(np.float64)
+    for axis, target in enumerate(shape):
+        size = image.shape[axis]
+        if size >= target:
+            edges = np.linspace(0, size, target + 1).astype(int)
+            counts = np.diff(edges).reshape((-1, 1) if axis == 0 else (1, -1))
+            image = np.add.reduceat(image, edges[:-1], axis=axis) / counts
+        else:
+            image = np.take(image, np.arange(target) * size // target, axis=axis)
+    return image
+
+
+def dhash(gray: np.ndarray) -> np.uint64:
+    """64-bit difference hash: is each cell brighter than its right neighbour."""
+    small = resize_area(gray, HASH_SHAPE)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return np.uint64(int(np.packbits(bits).view('>u8')[0]))
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    """Number of set bits of each uint64."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values).astype(np.int64)
+    return np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+@dataclass
+class Fingerprints:
+    """Fingerprints of a set of pages as parallel arrays."""
+    keys: np.ndarray    # str: page path relative to the project
+    hashes: np.ndarray  # uint64 dHash
+    thumbs: np.ndarray  # uint8 (pages, *THUMB_SHAPE)
+    dims: np.ndarray    # int (pages, 2): original height, width
+    stamps: np.ndarray  # int (pages, 2): file size, mtime_ns
+    
+    @classmethod
+    def empty(cls) -> 'Fingerprints':
+        return cls(
+            keys=np.array([], dtype=str),
+            hashes=np.array([], dtype=np.uint64),
+            thumbs=np.zeros((0,) + THUMB_SHAPE, dtype=np.uint8),
+            dims=np.zeros((0, 2), dtype=np.int64),
+            stamps=np.zeros((0, 2), dtype=np.int64),
+        )
+    
+    @classmethod
+    def load(cls, path: Path) -> 'Fingerprints':
+        if not Path(path).exists():
+            return cls.empty()
+        with np.load(path) as data:
+            if data['thumbs'].shape[1:] != THUMB_SHAPE:
+                return cls.empty()
+            return cls(**{name: data[name] for name in ('keys', 'hashes', 'thumbs', 'dims', 'stamps')})
+    
+    def save(self, path: Path) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(path).with_suffix(".tmp.npz")
+        np.savez_compressed(tmp_path, keys=self.keys, hashes=self.hashes, thumbs=self.thumbs,
+                            dims=self.dims, stamps=self.stamps)
+        tmp_path.replace(path)
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def index(self) -> Dict[str, int]:
+        return {str(key): i for i, key in enumerate(self.keys)}
+    
+    def select(self, rows: Sequence[int]) -> 'Fingerprints':
+        rows = np.asarray(rows, dtype=np.intp)
+        return Fingerprints(self.keys[rows], self.hashes[rows], self.thumbs[rows], self.dims[rows], self.stamps[rows])
+    
+    @staticmethod
+    def concat(parts: List['Fingerprints']) -> 'Fingerprints':
+        parts = [part for part in parts if len(part)] or [Fingerprints.empty()]
+        return Fingerprints(*(np.concatenate([getattr(part, name) for part in parts])
+                              for name in ('keys', 'hashes', 'thumbs', 'dims', 'stamps')))
+
+
+@dataclass
+class PageDiff:
+    """Comparison of one page with its baseline."""
+    key: str
+    status: str                      # changed, new, missing
+    hash_distance: int = 0           # Hamming distance of the dHashes (0-64)
+    mean_diff: float = 0.0           # Mean absolute thumbnail difference (0-1)
+    changed_ratio: float = 0.0       # Fraction of thumbnail pixels differing by more than pixel_delta
+    region: Optional[Tuple[float, float]] = None  # Vertical extent of the changes (fractions of the page)
+
+
+class VisualRegression:
+    """Fingerprints rendered pages and compares them with the approved baseline."""
+    
+    def __init__(self, base_dir: Path, threshold: float = 0.002, hash_threshold: int = 6, pixel_delta: int = 32,
+                 baseline_path: Optional[Path] = None):
+        self.base_dir = Path(base_dir)
+        self.cache_dir = get_cache_dir(self.base_dir, "visual")  # Fingerprint cache only
+        self.baseline_path = self.base_dir / (baseline_path or DEFAULT_BASELINE)
+        self.threshold = threshold            # changed_ratio above which a page is flagged
+        self.hash_threshold = hash_threshold  # dHash distance above which a page is flagged
+        self.pixel_delta = pixel_delta        # Gray levels below which a pixel difference is ignored
+        self.stats = {'fingerprinted': 0, 'cached': 0}
+    
+    def find_pages(self, directories: Iterable[Path]) -> List[Path]:
+        """Page PNGs (`<name>_<page>.png`) under the directories."""
+        pages = []
+        for directory in directories:
+            directory = Path(directory)
+            if directory.is_dir():
+                pages += [path for path in sorted(directory.rglob("*.png")) if _PAGE.search(path.name)]
+        return pages
+    
+    def key(self, path: Path) -> str:
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(self.base_dir.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+    
+    def fingerprint(self, pages: List[Path]) -> Fingerprints:
+        """Fingerprints of the pages, decoding only files whose size or mtime changed."""
+        self.stats = {'fingerprinted': 0, 'cached': 0}
+        cache_path = self.cache_dir / FINGERPRINTS_FILE
+        cache = Fingerprints.load(cache_path)
+        cached = cache.index()
+        
+        reused, fresh = [], []
+        for path in pages:
+            stat = path.stat()
+            key = self.key(path)
+            row = cached.get(key)
+            if row is not None and tuple(cache.stamps[row]) == (stat.st_size, stat.st_mtime_ns):
+                reused.append(row)
+                self.stats['cached'] += 1
+                continue
+            gray = load_gray(path)
+            fresh.append(Fingerprints(
+                keys=np.array([key]),
+                hashes=np.array([dhash(gray)], dtype=np.uint64),
+                thumbs=np.clip(np.rint(resize_area(gray, THUMB_SHAPE)), 0, 255).astype(np.uint8)[None],
+                dims=np.array([gray.shape], dtype=np.int64),
+                stamps=np.array([[stat.st_size, stat.st_mtime_ns]], dtype=np.int64),
+            ))
+            self.stats['fingerprinted'] += 1
+        
+        current = Fingerprints.concat([cache.select(reused)] + fresh)
+        # Keep cached pages of other directories too, but drop pages that were deleted
+        current_keys = set(current.keys.tolist())
+        others = [row for key, row in cached.items() if key not in current_keys]
+        kept = [row for row in others if (self.base_dir / str(cache.keys[row])).exists()]
+        if fresh or len(kept) < len(others):
+            Fingerprints.concat([cache.select(kept), current]).save(cache_path)
+        return current
+    
+    def baseline(self) -> Fingerprints:
+        """The approved fingerprints (empty if nothing was approved yet, see has_baseline)."""
+        return Fingerprints.load(self.baseline_path)
+    
+    def has_baseline(self) -> bool:
+        return self.baseline_path.exists()
+    
+    def approve(self, current: Fingerprints, keys: Optional[Iterable[str]] = None) -> int:
+        """Make the current fingerprints (or only some pages) the baseline; returns the number approved."""
+        rows = range(len(current)) if keys is None else [current.index()[key] for key in keys]
+        approved = current.select(list(rows))
+        baseline = self.baseline()
+        replaced = set(approved.keys.tolist())
+        kept = [row for key, row in baseline.index().items() if key not in replaced]
+        Fingerprints.concat([baseline.select(kept), approved]).save(self.baseline_path)
+        return len(approved)
+    
+    def compare(self, current: Fingerprints, baseline: Fingerprints,
+                prefixes: Optional[Sequence[str]] = None) -> List[PageDiff]:
+        """
+        Pages that changed beyond the thresholds, are new, or are missing
+        (baseline pages under one of `prefixes` that were not rendered).
+        """
+        baseline_rows = baseline.index()
+        pairs = [(i, baseline_rows[str(key)]) for i, key in enumerate(current.keys) if str(key) in baseline_rows]
+        diffs = [PageDiff(str(key), 'new') for key in current.keys if str(key) not in baseline_rows]
+        
+        if pairs:
+            cur_rows, base_rows = (np.array(rows, dtype=np.intp) for rows in zip(*pairs))
+            distance = popcount(current.hashes[cur_rows] ^ baseline.hashes[base_rows])
+            delta = np.abs(current.thumbs[cur_rows].astype(np.int16) - baseline.thumbs[base_rows].astype(np.int16))
+            mean_diff = delta.mean(axis=(1, 2)) / 255
+            changed_pixels = delta > self.pixel_delta
+            changed_ratio = changed_pixels.mean(axis=(1, 2))
+            resized = (current.dims[cur_rows] != baseline.dims[base_rows]).any(axis=1)
+            
+            flagged = (changed_ratio > self.threshold) | (distance > self.hash_threshold) | resized
+            for k in np.flatnonzero(flagged):
+                rows = np.flatnonzero(changed_pixels[k].any(axis=1))
+                region = (float(rows[0] / THUMB_SHAPE[0]), float((rows[-1] + 1) / THUMB_SHAPE[0])) if len(rows) else None
+                diffs.append(PageDiff(
+                    key=str(current.keys[cur_rows[k]]),
+                    status='changed',
+                    hash_distance=int(distance[k]),
+                    mean_diff=float(mean_diff[k]),
+                    changed_ratio=float(changed_ratio[k]),
+                    region=region,
+                ))
+        
+        if prefixes is not None:
+            rendered = set(current.keys.tolist())
+            diffs += [
+                PageDiff(key, 'missing') for key in baseline_rows
+                if key not in rendered and any(key.startswith(prefix) for prefix in prefixes)
+            ]
+        return sorted(diffs, key=lambda diff: diff.key)
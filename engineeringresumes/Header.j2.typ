@@ -5,7 +5,7 @@
   left-content: [
     #align(
       left + horizon,
-      image("profile_picture.svg", width: design-header-photo-width),
+      image("<<cv.photo.name>>", width: design-header-photo-width),
     )
   ],
   column-gutter: 0cm,
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Pass rates of past applications per company, year, CV item, item tag, answer
+block and answer length.
+
+Outcomes come from `initial_application.result` (document stage) and
+`interviews[].result` (interview stage); the items sent for an application come
+from its latest build snapshot (see scripts/snapshots.py).
+
+Usage:
+    poetry run python scripts/analyze_outcomes.py
+    poetry run python scripts/analyze_outcomes.py --by item --by tag --stage interview --min-decided 3
+    poetry run python scripts/analyze_outcomes.py --kind previous_applications --kind current_application
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.analytics import GROUPINGS, STAGES, OutcomeAnalytics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze application outcomes")
+    parser.add_argument(
+        "--by",
+        action="append",
+        choices=GROUPINGS,
+        help="Grouping (repeatable, default: all)"
+    )
+    parser.add_argument(
+        "--stage",
+        choices=STAGES,
+        default="document",
+        help="Outcome stage (default: document)"
+    )
+    parser.add_argument(
+        "--kind",
+        action="append",
+        help="Application directory under data/ (repeatable, default: previous_applications)"
+    )
+    parser.add_argument(
+        "--min-decided",
+        type=int,
+        default=1,
+        help="Hide groups with fewer decided applications (default: 1)"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    analytics = OutcomeAnalytics(base_dir, kinds=args.kind or ['previous_applications'])
+    
+    start = time.perf_counter()
+    table = analytics.load()
+    elapsed = time.perf_counter() - start
+    
+    for by in args.by or GROUPINGS:
+        rows = [row for row in table.pass_rates(by, args.stage) if row['decided'] >= args.min_decided]
+        print(f"\n{'-'*60}")
+        print(f"By {by} ({args.stage} stage):")
+        if not rows:
+            note = " (items/tags need build snapshots)" if by in ('item', 'tag') else ""
+            print(f"  no decided applications{note}")
+        for row in rows:
+            print(f"  {row['key']}: {row['passed']}/{row['decided']} passed ({row['rate']:.0%}), "
+                  f"{row['applications']} applications")
+    
+    print(f"\n{'='*60}")
+    print(f"  Applications: {len(table)} ({int(table.has_snapshot.sum())} with snapshots)")
+    print(f"  Files parsed: {analytics.stats['parsed']}, cached: {analytics.stats['cached']}")
+    print(f"  Load time: {elapsed * 1000:.1f} ms")
+    print(f"{'='*60}")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
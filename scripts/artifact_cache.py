@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Inspect and maintain the content-addressed render artifact cache.
+
+Renders made with `cv_builder.cli --render` or `build_applications.py --render`
+are stored under .cv_cache/artifacts/ keyed by the composed CV and the theme
+template; identical CVs are linked from there instead of being re-rendered.
+The photo rasterized for those renders is kept in .cv_cache/assets/.
+
+Usage:
+    poetry run python scripts/artifact_cache.py stats
+    poetry run python scripts/artifact_cache.py prune --max-mb 200
+    poetry run python scripts/artifact_cache.py clear
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.artifacts import DEFAULT_MAX_BYTES, ArtifactStore
+from cv_builder.assets import AssetCache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and maintain the render artifact cache")
+    parser.add_argument(
+        "command",
+        choices=["stats", "prune", "clear"],
+        help="stats: show cache statistics, prune: evict LRU entries beyond the cap, clear: remove everything (including prepared assets)"
+    )
+    parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        help=f"Size cap in MB for prune (default: {DEFAULT_MAX_BYTES // (1024 * 1024)})"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    store = ArtifactStore(base_dir, max_bytes=int(args.max_mb * 1024 * 1024))
+    assets = AssetCache(base_dir)
+    
+    if args.command == "prune":
+        evicted = store.evict()
+        print(f"Evicted {evicted} entries")
+    elif args.command == "clear":
+        store.clear()
+        assets.clear()
+        print(f"Cleared {store.root} and {assets.root}")
+    
+    stats = store.stats()
+    print(f"\n{'='*60}")
+    print(f"  Entries: {stats['entries']}")
+    print(f"  Size: {stats['bytes'] / (1024 * 1024):.1f} MB (cap {stats['max_bytes'] / (1024 * 1024):.0f} MB)")
+    print(f"  Hits: {stats['hits']}")
+    print(f"  Misses: {stats['misses']}")
+    print(f"  Hit rate: {stats['hit_rate']:.0%}")
+    print(f"  Evictions: {stats['evictions']}")
+    asset_stats = assets.disk_stats()
+    print(f"  Prepared assets: {asset_stats['files']} ({asset_stats['bytes'] / 1024:.1f} KB)")
+    print(f"{'='*60}")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
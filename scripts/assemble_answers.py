@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Assemble draft self-introduction answers from reusable answer blocks.
+
+Fills every question of an application JSON from modular_cv/cv_items/answer_blocks
+under each question's length limit.
+
+Usage:
+    poetry run python scripts/assemble_answers.py data/current_application/2025-10-25_유안타증권.json
+    poetry run python scripts/assemble_answers.py APPLICATION.json --count-mode chars_no_spaces --output filled.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.answers import AnswerAssembler
+from cv_builder.loader import Loader
+from cv_builder.utils import COUNT_MODES
+from cv_builder.validator import Validator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assemble draft answers from reusable answer blocks")
+    parser.add_argument(
+        "application",
+        help="Application JSON file"
+    )
+    parser.add_argument(
+        "--count-mode",
+        choices=COUNT_MODES,
+        help="Length convention of the form (default: meta.count_mode or 'chars')"
+    )
+    parser.add_argument(
+        "--locale",
+        default="kr",
+        help="Locale of the answer blocks to use (default: kr)"
+    )
+    parser.add_argument(
+        "--output",
+        help="Write a copy of the application JSON with empty answers filled in"
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="With --output, also replace existing answers"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    loader = Loader(base_dir=base_dir)
+    
+    application_path = Path(args.application)
+    application = loader.load_application(application_path)
+    blocks = loader.load_answer_blocks()
+    
+    errors = Validator().validate_items(blocks)
+    if errors:
+        print("\n❌ Answer block validation errors:")
+        for error in errors:
+            print(f"  - {error}")
+        return 1
+    
+    count_mode = args.count_mode or application.meta.get('count_mode', 'chars')
+    assembler = AnswerAssembler(blocks, locale=args.locale, count_mode=count_mode)
+    drafts = assembler.assemble(application)
+    
+    print(f"{application.title} ({len(blocks)} blocks, counting: {count_mode})")
+    for i, draft in enumerate(drafts, start=1):
+        limit = f"{draft.min_chars or 0}-{draft.max_chars}" if draft.max_chars else "no limit"
+        print(f"\n{'-'*60}")
+        print(f"Q{i}. {draft.question}")
+        print(f"    limit: {limit}, length: {draft.length}, status: {draft.status}")
+        print(f"    blocks: {', '.join(draft.blocks) if draft.blocks else '-'}")
+        if draft.text:
+            print(f"\n{draft.text}")
+    
+    if args.output:
+        with open(application_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for question, draft in zip(data['initial_application']['questions_and_answers'], drafts):
+            if draft.text and (args.overwrite or not question.get('answer')):
+                question['answer'] = draft.text
+                question['answer_blocks'] = draft.blocks  # Used by scripts/analyze_outcomes.py
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"\n✓ Drafts written to {args.output}")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Audit en/kr translation alignment of all bilingual CV items.
+
+Flags pairs whose numbers, dates or URLs differ, whose kr text has Latin
+tokens missing from en, whose length ratio is an outlier, and highlights that
+match another highlight of the other language better than their own.
+
+Usage:
+    poetry run python scripts/audit_alignment.py
+    poetry run python scripts/audit_alignment.py --kind numbers --kind order
+    poetry run python scripts/audit_alignment.py --length-z 3 --strict
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.alignment import AlignmentAuditor
+from cv_builder.loader import Loader
+
+ISSUE_KINDS = ('numbers', 'dates', 'urls', 'latin', 'length', 'order')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit en/kr translation alignment of CV items")
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=ISSUE_KINDS,
+        help="Only report these issue kinds (repeatable, default: all)"
+    )
+    parser.add_argument(
+        "--length-z",
+        type=float,
+        default=3.5,
+        help="Robust z-score of the kr/en length ratio beyond which a pair is flagged (default: 3.5)"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Exit with status 1 if any issue is reported"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    items = Loader(base_dir=base_dir).load_items()
+    auditor = AlignmentAuditor(base_dir, length_z=args.length_z)
+    
+    start = time.perf_counter()
+    issues = [issue for issue in auditor.audit(items) if not args.kind or issue.kind in args.kind]
+    elapsed = time.perf_counter() - start
+    
+    current = None
+    for issue in issues:
+        if issue.item_id != current:
+            current = issue.item_id
+            print(f"\n{issue.item_id}:")
+        print(f"  ⚠ {issue.path} [{issue.kind}] {issue.message}")
+    
+    print(f"\n{'='*60}")
+    print(f"  Items: {len(items)} ({auditor.stats['scanned']} scanned, {auditor.stats['cached']} cached)")
+    print(f"  Issues: {len(issues)}")
+    print(f"  Time: {elapsed * 1000:.1f} ms")
+    print(f"{'='*60}")
+    
+    return 1 if args.strict and issues else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
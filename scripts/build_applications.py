@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Build one tailored CV per application in data/current_application/.
+
+Profiles are taken from `meta.profile`, a `<company>-<locale>` profile, or
+tailored to the posting from the best-covering profile in its language.
+
+Usage:
+    poetry run python scripts/build_applications.py
+    poetry run python scripts/build_applications.py --output-dir build/applications --workers 8
+    poetry run python scripts/build_applications.py --render
+    poetry run python scripts/build_applications.py --snapshot
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.artifacts import ArtifactCache
+from cv_builder.batch import BatchBuilder
+from cv_builder.loader import Loader
+from cv_builder.snapshots import SnapshotStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build one tailored CV per application")
+    parser.add_argument(
+        "--kind",
+        default="current_application",
+        help="Application directory under data/ (default: current_application)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Output directory (default: build/applications)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of parallel workers (default: 4)"
+    )
+    parser.add_argument(
+        "--render",
+        action="store_true",
+        help="Also render each CV with RenderCV through the artifact cache (identical CVs render once)"
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Record a build snapshot per application in data/snapshots/ (see scripts/snapshots.py)"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    output_dir = Path(args.output_dir) if args.output_dir else base_dir / "build" / "applications"
+    loader = Loader(base_dir=base_dir, persist_profiles=True)
+    artifacts = ArtifactCache(base_dir) if args.render else None
+    snapshots = SnapshotStore(base_dir) if args.snapshot else None
+    builder = BatchBuilder(loader, output_dir, workers=args.workers, artifacts=artifacts, snapshots=snapshots)
+    
+    applications = loader.load_applications(args.kind)
+    if not applications:
+        print(f"No applications found in data/{args.kind}")
+        return 1
+    print(f"Found {len(applications)} applications in data/{args.kind}")
+    
+    items, item_errors = builder.load_items()
+    if item_errors:
+        print("\n❌ Item validation errors:")
+        for error in item_errors:
+            print(f"  - {error}")
+        return 1
+    print(f"✓ Loaded and validated {len(items)} items")
+    
+    jobs = builder.plan(applications, items)
+    results = builder.build(jobs, items)
+    
+    print(f"\n{'='*60}")
+    print("Summary:")
+    for result in results:
+        if result.ok:
+            cached = "" if result.cache_hit is None else (", cached render" if result.cache_hit else ", rendered")
+            print(f"  ✓ {result.application_id} [{result.locale}] {result.profile_name} ({result.source}) "
+                  f"-> {result.output_path.name}, {result.total_chars} chars, {result.elapsed * 1000:.0f} ms{cached}")
+        else:
+            print(f"  ✗ {result.application_id} [{result.locale}] {result.profile_name}: {result.error}")
+    
+    failed = sum(1 for result in results if not result.ok)
+    print(f"\n  Built: {len(results) - failed}")
+    print(f"  Failed: {failed}")
+    print(f"  Output: {output_dir}")
+    if snapshots is not None:
+        stats = snapshots.stats()
+        print(f"  Snapshots: {stats['snapshots']} ({stats['objects']} objects, {stats['bytes'] / 1024:.0f} KB)")
+    if artifacts is not None:
+        hits = sum(1 for result in results if result.cache_hit)
+        stats = artifacts.store.stats()
+        print(f"  Rendered: {len(results) - failed - hits}, reused from cache: {hits}")
+        print(f"  Artifact cache: {stats['entries']} entries, {stats['bytes'] / 1e6:.1f} MB, "
+              f"{stats['evictions']} evictions")
+    print(f"{'='*60}")
+    
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Startup budget regression check based on `python -X importtime`.
+
+Runs `import cv_builder.cli` and the cached-index fast path of the CLI
+(`--validate-only`, `--stats`) in fresh interpreters and fails if
+    - the import time of cv_builder modules exceeds the budget (best of N runs), or
+    - a heavy module (PyYAML, NumPy, RenderCV, PyMuPDF) is imported on these paths.
+
+Usage:
+    poetry run python scripts/check_import_time.py
+    poetry run python scripts/check_import_time.py --budget-ms 40 --runs 5
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+FORBIDDEN_MODULES = ("yaml", "numpy", "rendercv", "fitz")
+
+
+def parse_importtime(stderr: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Parse `-X importtime` output.
+    
+    Returns cumulative microseconds of top-level cv_builder imports and the
+    names of all imported modules.
+    """
+    top_level = {}
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.append(name.strip())
+        # Top-level imports are not indented
+        if name.startswith(" cv_builder") and not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative)
+    return top_level, modules
+
+
+def measure(base_dir: Path, args: List[str], runs: int) -> Tuple[float, List[str]]:
+    """Best-of-N cv_builder import time (ms) and the modules imported by a command."""
+    best = None
+    modules: List[str] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=base_dir, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} failed:\n{result.stdout}{result.stderr}")
+        top_level, modules = parse_importtime(result.stderr)
+        total = sum(top_level.values()) / 1000
+        best = total if best is None else min(best, total)
+    return best, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check CLI import time against a budget")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50.0,
+        help="Maximum import time of cv_builder modules per command (default: 50)"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Runs per command; the fastest counts (default: 3)"
+    )
+    parser.add_argument(
+        "--profile",
+        default="full-en",
+        help="Profile used for the fast-path commands (default: full-en)"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    
+    # Warm the cached index through the regular path
+    warm = subprocess.run(
+        [sys.executable, "-m", "cv_builder.cli", "--profile", args.profile, "--validate-only", "--no-index"],
+        cwd=base_dir, capture_output=True, text=True,
+    )
+    if warm.returncode != 0:
+        print(f"✗ Could not build the cached index:\n{warm.stdout}{warm.stderr}")
+        return 1
+    
+    commands = {
+        "import cv_builder.cli": ["-c", "import cv_builder.cli"],
+        "--validate-only (cached)": ["-m", "cv_builder.cli", "--profile", args.profile, "--validate-only"],
+        "--stats (cached)": ["-m", "cv_builder.cli", "--profile", args.profile, "--stats"],
+    }
+    
+    failures = 0
+    print(f"Import time budget: {args.budget_ms:.0f} ms (best of {args.runs})\n")
+    for label, command in commands.items():
+        elapsed, modules = measure(base_dir, command, args.runs)
+        heavy = sorted({m.split(".")[0] for m in modules if m.split(".")[0] in FORBIDDEN_MODULES})
+        ok = elapsed <= args.budget_ms and not heavy
+        failures += not ok
+        print(f"  {'✓' if ok else '✗'} {label}: {elapsed:.1f} ms"
+              + (f", imports {', '.join(heavy)}" if heavy else ""))
+    
+    print(f"\n{'='*60}")
+    print(f"  Failed: {failures}")
+    print(f"{'='*60}")
+    
+    return 0 if failures == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Ingest company documents into the chunked corpus.
+
+Normalizes data/companies/<company>/*.md|*.txt (including text produced by
+scripts/pdf_to_txt.py), splits them into paragraph chunks and stores them in
+.cv_cache/corpus/. Only new or changed files are re-processed.
+
+Usage:
+    poetry run python scripts/ingest_companies.py
+    poetry run python scripts/ingest_companies.py --show 미래에셋자산운용
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.corpus import CompanyCorpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest company documents into the chunked corpus")
+    parser.add_argument(
+        "--show",
+        metavar="COMPANY",
+        help="Print the chunks of a company after ingestion"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    corpus = CompanyCorpus(base_dir)
+    
+    print(f"Ingesting documents from {corpus.companies_dir}...\n")
+    stats = corpus.ingest()
+    
+    with corpus.open() as reader:
+        for company, meta in sorted(reader.companies.items()):
+            print(f"  {company}: {meta['documents']} documents, {meta['chunks']} chunks, {meta['chars']} chars")
+        
+        if args.show:
+            if args.show not in reader.companies:
+                print(f"\nError: company '{args.show}' not found in corpus", file=sys.stderr)
+                return 1
+            for chunk in reader.iter_chunks(company=args.show):
+                print(f"\n--- [{chunk.id}] {chunk.source} ---")
+                print(chunk.text)
+    
+    print(f"\n{'='*60}")
+    print(f"Summary:")
+    print(f"  Added: {stats['added']} files")
+    print(f"  Updated: {stats['updated']} files")
+    print(f"  Unchanged: {stats['unchanged']} files")
+    print(f"  Removed: {stats['removed']} files")
+    print(f"  Total chunks: {stats['chunks']}")
+    print(f"{'='*60}")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Pack CV items into a single-file store, or unpack it back to the YAML layout.
+
+Builds can read the pack (`python -m cv_builder.cli --profile full-en --pack`)
+while items are still authored as modular_cv/cv_items/<type>/*.yaml.
+
+Usage:
+    poetry run python scripts/pack_items.py pack
+    poetry run python scripts/pack_items.py status
+    poetry run python scripts/pack_items.py unpack --items-dir /tmp/cv_items
+    poetry run python scripts/pack_items.py pack --pack build/items.pack
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.pack import DEFAULT_PACK_FILE, ItemPack, pack_items, stale_items, unpack_items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack/unpack CV items")
+    parser.add_argument(
+        "command",
+        choices=["pack", "unpack", "status"],
+        help="pack: YAML -> pack, unpack: pack -> YAML, status: list items that differ"
+    )
+    parser.add_argument(
+        "--pack",
+        help=f"Pack file (default: .cv_cache/{DEFAULT_PACK_FILE})"
+    )
+    parser.add_argument(
+        "--items-dir",
+        help="Item directory (default: modular_cv/cv_items)"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    pack_path = Path(args.pack) if args.pack else base_dir / ".cv_cache" / DEFAULT_PACK_FILE
+    items_dir = Path(args.items_dir) if args.items_dir else base_dir / "modular_cv" / "cv_items"
+    
+    try:
+        if args.command == "pack":
+            stats = pack_items(items_dir, pack_path)
+            print(f"✓ Packed {stats['items']} items into {pack_path} ({stats['bytes']:,} bytes)")
+        elif args.command == "unpack":
+            stats = unpack_items(pack_path, items_dir)
+            print(f"✓ Unpacked {pack_path} into {items_dir}")
+            print(f"  Written: {stats['written']} files")
+            print(f"  Unchanged: {stats['unchanged']} files")
+        else:
+            with ItemPack(pack_path) as pack:
+                count = len(pack)
+            stale = stale_items(pack_path, items_dir)
+            print(f"{pack_path}: {count} items")
+            for key in stale:
+                print(f"  ✗ Differs: {key}")
+            if not stale:
+                print("✓ Pack is up to date with the YAML files")
+            return 1 if stale else 0
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
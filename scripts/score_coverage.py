@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Score requirement keyword coverage of composed CVs against job postings.
+
+Every profile is composed through Composer and scored against every posting in
+data/current_application/ (or the given application files) in one run.
+
+Usage:
+    poetry run python scripts/score_coverage.py
+    poetry run python scripts/score_coverage.py --profile full-kr --application data/current_application/2025-10-25_LinqAlpha.json --detail
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.composer import Composer
+from cv_builder.coverage import CoverageScorer
+from cv_builder.loader import Loader
+
+
+def print_report(report):
+    """Print per-section and per-item coverage for one posting/profile pair."""
+    print(f"\n{'-'*60}")
+    print(f"{report.application.id} x {report.profile.name}: "
+          f"{len(report.covered)}/{len(report.terms)} terms ({report.score:.0%})")
+    
+    for section_name, section_terms in report.sections.items():
+        print(f"\n  {section_name}: {len(section_terms)} terms")
+        for (section, item_id), item_terms in report.items.items():
+            if section == section_name:
+                print(f"    {item_id}: {', '.join(item_terms) if item_terms else '-'}")
+    
+    print(f"\n  Missing ({len(report.missing)}): {', '.join(report.missing)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score requirement keyword coverage of composed CVs")
+    parser.add_argument(
+        "--application",
+        action="append",
+        help="Application JSON file (repeatable, default: all in data/current_application)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        help="Profile name (repeatable, default: all profiles)"
+    )
+    parser.add_argument(
+        "--detail",
+        action="store_true",
+        help="Show covered terms per section/item and missing terms"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    loader = Loader(base_dir=base_dir)
+    
+    if args.application:
+        applications = [loader.load_application(Path(path)) for path in args.application]
+    else:
+        applications = loader.load_applications()
+    profiles = [loader.load_profile(name) for name in (args.profile or loader.list_profiles())]
+    
+    if not applications or not profiles:
+        print("Nothing to score (no applications or profiles found)")
+        return 1
+    
+    items = loader.load_items()
+    scorer = CoverageScorer(loader, Composer())
+    scores, reports = scorer.score(applications, profiles, items, detail=args.detail)
+    
+    # Coverage matrix: applications x profiles
+    name_width = max(len(app.id) for app in applications)
+    print(f"{'':{name_width}}  " + "  ".join(f"{p.name:>16}" for p in profiles))
+    for application, row in zip(applications, scores):
+        print(f"{application.id:{name_width}}  " + "  ".join(f"{score:>16.0%}" for score in row))
+    
+    for report in reports:
+        print_report(report)
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
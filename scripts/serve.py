@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Run the resident compose server.
+
+Keeps items, base files and profiles in memory (reloaded when files change) and
+answers compose/validate/stats requests over localhost HTTP or a unix socket.
+
+Usage:
+    poetry run python scripts/serve.py
+    poetry run python scripts/serve.py --socket /tmp/cv_builder.sock
+    
+    curl -s 'http://127.0.0.1:8765/compose?profile=full-kr'
+    curl -s http://127.0.0.1:8765/compose -H 'Content-Type: application/json' -d '{"profile": "full-en", "output": "build/full-en.yaml"}'
+    curl -s --unix-socket /tmp/cv_builder.sock http://localhost/stats?profile=full-kr
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.loader import Loader
+from cv_builder.server import ComposeServer, Workspace
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the resident compose server")
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Host to bind (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to bind (default: 8765)"
+    )
+    parser.add_argument(
+        "--socket",
+        help="Serve on a unix socket instead of TCP"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for changed files (default: 1.0)"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    server = ComposeServer(Workspace(Loader(base_dir=base_dir)), poll_interval=args.poll_interval)
+    
+    try:
+        asyncio.run(server.serve(host=args.host, port=args.port, socket_path=args.socket))
+    except KeyboardInterrupt:
+        print("\nStopped")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
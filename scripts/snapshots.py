@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+List, inspect, re-materialize and diff build snapshots.
+
+Snapshots are recorded by `build_applications.py` (one per application) and by
+`cv_builder.cli --snapshot [APPLICATION_ID]`. A snapshot can be referred to by
+its ID, an ID prefix, or an application ID (its latest snapshot).
+
+Usage:
+    poetry run python scripts/snapshots.py list
+    poetry run python scripts/snapshots.py list --application 2025-10-24_메리츠증권
+    poetry run python scripts/snapshots.py show 2025-10-24_메리츠증권
+    poetry run python scripts/snapshots.py materialize 2025-10-24_메리츠증권 --output sent.yaml --sources sent/
+    poetry run python scripts/snapshots.py diff OLD_ID NEW_ID
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.snapshots import SnapshotStore
+
+
+def format_time(timestamp: float) -> str:
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect build snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    list_parser = subparsers.add_parser("list", help="List snapshots (oldest first)")
+    list_parser.add_argument("--application", help="Only snapshots of this application ID")
+    
+    show_parser = subparsers.add_parser("show", help="Show the manifest of a snapshot")
+    show_parser.add_argument("snapshot")
+    
+    materialize_parser = subparsers.add_parser("materialize", help="Write the CV (and inputs) of a snapshot")
+    materialize_parser.add_argument("snapshot")
+    materialize_parser.add_argument("--output", required=True, help="Output YAML path")
+    materialize_parser.add_argument("--sources", help="Also write profile, base and items to this directory")
+    
+    diff_parser = subparsers.add_parser("diff", help="Diff two snapshots")
+    diff_parser.add_argument("old")
+    diff_parser.add_argument("new")
+    diff_parser.add_argument("--stat", action="store_true", help="Only list what changed, without text diffs")
+    
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    store = SnapshotStore(base_dir)
+    
+    try:
+        if args.command == "list":
+            manifests = store.list_snapshots(args.application)
+            for manifest in manifests:
+                print(f"  {manifest['id']}  {format_time(manifest['created'])}  "
+                      f"{manifest['profile_name']} [{manifest['locale']}], {len(manifest['items'])} items")
+            stats = store.stats()
+            print(f"\n{'='*60}")
+            print(f"  Snapshots: {len(manifests)}" + (f" of {stats['snapshots']}" if args.application else ""))
+            print(f"  Objects: {stats['objects']} ({stats['bytes'] / 1024:.0f} KB)")
+            print(f"{'='*60}")
+        
+        elif args.command == "show":
+            manifest = store.get(args.snapshot)
+            print(f"Snapshot: {manifest['id']}")
+            print(f"  Created: {format_time(manifest['created'])}")
+            print(f"  Application: {manifest['application'] or '-'}")
+            print(f"  Profile: {manifest['profile_name']} [{manifest['locale']}]")
+            print(f"  Base: {manifest['base']['file']}")
+            print(f"  Output: {manifest['output_file']}")
+            for section, item_ids in manifest['sections'].items():
+                print(f"  {section}: {', '.join(item_ids)}")
+        
+        elif args.command == "materialize":
+            manifest = store.materialize(args.snapshot, Path(args.output), Path(args.sources) if args.sources else None)
+            print(f"✓ {manifest['id']} -> {args.output}" + (f" (sources in {args.sources})" if args.sources else ""))
+        
+        elif args.command == "diff":
+            diff = store.diff(args.old, args.new)
+            print(f"{diff['old']} -> {diff['new']}")
+            for key in ('added', 'removed', 'changed'):
+                if diff[key]:
+                    print(f"  {key.capitalize()}: {', '.join(diff[key])}")
+            for section, order in diff['sections'].items():
+                print(f"  Section '{section}': {order['old']} -> {order['new']}")
+            for key in ('profile', 'base', 'output'):
+                print(f"  {key.capitalize()}: {'changed' if diff[f'{key}_changed'] else 'unchanged'}")
+            if not args.stat:
+                for text in diff['diffs'].values():
+                    print()
+                    print(text, end="")
+    
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        return 1
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,38 +1,92 @@
 #!/usr/bin/env python
 """
-Update character counts for all CV items.
+Update character counts and length metrics for all CV items.
 
 Usage:
     poetry run python scripts/update_char_counts.py
+    poetry run python scripts/update_char_counts.py --check
 """
 
+import argparse
 import sys
 from pathlib import Path
 
+import yaml
+
 # Add parent directory to path to import cv_builder
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from cv_builder.utils import update_all_char_counts
+from cv_builder.utils import calculate_item_metrics, update_all_char_counts
+
+
+def check_metrics_against_codecs(base_dir: Path) -> int:
+    """
+    Cross-check the single-pass metrics of every item field against Python's
+    codecs (display width has no codec; tests/ pins it for real items).
+    
+    Returns the number of mismatching fields.
+    """
+    mismatches = 0
+    for item_path in sorted((base_dir / "modular_cv" / "cv_items").glob("*/*.yaml")):
+        with open(item_path, 'r', encoding='utf-8') as f:
+            data = (yaml.safe_load(f) or {}).get('data', {})
+        
+        metrics = calculate_item_metrics(data)
+        for locale, locale_metrics in metrics.items():
+            for name, value in locale_metrics['fields'].items():
+                texts = [data[name][locale]] if isinstance(value, dict) else [
+                    (entry or {}).get(locale) or '' for entry in data[name]
+                ]
+                for text, measured in zip(texts, value if isinstance(value, list) else [value]):
+                    expected = {
+                        'chars': len(text),
+                        'chars_no_spaces': len(''.join(text.split())),
+                        'utf8_bytes': len(text.encode('utf-8')),
+                    }
+                    try:
+                        expected['euckr_bytes'] = len(text.encode('euc-kr'))
+                    except UnicodeEncodeError:
+                        pass  # Not representable in EUC-KR; estimated as 2 bytes per non-ASCII char
+                    wrong = {mode: (measured[mode], n) for mode, n in expected.items() if measured[mode] != n}
+                    if wrong:
+                        print(f"✗ Metrics mismatch: {item_path.relative_to(base_dir)} {locale}.{name} {wrong}")
+                        mismatches += 1
+    return mismatches
 
 
 def main():
-    print("Updating character counts for all CV items...\n")
+    parser = argparse.ArgumentParser(description="Update character counts and length metrics for all CV items")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report stale/orphaned metadata and verify metrics against the codecs; exit 1 on problems"
+    )
+    args = parser.parse_args()
     
     base_dir = Path(__file__).parent.parent
-    stats = update_all_char_counts(base_dir)
+    
+    if args.check:
+        print("Checking character counts for all CV items...\n")
+    else:
+        print("Updating character counts for all CV items...\n")
+    
+    stats = update_all_char_counts(base_dir, check=args.check)
+    mismatches = check_metrics_against_codecs(base_dir) if args.check else 0
     
     print(f"\n{'='*60}")
     print(f"Summary:")
-    print(f"  Updated: {stats['updated']} files")
+    print(f"  {'Stale' if args.check else 'Updated'}: {stats['updated']} files")
     print(f"  Unchanged: {stats['unchanged']} files")
+    print(f"  Orphaned metadata: {stats['orphaned']} files")
     print(f"  Errors: {stats['errors']} files")
+    if args.check:
+        print(f"  Metric mismatches: {mismatches} fields")
     print(f"{'='*60}")
     
+    if args.check:
+        return 0 if stats['updated'] == stats['orphaned'] == stats['errors'] == mismatches == 0 else 1
     return 0 if stats['errors'] == 0 else 1
 
 
 if __name__ == '__main__':
     sys.exit(main())
-
-
-
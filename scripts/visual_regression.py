@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+Compare rendered CV pages with their approved baseline.
+
+Page PNGs (`<name>_<page>.png`) under rendercv_output/ and build/applications/
+are fingerprinted (dHash + grayscale thumbnail, cached by size and mtime in
+.cv_cache/visual/) and compared with the approved baseline
+(modular_cv/visual_baseline.npz, committed) in one vectorized pass.
+Changed pages are listed with their hash distance, changed-pixel share and the
+vertical region of the page that differs.
+
+Usage:
+    poetry run python scripts/visual_regression.py check
+    poetry run python scripts/visual_regression.py check --dir build/applications --threshold 0.005
+    poetry run python scripts/visual_regression.py approve
+    poetry run python scripts/visual_regression.py approve --page rendercv_output/Jaepil_Choi_CV_2.png
+    poetry run python scripts/visual_regression.py status
+    poetry run python scripts/visual_regression.py check --baseline path/to/baseline.npz
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path to import cv_builder
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from cv_builder.visual import VisualRegression
+
+DEFAULT_DIRS = ["rendercv_output", "build/applications"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Visual regression check of rendered CV pages")
+    parser.add_argument(
+        "command",
+        choices=["check", "approve", "status"],
+        help="check: compare pages with the baseline, approve: accept the current pages, status: show counts"
+    )
+    parser.add_argument(
+        "--dir",
+        action="append",
+        help=f"Directory with rendered pages (repeatable, default: {', '.join(DEFAULT_DIRS)})"
+    )
+    parser.add_argument(
+        "--page",
+        action="append",
+        help="Approve only this page key (repeatable, e.g. rendercv_output/Jaepil_Choi_CV_1.png)"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.002,
+        help="Share of changed thumbnail pixels that flags a page (default: 0.002)"
+    )
+    parser.add_argument(
+        "--hash-threshold",
+        type=int,
+        default=6,
+        help="dHash distance (0-64) that flags a page (default: 6)"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Approved baseline file (default: modular_cv/visual_baseline.npz)"
+    )
+    args = parser.parse_args()
+    
+    base_dir = Path(__file__).parent.parent
+    regression = VisualRegression(base_dir, threshold=args.threshold, hash_threshold=args.hash_threshold,
+                                  baseline_path=args.baseline)
+    if args.command == "check" and not regression.has_baseline():
+        print(f"❌ No approved baseline at {regression.baseline_path}")
+        print("   Run `scripts/visual_regression.py approve` and commit the baseline file")
+        return 1
+    directories = [base_dir / directory for directory in args.dir or DEFAULT_DIRS]
+    
+    start = time.perf_counter()
+    try:
+        current = regression.fingerprint(regression.find_pages(directories))
+    except ImportError:
+        print("Error: PyMuPDF is not installed. Please install it with: poetry add pymupdf")
+        return 1
+    baseline = regression.baseline()
+    elapsed = time.perf_counter() - start
+    
+    changed = 0
+    if args.command == "approve":
+        try:
+            approved = regression.approve(current, args.page)
+        except KeyError as e:
+            print(f"❌ Page not rendered: {e.args[0]}")
+            return 1
+        print(f"✓ Approved {approved} pages")
+        baseline = regression.baseline()
+    elif args.command == "check":
+        prefixes = [regression.key(directory).rstrip('/') + '/' for directory in directories]
+        diffs = regression.compare(current, baseline, prefixes)
+        for status in ('changed', 'new', 'missing'):
+            pages = [diff for diff in diffs if diff.status == status]
+            if not pages:
+                continue
+            print(f"\n{'-'*60}")
+            print(f"{status.capitalize()} pages ({len(pages)}):")
+            for diff in pages:
+                if status == 'changed':
+                    region = f", rows {diff.region[0]:.0%}-{diff.region[1]:.0%}" if diff.region else ""
+                    print(f"  ⚠ {diff.key}: hash distance {diff.hash_distance}, "
+                          f"{diff.changed_ratio:.2%} changed{region}")
+                else:
+                    print(f"  {diff.key}")
+        changed = sum(diff.status == 'changed' for diff in diffs)
+        if not diffs:
+            print("✓ All pages match the baseline")
+    
+    print(f"\n{'='*60}")
+    print(f"  Pages: {len(current)} ({regression.stats['fingerprinted']} fingerprinted, "
+          f"{regression.stats['cached']} cached)")
+    if regression.has_baseline():
+        print(f"  Baseline pages: {len(baseline)} ({regression.key(regression.baseline_path)})")
+    else:
+        print(f"  Baseline: ⚠ none approved yet ({regression.key(regression.baseline_path)})")
+    if args.command == "check":
+        print(f"  Changed: {changed}")
+    print(f"  Fingerprint time: {elapsed * 1000:.1f} ms")
+    print(f"{'='*60}")
+    
+    return 1 if changed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Length metrics of real Korean items and the stale-sidecar path of CVItem.from_dict."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from cv_builder.models import CVItem
+from cv_builder.utils import calculate_text_metrics, item_data_hash, load_item_metadata
+
+ITEMS_DIR = Path(__file__).parent.parent / "modular_cv" / "cv_items"
+
+# (item file, highlight index, chars, chars_no_spaces, utf8_bytes, euckr_bytes, display_width)
+KR_HIGHLIGHTS = [
+    ("work_experience/meritz-macro-trading.yaml", 0, 69, 55, 165, 117, 117),
+    ("work_experience/meritz-macro-trading.yaml", 1, 99, 80, 235, 167, 167),
+    ("projects/qtrsch.yaml", 0, 56, 43, 124, 90, 90),
+]
+
+
+def load_item(relative_path: str) -> dict:
+    item_path = ITEMS_DIR / relative_path
+    with open(item_path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    data['metadata'] = load_item_metadata(item_path)
+    return data
+
+
+@pytest.mark.parametrize("relative_path,index,chars,no_spaces,utf8,euckr,width", KR_HIGHLIGHTS)
+def test_kr_highlight_metrics(relative_path, index, chars, no_spaces, utf8, euckr, width):
+    item = load_item(relative_path)
+    expected = {
+        'chars': chars,
+        'chars_no_spaces': no_spaces,
+        'utf8_bytes': utf8,
+        'euckr_bytes': euckr,
+        'display_width': width,
+    }
+    
+    assert calculate_text_metrics(item['data']['highlights'][index]['kr']) == expected
+    # The committed sidecar holds the same numbers
+    assert item['metadata']['metrics']['kr']['fields']['highlights'][index] == expected
+
+
+def test_control_characters_have_no_width():
+    # C0 (tab, newline), DEL and C1 (NEL) controls take no columns; the other chars take one each
+    metrics = calculate_text_metrics("a\tb\n\x7fc\x85")
+    assert metrics['chars'] == 7
+    assert metrics['display_width'] == 3
+
+
+def test_fresh_sidecar_is_trusted():
+    item = CVItem.from_dict(load_item("projects/qtrsch.yaml"))
+    
+    assert not item.metadata.stale
+    assert item.metadata.data_hash == item_data_hash(item.data)
+
+
+def test_stale_sidecar_is_measured_again():
+    data = load_item("projects/qtrsch.yaml")
+    stored = data['metadata']['metrics']['kr']['total']['chars']
+    data['data']['highlights'][0]['kr'] += " 추가"
+    
+    item = CVItem.from_dict(data)
+    
+    assert item.metadata.stale
+    assert item.metadata.data_hash == item_data_hash(data['data'])
+    assert item.metadata.metrics['kr']['total']['chars'] == stored + 3
+    assert item.metadata.metrics['kr']['fields']['highlights'][0]['chars'] == 59